@@ -10,6 +10,10 @@ cd /actions-runner
 # START_DOCKER_SERVICE: if false, skip starting dockerd (use host socket)
 # DISABLE_AUTOMATIC_DEREGISTRATION: if true, skip unregister on shutdown
 # DEBUG_OUTPUT: if true, enable extra shell tracing
+# RUNNER_JITCONFIG: encoded just-in-time config; runner is pre-registered, skip config.sh
+# WARM_POOL: if true, boot dockerd and wait for the orchestrator to write .binding
+# SHARED_CACHE_ROOT: read-only shared tool cache volumes to overlay onto _tool and /ms-playwright
+# SHARED_CACHE_GENERATION: generation to overlay (default: the volume's `current`)
 
 DEFAULT_LABELS="docker-dind,linux,self-hosted,optimized"
 
@@ -31,6 +35,10 @@ fi
 # Normalize empty LABELS to empty string
 LABELS="$(echo "$LABELS" | sed 's/^,//;s/,$//')"
 
+# Keep the JIT config out of the environment inherited by workflow jobs
+JITCONFIG="${RUNNER_JITCONFIG:-}"
+unset RUNNER_JITCONFIG
+
 start_dind() {
   export DOCKER_HOST="unix:///var/run/docker.sock"
   export DOCKER_BUILDKIT="${DOCKER_BUILDKIT:-1}"
@@ -98,6 +106,61 @@ ensure_docker_socket_access() {
   fi
 }
 
+# Warm pool: block until the orchestrator delivers a registration (token or
+# JIT config) as KEY=value lines in .binding, then load it into the environment
+wait_for_binding() {
+  echo "▶ Warm standby: waiting for a runner binding…"
+  until [[ -f .binding ]] && grep -q '^BINDING_COMPLETE=1$' .binding; do
+    if [[ -n "${SHUTDOWN:-}" ]]; then
+      exit 0
+    fi
+    sleep 0.5
+  done
+  set -a
+  # shellcheck disable=SC1091
+  source .binding
+  set +a
+  rm -f .binding
+  JITCONFIG="${RUNNER_JITCONFIG:-}"
+  unset RUNNER_JITCONFIG BINDING_COMPLETE
+  echo "✔ Bound as ${RUNNER_NAME:-$(hostname)}"
+}
+
+# Overlay a generation of a shared, read-only cache volume onto a local
+# directory. Writes (new tool versions, extra browsers) are copied up into
+# this runner's work volume, so the shared copy is never modified.
+mount_shared_cache() {
+  local kind="$1" target="$2" root lower scratch
+  root="${SHARED_CACHE_ROOT}/${kind}"
+  if [[ -n "${SHARED_CACHE_GENERATION:-}" ]]; then
+    lower="${root}/${SHARED_CACHE_GENERATION}"
+  else
+    lower="$(readlink -f "${root}/current" 2>/dev/null || true)"
+  fi
+  if [[ -z "$lower" || ! -d "$lower" ]]; then
+    echo "▶ Shared ${kind} cache not populated yet; ${target} starts empty"
+    return 0
+  fi
+
+  scratch="/actions-runner/_work/.shared-cache/${kind}"
+  mkdir -p "${scratch}/upper" "${scratch}/work"
+  chown actions:actions "${scratch}/upper"
+  if mount -t overlay "shared-${kind}" \
+      -o "lowerdir=${lower},upperdir=${scratch}/upper,workdir=${scratch}/work" "$target"; then
+    echo "✔ Shared ${kind} cache ${lower##*/} mounted at ${target}"
+  else
+    echo "⚠ Could not overlay shared ${kind} cache; ${target} starts empty" >&2
+  fi
+}
+
+setup_shared_cache() {
+  if [[ -z "${SHARED_CACHE_ROOT:-}" ]] || mountpoint -q /actions-runner/_tool; then
+    return 0
+  fi
+  mount_shared_cache toolcache /actions-runner/_tool
+  mount_shared_cache playwright "${PLAYWRIGHT_BROWSERS_PATH:-/ms-playwright}"
+}
+
 stop_dind() {
   if [[ -n "${DIND_PID:-}" ]] && kill -0 "$DIND_PID" 2>/dev/null; then
     echo "⏹ stopping dockerd…"
@@ -108,7 +171,10 @@ stop_dind() {
 
 cleanup() {
   echo "⏏️  Unregistering runner…"
-  if [[ "${DISABLE_AUTOMATIC_DEREGISTRATION:-false}" == "true" ]]; then
+  if [[ -n "${JITCONFIG}" ]]; then
+    # JIT runners are removed by GitHub after their job (or by the orchestrator)
+    echo "Just-in-time runner; skipping unregister."
+  elif [[ "${DISABLE_AUTOMATIC_DEREGISTRATION:-false}" == "true" ]]; then
     echo "Automatic deregistration disabled; skipping unregister."
   else
     if [[ -f .runner && -n "${RUNNER_TOKEN:-}" ]]; then
@@ -121,7 +187,7 @@ cleanup() {
 }
 
 trap cleanup EXIT
-trap 'echo "⚙️  Signal received, shutting down…"; kill "$RUNNER_PID" 2>/dev/null || true' SIGINT SIGTERM
+trap 'echo "⚙️  Signal received, shutting down…"; SHUTDOWN=1; kill "${RUNNER_PID:-}" 2>/dev/null || true' SIGINT SIGTERM
 
 # Start Docker-in-Docker if requested (otherwise assume host socket will be provided)
 if [[ "${START_DOCKER_SERVICE:-true}" == "true" ]]; then
@@ -130,8 +196,14 @@ else
   echo "▶ Skipping dockerd startup (START_DOCKER_SERVICE=false)"
 fi
 
-# Register the runner if not already registered
-if [[ ! -f .runner ]]; then
+setup_shared_cache
+
+if [[ "${WARM_POOL:-false}" == "true" && ! -f .runner ]]; then
+  wait_for_binding
+fi
+
+# Register the runner if not already registered (JIT runners are pre-registered)
+if [[ -z "${JITCONFIG}" && ! -f .runner ]]; then
   export HOME=/home/actions
   # Pass labels set via orchestrator
   if [[ -n "${LABELS}" ]]; then
@@ -156,11 +228,16 @@ fi
 
 # Launch runner as 'actions' in background, then wait (no exec)
 export HOME=/home/actions
+if [[ -n "${JITCONFIG}" ]]; then
+  RUN_ARGS=(--jitconfig "${JITCONFIG}")
+else
+  RUN_ARGS=()
+fi
 gosu actions env \
   HOME=/home/actions \
   DOCKER_HOST="${DOCKER_HOST}" \
   DOCKER_BUILDKIT="${DOCKER_BUILDKIT:-1}" \
-  /actions-runner/run.sh &
+  /actions-runner/run.sh "${RUN_ARGS[@]}" &
 RUNNER_PID=$!
 
 wait "$RUNNER_PID"
\ No newline at end of file
@@ -0,0 +1,134 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Build one generation of the shared tool cache and Playwright browser
+# volumes, then point their `current` symlink at it. Run by the orchestrator
+# in a one-shot container with both volumes mounted read-write.
+#
+# SHARED_CACHE_ROOT: mount point of the volumes (toolcache/ and playwright/)
+# GENERATION: name of the generation directory to build
+# KEEP_GENERATIONS: space-separated generations still mounted by runners
+# PRUNE: if false, keep every old generation
+# NODE_VERSIONS: comma-separated Node.js versions for actions/setup-node (e.g. 20,22)
+# PYTHON_VERSIONS: comma-separated Python versions for actions/setup-python (e.g. 3.12)
+# PLAYWRIGHT_VERSIONS: comma-separated Playwright package versions (e.g. latest,1.48.2)
+# PLAYWRIGHT_BROWSERS: comma-separated browsers to download (e.g. chromium,firefox)
+
+ROOT="${SHARED_CACHE_ROOT:-/opt/shared-cache}"
+GENERATION="${GENERATION:?GENERATION is required}"
+TOOLS="${ROOT}/toolcache/${GENERATION}"
+BROWSERS="${ROOT}/playwright/${GENERATION}"
+# Ubuntu release whose actions/python-versions builds run on this image
+PYTHON_PLATFORM_VERSION="${PYTHON_PLATFORM_VERSION:-22.04}"
+
+case "$(uname -m)" in
+  aarch64|arm64) ARCH=arm64; NODE_ARCH=arm64 ;;
+  *)             ARCH=x64;   NODE_ARCH=x64 ;;
+esac
+
+# npm/npx scratch space stays out of the volumes
+export HOME="$(mktemp -d)"
+export npm_config_update_notifier=false
+
+split() { tr ',' '\n' <<<"${1:-}" | sed 's/^ *//;s/ *$//' | grep -v '^$' || true; }
+
+# Start from hardlinks of the current generation so unchanged tools cost
+# neither downloads nor disk space; a failed earlier build is discarded
+seed() {
+  local dir="$1" current
+  current="$(dirname "$dir")/current"
+  rm -rf "$dir"
+  mkdir -p "$dir"
+  if [[ -d "$current" ]]; then
+    cp -al "$current/." "$dir/"
+  fi
+}
+
+install_node() {
+  local spec="$1" version target
+  version="$(curl -fsSL https://nodejs.org/dist/index.json \
+    | jq -r --arg spec "$spec" \
+      '[.[] | .version | ltrimstr("v") | select(. == $spec or startswith($spec + "."))][0] // empty')"
+  if [[ -z "$version" ]]; then
+    echo "✖ no Node.js release matches ${spec}" >&2
+    return 1
+  fi
+  target="${TOOLS}/node/${version}/${ARCH}"
+  if [[ -f "${target}.complete" ]]; then
+    echo "✔ Node.js ${version} already cached"
+    return 0
+  fi
+  echo "▶ Caching Node.js ${version}"
+  rm -rf "$target"
+  mkdir -p "$target"
+  curl -fsSL "https://nodejs.org/dist/v${version}/node-v${version}-linux-${NODE_ARCH}.tar.gz" \
+    | tar -xz --strip-components=1 -C "$target"
+  touch "${target}.complete"
+}
+
+install_python() {
+  local spec="$1" release version url build
+  release="$(curl -fsSL https://raw.githubusercontent.com/actions/python-versions/main/versions-manifest.json \
+    | jq -c --arg spec "$spec" --arg arch "$ARCH" --arg os "$PYTHON_PLATFORM_VERSION" \
+      '[.[] | select(.stable and (.version == $spec or (.version | startswith($spec + "."))))
+            | {version, url: ([.files[] | select(.platform == "linux" and .arch == $arch
+                                                 and .platform_version == $os)][0].download_url)}
+            | select(.url != null)][0] // empty')"
+  if [[ -z "$release" ]]; then
+    echo "✖ no Python build matches ${spec} for ${PYTHON_PLATFORM_VERSION}/${ARCH}" >&2
+    return 1
+  fi
+  version="$(jq -r .version <<<"$release")"
+  url="$(jq -r .url <<<"$release")"
+  if [[ -f "${TOOLS}/Python/${version}/${ARCH}.complete" ]]; then
+    echo "✔ Python ${version} already cached"
+    return 0
+  fi
+  echo "▶ Caching Python ${version}"
+  build="$(mktemp -d)"
+  curl -fsSL "$url" | tar -xz -C "$build"
+  # The build's own installer lays out Python/<version>/<arch> and the .complete marker
+  (cd "$build" && RUNNER_TOOL_CACHE="$TOOLS" AGENT_TOOLSDIRECTORY="$TOOLS" bash ./setup.sh)
+  rm -rf "$build"
+}
+
+install_playwright() {
+  local version="$1" browsers
+  mapfile -t browsers < <(split "${PLAYWRIGHT_BROWSERS:-chromium}")
+  echo "▶ Caching Playwright ${version} browsers: ${browsers[*]}"
+  # Browser builds already present for another version are skipped by Playwright
+  PLAYWRIGHT_BROWSERS_PATH="$BROWSERS" npx --yes "playwright@${version}" install "${browsers[@]}"
+}
+
+# Atomically repoint `current` and drop generations no runner uses any more
+publish() {
+  local volume="$1" dir name
+  ln -sfn "$GENERATION" "${volume}/current.tmp"
+  mv -T "${volume}/current.tmp" "${volume}/current"
+  if [[ "${PRUNE:-true}" != "true" ]]; then
+    return 0
+  fi
+  for dir in "${volume}"/gen-*; do
+    [[ -d "$dir" ]] || continue
+    name="$(basename "$dir")"
+    if [[ "$name" == "$GENERATION" || " ${KEEP_GENERATIONS:-} " == *" ${name} "* ]]; then
+      continue
+    fi
+    echo "⏏️  Pruning ${volume}/${name}"
+    rm -rf "$dir"
+  done
+}
+
+seed "$TOOLS"
+seed "$BROWSERS"
+
+while read -r spec; do install_node "$spec"; done < <(split "${NODE_VERSIONS:-}")
+while read -r spec; do install_python "$spec"; done < <(split "${PYTHON_VERSIONS:-}")
+while read -r spec; do install_playwright "$spec"; done < <(split "${PLAYWRIGHT_VERSIONS:-}")
+
+# Runners overlay this read-only; their writes are copied up as 'actions'
+chown -R actions:actions "$TOOLS" "$BROWSERS"
+
+publish "${ROOT}/toolcache"
+publish "${ROOT}/playwright"
+echo "✔ Shared tool cache generation ${GENERATION} published"
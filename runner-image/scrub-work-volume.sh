@@ -0,0 +1,28 @@
+#!/usr/bin/env bash
+set -euo pipefail
+
+# Reset pooled runner work volumes for their next runner. Run by the
+# orchestrator in a one-shot container with each volume mounted at one of
+# the directories given as arguments.
+#
+# PRESERVE: comma-separated globs, relative to the volume root, that survive
+#   (e.g. */*/.git keeps checkouts' object stores so the next clone is a fetch)
+
+IFS=',' read -r -a patterns <<<"${PRESERVE:-}"
+keep=(-false)
+for pattern in "${patterns[@]}"; do
+  pattern="$(sed 's/^ *//;s/ *$//;s#^\./##' <<<"$pattern")"
+  [[ -n "$pattern" ]] && keep+=(-o -path "./${pattern}")
+done
+
+for root in "$@"; do
+  cd "$root"
+  # Everything outside preserved trees: files first, then directories that
+  # became empty (deepest first; preserved paths keep their parents)
+  find . -mindepth 1 \( "${keep[@]}" \) -prune -o ! -type d -print0 | xargs -0 -r rm -f
+  find . -mindepth 1 \( "${keep[@]}" \) -prune -o -type d -print0 \
+    | sort -rz | xargs -0 -r rmdir --ignore-fail-on-non-empty
+  # Locks left by a job killed mid-git-operation would block the next checkout
+  find . -path '*/.git/*' -name '*.lock' -type f -delete
+  echo "✔ Scrubbed ${root}"
+done
@@ -1,9 +1,15 @@
 """API routes for the orchestrator."""
 
 from fastapi import APIRouter, HTTPException, Request
-from typing import Dict, List, Any
+from typing import Dict, List, Any, Optional
+import hashlib
+import hmac
+import json
 import structlog
 
+from ..config import settings
+from ..rate_limit import Priority
+
 logger = structlog.get_logger()
 
 router = APIRouter()
@@ -31,7 +37,10 @@ async def get_runners(request: Request) -> Dict[str, List[Dict[str, Any]]]:
 
     # Get information about ignored runners for monitoring
     try:
-        all_github_runners = await orchestrator.github_client.get_all_runners()
+        # Diagnostic only: skipped first when the rate-limit budget is low
+        all_github_runners = await orchestrator.github_client.get_all_runners(
+            priority=Priority.LOW
+        )
         ignored_runners = [
             r for r in all_github_runners if r["name"].startswith("actions-runner-")
         ]
@@ -77,6 +86,25 @@ async def scale_down_runners(request: Request) -> Dict[str, str]:
         raise HTTPException(status_code=500, detail=f"Scale down failed: {str(e)}")
 
 
+@router.post("/shared-cache/refresh")
+async def refresh_shared_cache(request: Request) -> Dict[str, Any]:
+    """Rebuild the shared tool cache volumes now."""
+    orchestrator = request.app.state.orchestrator
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not available")
+    if not settings.shared_cache_enabled:
+        raise HTTPException(status_code=404, detail="Shared tool cache is disabled")
+
+    # One shared cache per Docker host
+    caches = await orchestrator.docker_client.refresh_shared_caches()
+    failed = {host: stats["last_error"] for host, stats in caches.items() if stats["last_error"]}
+    if failed:
+        raise HTTPException(
+            status_code=500, detail=f"Shared cache refresh failed: {failed}"
+        )
+    return caches
+
+
 @router.delete("/runners/{runner_id}")
 async def remove_runner(runner_id: str, request: Request) -> Dict[str, str]:
     """Remove a specific runner."""
@@ -124,6 +152,7 @@ async def get_metrics(request: Request) -> Dict[str, Any]:
         raise HTTPException(status_code=503, detail="Orchestrator not available")
 
     status = await orchestrator.get_status()
+    cache = status["queue"]["response_cache"]
 
     # Convert to Prometheus format
     metrics = {
@@ -134,9 +163,59 @@ async def get_metrics(request: Request) -> Dict[str, Any]:
             "ignored_existing"
         ],
         "github_actions_queue_length": status["queue"]["current_length"],
+        "github_api_response_cache_hits": cache["hits"] if cache else 0,
+        "github_api_response_cache_misses": cache["misses"] if cache else 0,
         "github_actions_orchestrator_running": (
             1 if status["orchestrator"]["running"] else 0
         ),
     }
 
     return metrics
+
+
+def verify_webhook_signature(
+    secret: str, body: bytes, signature: Optional[str]
+) -> bool:
+    """Check a GitHub ``X-Hub-Signature-256`` header against the raw body."""
+    if not signature or not signature.startswith("sha256="):
+        return False
+    expected = hmac.new(secret.encode(), body, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(f"sha256={expected}", signature)
+
+
+@router.post("/webhooks/github")
+async def github_webhook(request: Request) -> Dict[str, Any]:
+    """Receive GitHub ``workflow_job`` webhooks for push-based scaling."""
+    secret = settings.github_webhook_secret
+    if not secret:
+        raise HTTPException(status_code=404, detail="Webhooks are not enabled")
+
+    body = await request.body()
+    if not verify_webhook_signature(
+        secret, body, request.headers.get("X-Hub-Signature-256")
+    ):
+        logger.warning(
+            "Rejected webhook with invalid signature",
+            delivery=request.headers.get("X-GitHub-Delivery"),
+        )
+        raise HTTPException(status_code=401, detail="Invalid signature")
+
+    event = request.headers.get("X-GitHub-Event", "")
+    if event == "ping":
+        return {"message": "pong"}
+    if event != "workflow_job":
+        return {"message": f"Ignored event: {event}"}
+
+    orchestrator = request.app.state.orchestrator
+    if not orchestrator:
+        raise HTTPException(status_code=503, detail="Orchestrator not available")
+
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid JSON payload")
+
+    action = payload.get("action", "")
+    job = payload.get("workflow_job") or {}
+    changed = orchestrator.record_workflow_job(action, job)
+    return {"message": "Accepted", "action": action, "changed": changed}
@@ -15,6 +15,71 @@ class Settings(BaseSettings):
     )
     github_repo: Optional[str] = Field(None, description="GitHub repository (optional)")
 
+    # GitHub HTTP Client Configuration
+    github_http2: bool = Field(
+        True, description="Multiplex GitHub API requests over HTTP/2 when available"
+    )
+    github_max_connections: int = Field(
+        20, description="Maximum concurrent connections to the GitHub API"
+    )
+    github_max_keepalive_connections: int = Field(
+        10, description="Maximum idle keep-alive connections kept in the pool"
+    )
+    github_keepalive_expiry: float = Field(
+        60.0, description="Seconds an idle pooled connection is kept open"
+    )
+    github_request_timeout: float = Field(
+        10.0, description="Timeout in seconds for GitHub API requests"
+    )
+    github_conditional_requests: bool = Field(
+        True,
+        description="Revalidate cached GitHub GET responses with ETag/If-None-Match",
+    )
+    github_response_cache_size: int = Field(
+        256, description="Maximum number of cached GitHub GET responses"
+    )
+    github_jobs_concurrency: int = Field(
+        8,
+        description="Maximum concurrent run/job listings when computing demand",
+    )
+    github_org_repo_cache_ttl: int = Field(
+        600, description="Seconds the organization repository list is cached"
+    )
+    github_demand_request_budget: int = Field(
+        200,
+        description="Maximum GitHub requests per demand cycle (0 for unlimited)",
+    )
+    github_rate_limit_reserve: int = Field(
+        100,
+        description="Rate-limit requests held back for scaling-critical calls",
+    )
+    github_rate_limit_low_watermark: float = Field(
+        0.25,
+        description="Budget fraction below which diagnostics are skipped and calls are paced",
+    )
+    github_rate_limit_max_poll_multiplier: float = Field(
+        8.0, description="Maximum factor the poll interval is stretched by when budget is low"
+    )
+
+    registration_token_refresh_margin: int = Field(
+        300,
+        description="Seconds before expiry a cached registration token is replaced",
+    )
+
+    # GitHub Webhook Configuration
+    github_webhook_secret: Optional[str] = Field(
+        None,
+        description="Secret for workflow_job webhooks; enables push-based scaling",
+    )
+    webhook_fallback_poll_interval: int = Field(
+        300,
+        description="Seconds between queue polls while webhook demand is available",
+    )
+    webhook_job_ttl: int = Field(
+        3600,
+        description="Seconds before a webhook job with no completion event is dropped",
+    )
+
     # Runner Configuration
     runner_image: str = Field(
         "shghar:local", description="Docker image for runners"
@@ -42,6 +107,13 @@ class Settings(BaseSettings):
     runner_debug_output: bool = Field(
         False, description="Enable additional debug output in runner (set -x in entrypoint)"
     )
+    runner_jit_config: bool = Field(
+        False,
+        description="Register runners with just-in-time configs instead of config.sh",
+    )
+    runner_group_id: int = Field(
+        1, description="Runner group for just-in-time runners (1 = Default)"
+    )
 
     # Node.js Configuration
     node_version: str = Field(
@@ -66,21 +138,149 @@ class Settings(BaseSettings):
     scale_down_threshold: int = Field(
         1, description="Queue length to trigger scale down"
     )
+    scaling_policy: str = Field(
+        "threshold",
+        description="Scaling policy (threshold, target_utilization, queue_proportional, predictive)",
+    )
+    scale_up_utilization: float = Field(
+        80.0,
+        description="Busy-runner percentage that triggers a scale up while jobs are queued",
+    )
+    scale_down_utilization: float = Field(
+        20.0, description="Busy-runner percentage below which idle runners are released"
+    )
+    scale_target_utilization: float = Field(
+        0.7, description="Busy fraction the target_utilization policy sizes the fleet for"
+    )
     idle_timeout: int = Field(
         300, description="Seconds before idle runners are terminated"
     )
+    scale_down_order: str = Field(
+        "newest",
+        description="Which idle runners are removed first (newest, oldest, longest_idle)",
+    )
+    scale_up_max_batch: int = Field(
+        10, description="Maximum runners created by a single scale-up action"
+    )
+    scale_up_cooldown: int = Field(
+        60, description="Minimum seconds between two scale-up actions"
+    )
+    runner_create_concurrency: int = Field(
+        5, description="Maximum runner containers being created at once"
+    )
+    runner_create_rate: float = Field(
+        2.0,
+        description="Sustained runner creations per second (0 disables rate limiting)",
+    )
+    runner_create_burst: int = Field(
+        5, description="Runner creations allowed back-to-back before rate limiting"
+    )
+    predictive_scaling_enabled: bool = Field(
+        False,
+        description="Pre-provision runners from a forecast of the weekly demand pattern",
+    )
+    predictive_horizon: int = Field(
+        900, description="Seconds ahead the demand forecast provisions for"
+    )
+    predictive_state_path: Optional[str] = Field(
+        None, description="JSON file the learned demand forecast is persisted to"
+    )
+    warm_pool_size: int = Field(
+        0,
+        description="Booted standby containers kept ready for instant binding (0 disables)",
+    )
 
     # Monitoring Configuration
     poll_interval: int = Field(30, description="Seconds between GitHub API polls")
+    read_freshness_window: float = Field(
+        2.0,
+        description="Seconds a GitHub/Docker runner listing is shared between concurrent callers",
+    )
     metrics_port: int = Field(9090, description="Port for Prometheus metrics")
 
     # Docker Configuration
     docker_socket: str = Field(
         "unix:///var/run/docker.sock", description="Docker daemon socket"
     )
+    docker_hosts: str = Field(
+        "",
+        description="Comma-separated Docker endpoints as url[=capacity] (empty = docker_socket only)",
+    )
+    docker_placement: str = Field(
+        "spread",
+        description="Host choice for new runners: spread (least loaded) or binpack (fullest first)",
+    )
     runner_network: str = Field(
         "runner-network", description="Docker network for runners"
     )
+    docker_max_workers: int = Field(
+        8, description="Threads available for concurrent Docker API calls"
+    )
+    docker_operation_timeout: float = Field(
+        60.0, description="Seconds before a single Docker API call is abandoned"
+    )
+    docker_remove_concurrency: int = Field(
+        8, description="Runner containers stopped and removed in parallel"
+    )
+    docker_remove_timeout: float = Field(
+        120.0, description="Seconds before removing a single container is abandoned"
+    )
+    dind_cache_enabled: bool = Field(
+        False,
+        description=(
+            "Reuse named /var/lib/docker slot volumes so DinD image pulls are cached; "
+            "each slot keeps up to dind_cache_max_size_gb on disk"
+        ),
+    )
+    dind_cache_slots: int = Field(
+        0, description="DinD cache slot volumes per Docker host (0 = host capacity)"
+    )
+    dind_cache_max_size_gb: float = Field(
+        30.0,
+        description="Slot volumes larger than this are wiped when next leased (0 disables)",
+    )
+    work_volume_pool_size: int = Field(
+        0,
+        description="Idle work volumes kept for reuse instead of deleted (0 disables pooling)",
+    )
+    work_volume_pool_preserve: str = Field(
+        "*/*/.git,_actions,_PipelineMapping",
+        description="Comma-separated globs under _work kept when a pooled volume is scrubbed",
+    )
+    work_volume_scrub_timeout: float = Field(
+        600.0, description="Seconds before a work volume scrub is abandoned"
+    )
+    shared_cache_enabled: bool = Field(
+        False,
+        description="Overlay shared, pre-populated tool cache and Playwright volumes into runners",
+    )
+    shared_cache_refresh_interval: int = Field(
+        86400, description="Seconds between shared tool cache refreshes"
+    )
+    shared_cache_refresh_timeout: float = Field(
+        1800.0, description="Seconds before a shared tool cache refresh is abandoned"
+    )
+    shared_cache_node_versions: str = Field(
+        "20,22", description="Comma-separated Node.js versions kept in the shared tool cache"
+    )
+    shared_cache_python_versions: str = Field(
+        "3.12", description="Comma-separated Python versions kept in the shared tool cache"
+    )
+    shared_cache_playwright_versions: str = Field(
+        "latest",
+        description="Comma-separated Playwright versions whose browsers are shared",
+    )
+    shared_cache_playwright_browsers: str = Field(
+        "chromium", description="Comma-separated Playwright browsers to download"
+    )
+    docker_events_enabled: bool = Field(
+        True,
+        description="Track runner containers from the Docker events stream instead of polling",
+    )
+    docker_index_resync_interval: float = Field(
+        300.0,
+        description="Seconds between full container resyncs of the events-backed index",
+    )
     # Container naming prefix the orchestrator uses for created runner containers
     runner_name_prefix: str = Field(
         "github-runner", description="Prefix used for runner container names"
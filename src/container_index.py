@@ -0,0 +1,153 @@
+"""In-memory index of runner containers maintained from Docker events."""
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Container event action -> resulting container state
+EVENT_STATUS = {
+    "create": "created",
+    "start": "running",
+    "restart": "running",
+    "unpause": "running",
+    "pause": "paused",
+    "die": "exited",
+    "stop": "exited",
+}
+# Restart policies under which Docker brings a container back after "die"
+RESTARTING_POLICIES = ("always", "unless-stopped")
+
+SummaryParser = Callable[[Dict[str, Any]], Optional[Dict[str, Any]]]
+
+
+class ContainerIndex:
+    """Runner containers keyed by container id.
+
+    The index is written by the Docker events thread and by periodic full
+    resyncs, and read from the event loop, so all access is guarded by a
+    lock. Reads are served only while the index is ``ready``: after the
+    events subscription is (re)established a full resync must land before
+    the index is trusted again.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._by_id: Dict[str, Dict[str, Any]] = {}
+        # Monotonic time of the last event per container id, used so a resync
+        # that started before an event does not overwrite the newer state
+        self._touched: Dict[str, float] = {}
+        self._destroyed: Dict[str, float] = {}
+        self._generation = 0
+        self._ready = False
+        self.last_resync = 0.0
+
+    def generation(self) -> int:
+        """Current subscription generation; pass it back to :meth:`replace_all`."""
+        with self._lock:
+            return self._generation
+
+    def mark_stale(self) -> None:
+        """Distrust the index until the next full resync (events gap)."""
+        with self._lock:
+            self._generation += 1
+            self._ready = False
+
+    def needs_resync(self, interval: float) -> bool:
+        """True if the index is not ready or the last resync is too old."""
+        return not self._ready or time.monotonic() - self.last_resync >= interval
+
+    def replace_all(
+        self, runners: List[Dict[str, Any]], started_at: float, generation: int
+    ) -> None:
+        """Replace the index with a full listing taken at ``started_at``.
+
+        Containers touched by events after the listing started keep their
+        event-derived state.
+        """
+        with self._lock:
+            fresh = {r["id"]: r for r in runners}
+            for container_id, touched_at in self._touched.items():
+                if touched_at < started_at:
+                    continue
+                if container_id in self._destroyed:
+                    fresh.pop(container_id, None)
+                elif container_id in self._by_id:
+                    fresh[container_id] = self._by_id[container_id]
+
+            self._by_id = fresh
+            self._touched = {k: t for k, t in self._touched.items() if t >= started_at}
+            self._destroyed = {
+                k: t for k, t in self._destroyed.items() if t >= started_at
+            }
+            self.last_resync = time.monotonic()
+            if generation == self._generation:
+                self._ready = True
+
+    def apply_event(
+        self, event: Dict[str, Any], parse_summary: SummaryParser
+    ) -> Optional[Tuple[str, Dict[str, Any]]]:
+        """Apply one Docker container event.
+
+        Args:
+            event: Decoded event from the Docker ``/events`` stream
+            parse_summary: Builds runner info from a list-style summary
+
+        Returns:
+            ``(status, runner_info)`` when a runner's state changed, else None
+        """
+        action = (event.get("Action") or event.get("status") or "").split(":")[0]
+        actor = event.get("Actor") or {}
+        container_id = actor.get("ID") or event.get("id")
+        if not container_id:
+            return None
+
+        now = time.monotonic()
+        if action == "destroy":
+            with self._lock:
+                runner = self._by_id.pop(container_id, None)
+                self._touched[container_id] = now
+                self._destroyed[container_id] = now
+            return ("removed", runner) if runner else None
+
+        status = EVENT_STATUS.get(action)
+        if status is None:
+            return None
+
+        with self._lock:
+            known = self._by_id.get(container_id)
+
+        if known is None:
+            # Parse outside the lock; it may need an image lookup
+            attributes = dict(actor.get("Attributes") or {})
+            name = attributes.get("name", "")
+            known = parse_summary(
+                {
+                    "Id": container_id,
+                    "Names": [f"/{name}"] if name else [],
+                    "Image": attributes.get("image"),
+                    # Event attributes carry the container labels
+                    "Labels": attributes,
+                    "State": status,
+                }
+            )
+            if known is None:
+                return None
+
+        with self._lock:
+            runner = self._by_id.get(container_id, known)
+            if action == "die" and runner.get("restart_policy") in RESTARTING_POLICIES:
+                # Docker restarts it; "stop" (explicit) still marks it exited
+                status = "restarting"
+            self._touched[container_id] = now
+            self._destroyed.pop(container_id, None)
+            if runner["status"] == status and container_id in self._by_id:
+                return None
+
+            runner = {**runner, "status": status}
+            self._by_id[container_id] = runner
+            return status, runner
+
+    def list(self) -> List[Dict[str, Any]]:
+        """Return all indexed runner containers."""
+        with self._lock:
+            return list(self._by_id.values())
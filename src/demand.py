@@ -0,0 +1,176 @@
+"""Push-based job demand tracking from GitHub ``workflow_job`` webhooks."""
+
+import platform
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
+
+import structlog
+
+logger = structlog.get_logger()
+
+LabelFilter = Callable[[List[str]], bool]
+
+# Labels runner-image/entrypoint.sh appends unless NO_DEFAULT_LABELS is set
+ENTRYPOINT_DEFAULT_LABELS = ("docker-dind", "linux", "self-hosted", "optimized")
+
+# platform.machine() -> architecture label added by the runner's config.sh
+ARCH_LABELS = {
+    "x86_64": "x64",
+    "amd64": "x64",
+    "aarch64": "arm64",
+    "arm64": "arm64",
+    "armv7l": "arm",
+}
+
+
+def entrypoint_labels(labels: str, no_default_labels: bool = False) -> List[str]:
+    """Return the labels entrypoint.sh registers a runner with.
+
+    Args:
+        labels: Comma-separated ``ORCHESTRATOR_RUNNER_LABELS``
+        no_default_labels: Mirrors ``ORCHESTRATOR_RUNNER_NO_DEFAULT_LABELS``
+
+    Returns:
+        Configured labels followed by the entrypoint defaults, de-duplicated
+    """
+    result: List[str] = []
+    candidates = labels.split(",")
+    if not no_default_labels:
+        candidates.extend(ENTRYPOINT_DEFAULT_LABELS)
+    for label in (c.strip() for c in candidates):
+        if label and label.lower() not in (r.lower() for r in result):
+            result.append(label)
+    return result
+
+
+def runner_label_set(labels: str, no_default_labels: bool = False) -> FrozenSet[str]:
+    """Return the (lower-cased) labels our runners register with.
+
+    Args:
+        labels: Comma-separated ``ORCHESTRATOR_RUNNER_LABELS``
+        no_default_labels: Mirrors ``ORCHESTRATOR_RUNNER_NO_DEFAULT_LABELS``
+
+    Returns:
+        Configured labels plus entrypoint defaults and the system labels
+        (``self-hosted``, OS, architecture) that ``config.sh`` always adds
+    """
+    result = {label.lower() for label in entrypoint_labels(labels, no_default_labels)}
+    result.update(("self-hosted", "linux"))
+    arch = ARCH_LABELS.get(platform.machine().lower())
+    if arch:
+        result.add(arch)
+    return frozenset(result)
+
+
+def labels_satisfiable(job_labels: Iterable[str], runner_labels: FrozenSet[str]) -> bool:
+    """True if a runner carrying ``runner_labels`` can pick up a job.
+
+    GitHub assigns a job to a runner only if the runner has every label in
+    the job's ``runs-on``; label matching is case-insensitive.
+    """
+    return all(label.lower() in runner_labels for label in job_labels)
+
+
+@dataclass
+class TrackedJob:
+    """Last known state of a workflow job."""
+
+    status: str
+    labels: Tuple[str, ...]
+    updated_at: float
+
+
+class DemandTracker:
+    """Tracks queued and running workflow jobs from webhook deliveries.
+
+    Jobs are keyed by job id. ``queued`` and ``in_progress`` deliveries
+    upsert a job, ``completed`` drops it. Jobs that never complete (missed
+    delivery) expire after ``stale_after`` seconds.
+    """
+
+    def __init__(
+        self, stale_after: float = 3600.0, accepts: Optional[LabelFilter] = None
+    ):
+        self.stale_after = stale_after
+        self.accepts = accepts
+        self._jobs: Dict[int, TrackedJob] = {}
+        self.last_event_at: Optional[float] = None
+        self.events_received = 0
+
+    def record(self, action: str, job: Dict[str, Any]) -> bool:
+        """Apply one ``workflow_job`` delivery.
+
+        Args:
+            action: Webhook action (``queued``, ``in_progress``, ``completed``, ...)
+            job: The ``workflow_job`` object from the payload
+
+        Returns:
+            True if the set of tracked jobs changed
+        """
+        now = time.monotonic()
+        self.last_event_at = now
+        self.events_received += 1
+
+        job_id = job.get("id")
+        if job_id is None:
+            return False
+
+        labels = tuple(job.get("labels") or [])
+        if self.accepts is not None and not self.accepts(list(labels)):
+            logger.debug(
+                "Ignoring workflow job our runners cannot serve",
+                job_id=job_id,
+                labels=list(labels),
+            )
+            return False
+
+        if action == "completed":
+            return self._jobs.pop(job_id, None) is not None
+
+        if action not in ("queued", "in_progress"):
+            return False
+
+        previous = self._jobs.get(job_id)
+        # Deliveries can arrive out of order; never move a job back to queued
+        if previous is not None and previous.status == "in_progress" and action == "queued":
+            return False
+        self._jobs[job_id] = TrackedJob(status=action, labels=labels, updated_at=now)
+        return previous is None or previous.status != action
+
+    def prune(self) -> None:
+        """Drop jobs whose completion we never heard about."""
+        cutoff = time.monotonic() - self.stale_after
+        stale = [job_id for job_id, job in self._jobs.items() if job.updated_at < cutoff]
+        for job_id in stale:
+            del self._jobs[job_id]
+        if stale:
+            logger.debug("Expired stale webhook jobs", count=len(stale))
+
+    def count(self, status: str) -> int:
+        """Number of tracked jobs in ``status``."""
+        self.prune()
+        return len([job for job in self._jobs.values() if job.status == status])
+
+    @property
+    def queued(self) -> int:
+        """Jobs waiting for a runner."""
+        return self.count("queued")
+
+    @property
+    def in_progress(self) -> int:
+        """Jobs currently running."""
+        return self.count("in_progress")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters for status reporting."""
+        return {
+            "queued": self.queued,
+            "in_progress": self.in_progress,
+            "events_received": self.events_received,
+            "seconds_since_last_event": (
+                round(time.monotonic() - self.last_event_at, 1)
+                if self.last_event_at is not None
+                else None
+            ),
+        }
@@ -0,0 +1,178 @@
+"""Reusable named volumes for the Docker-in-Docker data root of runners."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+from docker.errors import APIError, NotFound as DockerNotFound
+import structlog
+
+from .config import settings
+
+logger = structlog.get_logger()
+
+# Container and volume label carrying the slot index
+SLOT_LABEL = "dind-slot"
+# Mount point of the slot volume inside the runner (the image's VOLUME)
+DIND_DATA_ROOT = "/var/lib/docker"
+# Seconds between `docker system df` scans (they walk every volume)
+SLOT_SIZE_REFRESH_SECONDS = 600
+DF_TIMEOUT = 120.0
+
+
+class DindSlotCache:
+    """Leases ``{prefix}-dind-slot-{i}`` volumes to runner containers.
+
+    Each runner mounts one slot volume at ``/var/lib/docker``, so images
+    pulled by an earlier job on the same slot are still there. A slot is
+    leased to at most one container at a time: two dockerd instances must
+    never share a data root. Leases are derived from the ``dind-slot`` label
+    of existing containers (any state, since a stopped container may be
+    restarted) plus slots reserved by creations still in flight.
+
+    Slots larger than ``dind_cache_max_size_gb`` are wiped when next leased,
+    and unused slots beyond the configured count are deleted.
+    """
+
+    def __init__(self, client, run: Callable[..., Awaitable[Any]], capacity: int):
+        self.client = client
+        # Runs a blocking docker-py call off the event loop (DockerClient._run)
+        self._run = run
+        # Runners the Docker host can hold
+        self.capacity = capacity
+        self.prefix = settings.runner_name_prefix
+        self._lock = asyncio.Lock()
+        # Slots handed out whose container does not exist yet
+        self._reserved: Set[int] = set()
+        self._sizes: Dict[str, int] = {}
+        self._sizes_at = 0.0
+        self.evicted = 0
+
+    @property
+    def slots(self) -> int:
+        """Number of slot volumes (defaults to one per runner the host can hold)."""
+        return settings.dind_cache_slots or self.capacity
+
+    def volume_name(self, slot: int) -> str:
+        return f"{self.prefix}-dind-slot-{slot}"
+
+    async def lease(self) -> Optional[int]:
+        """Reserve a free slot and make sure its volume exists.
+
+        Returns:
+            The slot index, or None if every slot is in use (the runner then
+            falls back to an anonymous, uncached volume)
+        """
+        async with self._lock:
+            in_use = await self._slots_in_use()
+            free = [s for s in range(self.slots) if s not in in_use]
+            if not free:
+                logger.warning("No free DinD cache slot", slots=self.slots)
+                return None
+            slot = free[0]
+            self._reserved.add(slot)
+
+        try:
+            await self._prepare(slot)
+        except Exception:
+            self.release(slot)
+            raise
+        return slot
+
+    def release(self, slot: Optional[int]) -> None:
+        """Drop an in-flight reservation once its container exists (or failed)."""
+        if slot is not None:
+            self._reserved.discard(slot)
+
+    async def _slots_in_use(self) -> Set[int]:
+        """Slots labelled on existing containers plus in-flight reservations."""
+        summaries = await self._run(
+            self.client.api.containers,
+            all=True,
+            filters={"label": [SLOT_LABEL, "managed-by=runner-orchestrator"]},
+        )
+        in_use = set(self._reserved)
+        for summary in summaries:
+            value = (summary.get("Labels") or {}).get(SLOT_LABEL, "")
+            if value.isdigit():
+                in_use.add(int(value))
+        return in_use
+
+    async def _prepare(self, slot: int) -> None:
+        """Create the slot volume, wiping it first if it outgrew the size cap."""
+        run, api = self._run, self.client.api
+        name = self.volume_name(slot)
+
+        await self._refresh_sizes()
+        limit = settings.dind_cache_max_size_gb * 1024**3
+        size = self._sizes.get(name, 0)
+        if limit > 0 and size > limit:
+            try:
+                await run(api.remove_volume, name)
+                self._sizes.pop(name, None)
+                self.evicted += 1
+                logger.info(
+                    "Evicted oversized DinD cache slot",
+                    volume=name,
+                    size_gb=round(size / 1024**3, 1),
+                )
+            except DockerNotFound:
+                pass
+            except APIError as e:
+                # Still referenced somewhere; keep using it rather than fail
+                logger.warning("Could not evict DinD cache slot", volume=name, error=str(e))
+
+        # Idempotent: returns the existing volume if it is already there
+        await run(
+            api.create_volume,
+            name=name,
+            labels={
+                "managed-by": "runner-orchestrator",
+                SLOT_LABEL: str(slot),
+            },
+        )
+
+    async def _refresh_sizes(self) -> None:
+        """Re-read slot volume sizes and prune unused out-of-range slots."""
+        if time.monotonic() - self._sizes_at < SLOT_SIZE_REFRESH_SECONDS:
+            return
+        self._sizes_at = time.monotonic()
+        try:
+            usage = await self._run(self.client.api.df, op_timeout=DF_TIMEOUT)
+        except (APIError, asyncio.TimeoutError) as e:
+            logger.warning("Could not read DinD cache sizes", error=str(e))
+            return
+
+        sizes: Dict[str, int] = {}
+        for volume in usage.get("Volumes") or []:
+            labels = volume.get("Labels") or {}
+            if SLOT_LABEL not in labels:
+                continue
+            name = volume["Name"]
+            data = volume.get("UsageData") or {}
+            sizes[name] = max(0, data.get("Size", 0))
+            slot = labels[SLOT_LABEL]
+            if (
+                slot.isdigit()
+                and int(slot) >= self.slots
+                and data.get("RefCount", 1) == 0
+            ):
+                await self._remove_volume(name)
+                sizes.pop(name, None)
+        self._sizes = sizes
+
+    async def _remove_volume(self, name: str) -> None:
+        try:
+            await self._run(self.client.api.remove_volume, name)
+            logger.info("Pruned unused DinD cache slot", volume=name)
+        except (DockerNotFound, APIError, asyncio.TimeoutError) as e:
+            logger.warning("Failed to prune DinD cache slot", volume=name, error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return slot usage for status reporting."""
+        return {
+            "slots": self.slots,
+            "reserved": len(self._reserved),
+            "size_gb": round(sum(self._sizes.values()) / 1024**3, 2),
+            "evicted": self.evicted,
+        }
@@ -1,6 +1,15 @@
 """Docker client for managing runner containers."""
 
-from typing import List, Dict, Any
+import asyncio
+import functools
+import io
+import os
+import shlex
+import tarfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set
 from datetime import datetime, timezone
 import uuid
 
@@ -9,21 +18,203 @@ from docker.errors import NotFound as DockerNotFound, APIError
 import structlog
 
 from .config import settings
+from .container_index import ContainerIndex
+from .dind_cache import DIND_DATA_ROOT, SLOT_LABEL, DindSlotCache
+from .shared_cache import GENERATION_LABEL, SharedToolCache
+from .utils.singleflight import SingleFlight
+from .work_volume_pool import WORK_DIR, WorkVolumePool
 
 logger = structlog.get_logger()
 
+# Seconds docker-py waits for a container to stop before killing it
+CONTAINER_STOP_TIMEOUT = 30
+
+# Docker events filter matching every container the orchestrator manages
+MANAGED_EVENTS_FILTER = {"type": "container", "label": "managed-by=runner-orchestrator"}
+
+ContainerEventCallback = Callable[[str, Dict[str, Any]], None]
+
 
 class DockerClient:
     """Docker client for managing runner containers."""
 
-    def __init__(self):
-        """Initialize Docker client."""
-        self.client = docker.from_env()
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        name: str = "local",
+        capacity: Optional[int] = None,
+    ):
+        """Initialize Docker client.
+
+        Args:
+            base_url: Docker endpoint, e.g. ``unix:///var/run/docker.sock`` or
+                ``tcp://build-2:2376`` (default: ``docker_socket``)
+            name: Host name reported in runner info
+            capacity: Runners this host can hold (default: ``max_runners``)
+        """
+        self.base_url = base_url or settings.docker_socket
+        self.name = name
+        self.capacity = capacity or settings.max_runners
+        # DOCKER_TLS_VERIFY / DOCKER_CERT_PATH from the environment still apply
+        self.client = docker.from_env(
+            environment={**os.environ, "DOCKER_HOST": self.base_url}
+        )
         self.container_prefix = settings.runner_name_prefix
+        # docker-py is synchronous; run it on a bounded pool so a slow stop
+        # never blocks the event loop (health checks, API, reconcile loop)
+        self._executor = ThreadPoolExecutor(
+            max_workers=settings.docker_max_workers,
+            thread_name_prefix="docker-api",
+        )
+        self.op_timeout = settings.docker_operation_timeout
+        # Image ID -> repo tags; images are immutable so entries never go stale
+        self._image_tags: Dict[str, List[str]] = {}
+
+        # Events-backed container index (populated once start_event_watch runs)
+        self.index: Optional[ContainerIndex] = None
+        self._events_thread: Optional[threading.Thread] = None
+        self._events_stop = threading.Event()
+        self._events_stream: Any = None
+        # Containers being removed by us; their die events are expected
+        self.removing: Set[str] = set()
+        # Concurrent pollers share one in-flight container listing
+        self._reads = SingleFlight(ttl=settings.read_freshness_window)
+        # Named /var/lib/docker volumes reused across runners (image layer cache)
+        self.dind_cache: Optional[DindSlotCache] = (
+            DindSlotCache(self.client, self._run, self.capacity)
+            if settings.dind_cache_enabled
+            else None
+        )
+
+        # Read-only tool cache and Playwright volumes shared by every runner
+        self.shared_cache: Optional[SharedToolCache] = (
+            SharedToolCache(self.client, self._run)
+            if settings.shared_cache_enabled
+            else None
+        )
+
+        # Scrubbed work volumes handed to new runners (0 disables pooling)
+        self.work_pool: Optional[WorkVolumePool] = (
+            WorkVolumePool(self.client, self._run)
+            if settings.work_volume_pool_size > 0
+            else None
+        )
 
         # Ensure network exists
         self._ensure_network()
 
+    async def _run(
+        self,
+        fn: Callable[..., Any],
+        *args: Any,
+        op_timeout: Optional[float] = None,
+        **kwargs: Any,
+    ) -> Any:
+        """Run a blocking docker-py call on the Docker executor.
+
+        Args:
+            fn: docker-py callable
+            op_timeout: Seconds to wait before giving up (default: operation timeout)
+
+        Raises:
+            asyncio.TimeoutError: The call did not finish in time. The worker
+                thread keeps running until docker-py returns.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(fn, *args, **kwargs)
+        return await asyncio.wait_for(
+            loop.run_in_executor(self._executor, call),
+            timeout=op_timeout or self.op_timeout,
+        )
+
+    def close(self) -> None:
+        """Stop the events watcher and shut down the Docker executor."""
+        self.stop_event_watch()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def start_event_watch(
+        self, on_change: Optional[ContainerEventCallback] = None
+    ) -> None:
+        """Maintain the container index from the Docker ``/events`` stream.
+
+        Args:
+            on_change: Called on the event loop as ``on_change(status, runner)``
+                whenever a runner container changes state
+        """
+        if self._events_thread is not None:
+            return
+
+        self.index = ContainerIndex()
+        loop = asyncio.get_running_loop()
+        self._events_stop.clear()
+        self._events_thread = threading.Thread(
+            target=self._watch_events,
+            args=(loop, on_change),
+            name="docker-events",
+            daemon=True,
+        )
+        self._events_thread.start()
+        logger.info("Started Docker events watcher")
+
+    def stop_event_watch(self) -> None:
+        """Stop the events watcher thread."""
+        if self._events_thread is None:
+            return
+        self._events_stop.set()
+        stream = self._events_stream
+        if stream is not None:
+            try:
+                # Unblocks the watcher thread's read on the events socket
+                stream.close()
+            except Exception:
+                pass
+        self._events_thread.join(timeout=5)
+        self._events_thread = None
+        logger.info("Stopped Docker events watcher")
+
+    def _watch_events(
+        self,
+        loop: asyncio.AbstractEventLoop,
+        on_change: Optional[ContainerEventCallback],
+    ) -> None:
+        """Events thread: apply container events to the index, reconnecting on errors."""
+        index = self.index
+        assert index is not None
+        backoff = 1.0
+        while not self._events_stop.is_set():
+            try:
+                self._events_stream = self.client.events(
+                    decode=True, filters=MANAGED_EVENTS_FILTER
+                )
+                # Anything before the subscription may have been missed;
+                # distrust the index until the next full resync lands
+                index.mark_stale()
+                backoff = 1.0
+                for event in self._events_stream:
+                    change = index.apply_event(event, self._runner_info_from_summary)
+                    if change is not None:
+                        logger.debug(
+                            "Runner container event",
+                            status=change[0],
+                            container_id=event.get("id"),
+                        )
+                        if on_change is not None and change[1] is not None:
+                            loop.call_soon_threadsafe(on_change, *change)
+            except Exception as e:
+                if self._events_stop.is_set():
+                    break
+                logger.warning(
+                    "Docker events stream interrupted, reconnecting",
+                    error=str(e),
+                    retry_in=backoff,
+                )
+            finally:
+                self._events_stream = None
+
+            index.mark_stale()
+            self._events_stop.wait(backoff)
+            backoff = min(backoff * 2, 30.0)
+
     def _ensure_network(self):
         """Ensure the runner network exists."""
         try:
@@ -41,14 +232,21 @@ class DockerClient:
         self,
         runner_name: str,
         repo_url: str,
-        runner_token: str,
+        runner_token: Optional[str] = None,
+        jit_config: Optional[str] = None,
+        runner_id: Optional[int] = None,
+        warm: bool = False,
     ) -> str:
         """Create a new runner container.
 
         Args:
             runner_name: Name for the runner
             repo_url: GitHub repository URL
-            runner_token: Registration token
+            runner_token: Registration token (config.sh registration)
+            jit_config: Encoded just-in-time config; replaces ``runner_token``
+            runner_id: GitHub runner id of a JIT registration
+            warm: Create a warm-pool standby container that boots and then
+                waits for :meth:`bind_runner` to deliver its registration
 
         Returns:
             Container ID
@@ -57,7 +255,6 @@ class DockerClient:
 
         environment = {
             "REPO_URL": repo_url,
-            "RUNNER_TOKEN": runner_token,
             "RUNNER_NAME": runner_name,
             "RUNNER_WORKDIR": "_work",
             "RUNNER_LABELS": settings.runner_labels,
@@ -80,19 +277,34 @@ class DockerClient:
             "CI": settings.ci,
             "PLAYWRIGHT_BROWSERS_PATH": settings.playwright_browsers_path,
         }
+        if warm:
+            environment["WARM_POOL"] = "true"
+        elif jit_config:
+            # Pre-registered runner: the entrypoint skips config.sh entirely
+            environment["RUNNER_JITCONFIG"] = jit_config
+        else:
+            environment["RUNNER_TOKEN"] = runner_token or ""
+        single_use = bool(jit_config) or (warm and settings.runner_jit_config)
+        # A JIT config is single-use, so a restarted JIT runner could not
+        # reconnect; let it exit and be reaped instead
+        restart_policy = "no" if single_use else "unless-stopped"
 
         # Create volume for runner work directory
-        work_volume_name = f"{container_name}-work"
-        try:
-            self.client.volumes.create(
-                name=work_volume_name,
-                labels={"runner": runner_name, "managed-by": "runner-orchestrator"},
-            )
-            logger.debug("Created work volume", volume=work_volume_name)
-        except APIError as e:
-            logger.warning(
-                "Volume might already exist", volume=work_volume_name, error=str(e)
-            )
+        if self.work_pool is not None:
+            work_volume_name = await self.work_pool.acquire(runner_name)
+        else:
+            work_volume_name = f"{container_name}-work"
+            try:
+                await self._run(
+                    self.client.volumes.create,
+                    name=work_volume_name,
+                    labels={"runner": runner_name, "managed-by": "runner-orchestrator"},
+                )
+                logger.debug("Created work volume", volume=work_volume_name)
+            except APIError as e:
+                logger.warning(
+                    "Volume might already exist", volume=work_volume_name, error=str(e)
+                )
 
         # Container configuration
         container_config = {
@@ -100,13 +312,15 @@ class DockerClient:
             "name": container_name,
             "environment": environment,
             "volumes": {
-                work_volume_name: {"bind": "/actions-runner/_work", "mode": "rw"},
+                work_volume_name: {"bind": WORK_DIR, "mode": "rw"},
                 "/var/run/docker.sock": {"bind": "/var/run/docker.sock", "mode": "rw"},
             },
             "network": settings.runner_network,
-            "restart_policy": {"Name": "unless-stopped"},
+            "restart_policy": {"Name": restart_policy},
             "labels": {
                 "managed-by": "runner-orchestrator",
+                # Container summaries and events don't carry the policy itself
+                "restart-policy": restart_policy,
                 "runner-name": runner_name,
                 "runner-version": settings.runner_version,
                 "created-at": datetime.now(timezone.utc).isoformat(),
@@ -120,14 +334,43 @@ class DockerClient:
             "cap_add": ["SYS_ADMIN", "NET_ADMIN"],  # Documented for clarity
         }
 
+        if runner_id is not None:
+            container_config["labels"]["runner-id"] = str(runner_id)
+        if warm:
+            container_config["labels"]["pool"] = "warm"
+        if self.shared_cache is not None:
+            # Pin the generation so the populator keeps it while this runner exists
+            container_config["environment"].update(self.shared_cache.environment())
+            container_config["volumes"].update(self.shared_cache.volumes())
+            container_config["labels"][GENERATION_LABEL] = (
+                self.shared_cache.generation or ""
+            )
+
+        slot = None
+        cache = self.dind_cache
+        if cache is not None:
+            try:
+                slot = await cache.lease()
+            except (APIError, asyncio.TimeoutError) as e:
+                # Run uncached rather than not at all
+                logger.warning("Could not lease DinD cache slot", error=str(e))
+            if slot is not None:
+                container_config["volumes"][cache.volume_name(slot)] = {
+                    "bind": DIND_DATA_ROOT,
+                    "mode": "rw",
+                }
+                container_config["labels"][SLOT_LABEL] = str(slot)
+
         try:
             logger.info(
                 "Creating runner container",
                 name=container_name,
                 runner=runner_name,
                 image=settings.runner_image,
+                docker_host=self.name,
             )
-            container = self.client.containers.run(**container_config)
+            container = await self._run(self.client.containers.run, **container_config)
+            self._reads.forget("runners")
 
             logger.info(
                 "Runner container created successfully",
@@ -146,13 +389,50 @@ class DockerClient:
                 error=str(e),
             )
             # Clean up volume if container creation failed
+            if self.work_pool is not None:
+                await self.work_pool.release(work_volume_name)
+                raise
             try:
-                volume = self.client.volumes.get(work_volume_name)
-                volume.remove()
+                volume = await self._run(self.client.volumes.get, work_volume_name)
+                await self._run(volume.remove)
                 logger.debug("Cleaned up volume after failed creation", volume=work_volume_name)
-            except (DockerNotFound, APIError):
+            except (DockerNotFound, APIError, asyncio.TimeoutError):
                 pass
             raise
+        finally:
+            # The container (if any) now carries the slot label itself
+            if self.dind_cache is not None:
+                self.dind_cache.release(slot)
+
+    async def bind_runner(self, container_id: str, environment: Dict[str, str]) -> None:
+        """Deliver a registration to a waiting warm-pool container.
+
+        Writes ``/actions-runner/.binding`` (shell ``KEY=value`` lines); the
+        entrypoint sources it and continues with registration.
+
+        Args:
+            container_id: Standby container to bind
+            environment: Variables such as ``RUNNER_TOKEN`` or ``RUNNER_JITCONFIG``
+        """
+        lines = [f"{key}={shlex.quote(value)}\n" for key, value in environment.items()]
+        # Trailer lets the entrypoint tell a complete file from a partial write
+        lines.append("BINDING_COMPLETE=1\n")
+        content = "".join(lines).encode()
+        archive = io.BytesIO()
+        with tarfile.open(fileobj=archive, mode="w") as tar:
+            info = tarfile.TarInfo(".binding")
+            info.size = len(content)
+            info.mode = 0o600
+            tar.addfile(info, io.BytesIO(content))
+
+        ok = await self._run(
+            self.client.api.put_archive,
+            container_id,
+            "/actions-runner",
+            archive.getvalue(),
+        )
+        if not ok:
+            raise RuntimeError(f"Could not write binding into container {container_id}")
 
     async def remove_runner(self, container_id: str, force: bool = False) -> bool:
         """Remove a runner container.
@@ -165,12 +445,93 @@ class DockerClient:
             True if removed successfully
         """
         try:
-            container = self.client.containers.get(container_id)
+            await self._remove_runner(container_id, force=force)
+            return True
+        except APIError as e:
+            logger.error(
+                "Failed to remove runner container",
+                container_id=container_id,
+                error=str(e),
+            )
+            return False
+        except asyncio.TimeoutError:
+            logger.error(
+                "Timed out removing runner container", container_id=container_id
+            )
+            return False
+
+    async def remove_runners(
+        self, container_ids: Iterable[str], force: bool = False
+    ) -> Dict[str, Any]:
+        """Remove many runner containers concurrently.
+
+        At most ``docker_remove_concurrency`` removals run at once and each is
+        abandoned after ``docker_remove_timeout`` seconds, so one hung stop
+        cannot hold up the rest of the batch.
+
+        Args:
+            container_ids: Container IDs or names
+            force: Force removal even if containers are running
+
+        Returns:
+            Dict with ``removed`` (IDs), ``failed`` (ID -> error) and
+            ``duration_ms``
+        """
+        ids = list(dict.fromkeys(container_ids))
+        started = time.monotonic()
+        semaphore = asyncio.Semaphore(max(1, settings.docker_remove_concurrency))
+
+        async def remove_one(container_id: str) -> Optional[str]:
+            async with semaphore:
+                try:
+                    await asyncio.wait_for(
+                        self._remove_runner(container_id, force=force),
+                        timeout=settings.docker_remove_timeout,
+                    )
+                    return None
+                except asyncio.TimeoutError:
+                    return "timed out"
+                except Exception as e:
+                    # Reported per container instead of failing the whole batch
+                    return str(e) or type(e).__name__
+
+        errors = await asyncio.gather(*(remove_one(c) for c in ids))
+        result = {
+            "removed": [c for c, error in zip(ids, errors) if error is None],
+            "failed": {c: error for c, error in zip(ids, errors) if error is not None},
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+        if ids:
+            log = logger.warning if result["failed"] else logger.info
+            log(
+                "Removed runner containers",
+                requested=len(ids),
+                removed=len(result["removed"]),
+                failed=result["failed"],
+                duration_ms=result["duration_ms"],
+            )
+        return result
+
+    async def _remove_runner(self, container_id: str, force: bool = False) -> None:
+        """Stop and remove a container and its work volume.
+
+        A container that no longer exists counts as removed.
+
+        Raises:
+            APIError: Docker refused to stop or remove the container
+            asyncio.TimeoutError: A Docker call did not finish in time
+        """
+        full_id = container_id
+        self.removing.add(container_id)
+        try:
+            container = await self._run(self.client.containers.get, container_id)
+            full_id = container.id
+            self.removing.add(full_id)
 
             # Get associated volume name before removing container
             work_volume_name = None
             for mount in container.attrs.get("Mounts", []):
-                if mount.get("Destination") == "/actions-runner/_work":
+                if mount.get("Destination") == WORK_DIR:
                     work_volume_name = mount.get("Name")
                     break
 
@@ -178,16 +539,24 @@ class DockerClient:
 
             # Stop and remove container
             if container.status == "running":
-                container.stop(timeout=30)
-            container.remove(force=force)
-
-            # Remove associated work volume
-            if work_volume_name:
+                await self._run(
+                    container.stop,
+                    timeout=CONTAINER_STOP_TIMEOUT,
+                    op_timeout=CONTAINER_STOP_TIMEOUT + self.op_timeout,
+                )
+            # v=True also drops anonymous volumes (e.g. an uncached /var/lib/docker)
+            await self._run(container.remove, force=force, v=True)
+            self._reads.forget("runners")
+
+            # Recycle a pooled work volume; remove any other (by name: no
+            # extra lookup round trip)
+            if self.work_pool is not None and self.work_pool.owns(work_volume_name):
+                await self.work_pool.release(work_volume_name)
+            elif work_volume_name:
                 try:
-                    volume = self.client.volumes.get(work_volume_name)
-                    volume.remove()
+                    await self._run(self.client.api.remove_volume, work_volume_name)
                     logger.info("Removed runner work volume", volume=work_volume_name)
-                except (DockerNotFound, APIError) as e:
+                except (DockerNotFound, APIError, asyncio.TimeoutError) as e:
                     logger.warning(
                         "Failed to remove work volume",
                         volume=work_volume_name,
@@ -197,128 +566,136 @@ class DockerClient:
             logger.info(
                 "Runner container removed successfully", container_id=container_id
             )
-            return True
 
         except DockerNotFound:
             logger.warning("Container not found for removal", container_id=container_id)
-            return True
-        except APIError as e:
-            logger.error(
-                "Failed to remove runner container",
-                container_id=container_id,
-                error=str(e),
-            )
-            return False
+        finally:
+            self.removing.discard(container_id)
+            self.removing.discard(full_id)
 
     async def get_runners(self) -> List[Dict[str, Any]]:
-        """Get list of all managed runner containers."""
+        """Get list of all managed runner containers.
+
+        Served from the events-backed index when it is current; otherwise
+        (no watcher, reconnecting, or periodic resync due) from a full listing.
+        """
+        index = self.index
+        if index is not None and not index.needs_resync(
+            settings.docker_index_resync_interval
+        ):
+            return index.list()
+        return list(await self._reads.do("runners", self._resync_runners))
+
+    async def _resync_runners(self) -> List[Dict[str, Any]]:
+        """Take a full container listing and, if watching events, reseed the index."""
+        index = self.index
+        generation = index.generation() if index is not None else 0
+        started_at = time.monotonic()
         try:
-            containers = self.client.containers.list(
-                all=True, filters={"label": "managed-by=runner-orchestrator"}
-            )
+            runners = await self._list_runners()
+        except APIError as e:
+            # Never seed the index from (or plan on) a failed listing
+            logger.error("Failed to get runner containers", error=str(e))
+            raise
+        if index is not None:
+            index.replace_all(runners, started_at, generation)
+        return runners
 
-            runners = []
-            for container in containers:
-                try:
-                    # Skip the orchestrator container itself
-                    if container.labels.get("component") == "orchestrator":
-                        continue
+    async def _list_runners(self) -> List[Dict[str, Any]]:
+        """List managed runner containers from the Docker daemon."""
+        return await self._run(self._list_runners_sync)
 
-                    # Only include containers that have a runner-name label (actual runners)
-                    if not container.labels.get("runner-name"):
-                        continue
+    def _list_runners_sync(self) -> List[Dict[str, Any]]:
+        """Blocking container listing; runs on the Docker executor.
 
-                    # Skip existing actions-runner-* containers that we should not manage
-                    if container.name.startswith("actions-runner-") and not container.name.startswith(self.container_prefix):
-                        logger.debug(
-                            "Ignoring non-orchestrated actions-runner container",
-                            name=container.name,
-                        )
-                        continue
-
-                    # Safely get container info - containers may disappear between list and access
-                    container.reload()  # Refresh container state
-
-                    runner_info = {
-                        "id": container.id,
-                        "name": container.name,
-                        "status": container.status,
-                        "runner_name": container.labels.get("runner-name"),
-                        "runner_version": container.labels.get("runner-version"),
-                        "created_at": container.labels.get("created-at"),
-                        "repo_url": container.labels.get("repo-url"),
-                        "image": (
-                            container.image.tags[0]
-                            if container.image.tags
-                            else container.labels.get("image", "unknown")
-                        ),
-                    }
-                    runners.append(runner_info)
-
-                except (DockerNotFound, APIError) as e:
-                    logger.warning(
-                        "Container disappeared while processing",
-                        container_id=getattr(container, "id", "unknown"),
-                        error=str(e),
-                    )
-                    # Continue processing other containers
-                    continue
+        Uses the low-level list endpoint, whose summary payload already carries
+        state, labels and image, so a listing is a single Docker API call
+        instead of one inspect per container (plus one per image).
+        """
+        summaries = self.client.api.containers(
+            all=True, filters={"label": "managed-by=runner-orchestrator"}
+        )
+
+        runners = []
+        for summary in summaries:
+            runner_info = self._runner_info_from_summary(summary)
+            if runner_info is not None:
+                runners.append(runner_info)
+        return runners
+
+    def _runner_info_from_summary(
+        self, summary: Dict[str, Any]
+    ) -> Optional[Dict[str, Any]]:
+        """Build runner info from a container list summary (None if not a runner)."""
+        labels = summary.get("Labels") or {}
+        names = summary.get("Names") or []
+        name = names[0].lstrip("/") if names else summary.get("Id", "")[:12]
+
+        # Skip the orchestrator container itself
+        if labels.get("component") == "orchestrator":
+            return None
+
+        # Only include containers that have a runner-name label (actual runners)
+        if not labels.get("runner-name"):
+            return None
+
+        # Skip existing actions-runner-* containers that we should not manage
+        if name.startswith("actions-runner-") and not name.startswith(self.container_prefix):
+            logger.debug(
+                "Ignoring non-orchestrated actions-runner container",
+                name=name,
+            )
+            return None
+
+        return {
+            "id": summary["Id"],
+            "name": name,
+            # Docker host the container runs on
+            "host": self.name,
+            "status": summary.get("State", "unknown"),
+            "runner_name": labels.get("runner-name"),
+            "runner_version": labels.get("runner-version"),
+            "created_at": labels.get("created-at"),
+            "repo_url": labels.get("repo-url"),
+            "image": self._image_name(summary, labels),
+            # GitHub runner id, known up front for just-in-time registrations
+            "runner_id": int(labels["runner-id"]) if labels.get("runner-id") else None,
+            "pool": labels.get("pool"),
+            # Containers from before the label: JIT runners never restart
+            "restart_policy": labels.get("restart-policy")
+            or ("no" if labels.get("runner-id") else "unless-stopped"),
+            # DinD cache volume leased to the container, if any
+            "dind_slot": (
+                int(labels[SLOT_LABEL]) if labels.get(SLOT_LABEL, "").isdigit() else None
+            ),
+        }
 
-            return runners
+    def _image_name(self, summary: Dict[str, Any], labels: Dict[str, str]) -> str:
+        """Resolve a human-readable image name, inspecting each image at most once."""
+        image = summary.get("Image") or ""
+        if image and not image.startswith("sha256:"):
+            # Reference the container was created from, e.g. "shghar:local"
+            return image
 
-        except APIError as e:
-            logger.error("Failed to get runner containers", error=str(e))
-            return []
+        image_id = summary.get("ImageID") or image
+        tags = self._image_tags.get(image_id)
+        if tags is None and image_id:
+            try:
+                tags = self.client.api.inspect_image(image_id).get("RepoTags") or []
+            except (DockerNotFound, APIError):
+                tags = []
+            self._image_tags[image_id] = tags
+
+        return tags[0] if tags else labels.get("image", "unknown")
 
     async def get_runner_logs(self, container_id: str, tail: int = 100) -> str:
         """Get logs from a runner container."""
         try:
-            container = self.client.containers.get(container_id)
-            logs = container.logs(tail=tail, timestamps=True)
+            container = await self._run(self.client.containers.get, container_id)
+            logs = await self._run(container.logs, tail=tail, timestamps=True)
             return logs.decode("utf-8")
-        except (DockerNotFound, APIError) as e:
+        except (DockerNotFound, APIError, asyncio.TimeoutError) as e:
             logger.error(
                 "Failed to get runner logs", container_id=container_id, error=str(e)
             )
             return f"Error getting logs: {str(e)}"
-
-    async def cleanup_dead_containers(self) -> int:
-        """Clean up dead or exited runner containers."""
-        try:
-            containers = self.client.containers.list(
-                all=True,
-                filters={"label": "managed-by=runner-orchestrator", "status": "exited"},
-            )
-
-            cleaned = 0
-            for container in containers:
-                try:
-                    # Skip existing actions-runner-* containers that we should not manage
-                    if container.name.startswith("actions-runner-"):
-                        logger.debug(
-                            "Ignoring existing actions-runner container during cleanup",
-                            name=container.name,
-                        )
-                        continue
-
-                    container_id = container.id
-                    await self.remove_runner(container_id)
-                    cleaned += 1
-
-                except (DockerNotFound, APIError) as e:
-                    logger.warning(
-                        "Container disappeared during cleanup or failed to remove",
-                        container_id=getattr(container, "id", "unknown"),
-                        error=str(e),
-                    )
-                    # Continue with other containers
-                    continue
-
-            if cleaned > 0:
-                logger.info("Cleaned up dead containers", count=cleaned)
-
-            return cleaned
-
-        except APIError as e:
-            logger.error("Failed to cleanup dead containers", error=str(e))
-            return 0
@@ -0,0 +1,490 @@
+"""Runner containers scheduled across several Docker hosts."""
+
+import asyncio
+import os
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional, Set
+from urllib.parse import urlparse
+
+from docker.errors import DockerException
+import structlog
+
+from .config import settings
+from .docker_client import ContainerEventCallback, DockerClient
+from .reconciler import DEAD_STATUSES
+
+logger = structlog.get_logger()
+
+PLACEMENTS = ("spread", "binpack")
+# Seconds between attempts to connect to a host that was unreachable
+RECONNECT_INTERVAL = 60.0
+
+
+@dataclass(frozen=True)
+class DockerEndpoint:
+    """One Docker daemon the orchestrator may place runners on."""
+
+    name: str
+    url: str
+    capacity: int
+
+
+def parse_docker_hosts(value: str) -> List[DockerEndpoint]:
+    """Parse ``docker_hosts`` (``url[=capacity],...``).
+
+    Hosts without a capacity can hold ``max_runners``. Each host is named
+    after the address in its URL (``unix`` sockets after their path).
+
+    Raises:
+        ValueError: An entry has no URL, a bad capacity or a duplicate name
+    """
+    endpoints: List[DockerEndpoint] = []
+    for entry in value.split(","):
+        entry = entry.strip()
+        if not entry:
+            continue
+        url, _, capacity = entry.partition("=")
+        url = url.strip()
+        parsed = urlparse(url)
+        name = parsed.netloc or parsed.path
+        if not parsed.scheme or not name:
+            raise ValueError(f"Invalid Docker host {entry!r}; expected url[=capacity]")
+        try:
+            slots = int(capacity) if capacity.strip() else settings.max_runners
+        except ValueError:
+            raise ValueError(f"Invalid capacity in Docker host {entry!r}") from None
+        if slots < 1:
+            raise ValueError(f"Docker host {entry!r} needs a capacity of at least 1")
+        if any(e.name == name for e in endpoints):
+            raise ValueError(f"Docker host {name!r} is listed twice")
+        endpoints.append(DockerEndpoint(name, url, slots))
+    return endpoints
+
+
+def configured_endpoints() -> List[DockerEndpoint]:
+    """Endpoints from ``docker_hosts``, or the single local daemon."""
+    endpoints = parse_docker_hosts(settings.docker_hosts)
+    if endpoints:
+        return endpoints
+    # An unset docker_socket keeps honouring DOCKER_HOST like docker.from_env()
+    url = settings.docker_socket
+    if "docker_socket" not in settings.model_fields_set:
+        url = os.environ.get("DOCKER_HOST", url)
+    return [DockerEndpoint("local", url, settings.max_runners)]
+
+
+class DockerCluster:
+    """The :class:`DockerClient` interface over one or more Docker hosts.
+
+    Each host keeps its own client, executor, events watcher and caches.
+    Listings are gathered from every host concurrently and each runner dict
+    carries the ``host`` it runs on, which routes later operations on its
+    container. New runners go to the host chosen by ``docker_placement``
+    among those below their declared capacity:
+
+    - ``spread``: lowest load relative to capacity, spreading failures and
+      noisy neighbours
+    - ``binpack``: highest load that still has room, keeping other hosts
+      empty (and cheap to drain)
+
+    A host whose listing fails keeps reporting its last known containers
+    and receives no new runners until it answers again; a host unreachable
+    at startup is retried every ``RECONNECT_INTERVAL`` seconds.
+    """
+
+    def __init__(self, endpoints: Optional[List[DockerEndpoint]] = None):
+        if settings.docker_placement not in PLACEMENTS:
+            raise ValueError(
+                f"Unknown docker_placement {settings.docker_placement!r}; "
+                f"expected one of {', '.join(PLACEMENTS)}"
+            )
+        endpoints = endpoints if endpoints is not None else configured_endpoints()
+        self.hosts: Dict[str, DockerClient] = {}
+        self.capacity: Dict[str, int] = {e.name: e.capacity for e in endpoints}
+        self.healthy: Dict[str, bool] = {}
+        # Unreachable endpoints and when connecting was last tried
+        self._unconnected: Dict[str, DockerEndpoint] = {}
+        self._connect_tried = 0.0
+        # Last good listing per host, served while the host is unreachable
+        self._last_seen: Dict[str, List[Dict[str, Any]]] = {}
+        # Container id -> host, learned from listings and creations
+        self._owner: Dict[str, str] = {}
+        # Creations in flight per host
+        self._placing: Counter = Counter()
+        # Host -> containers created since its cached state was taken, and when
+        self._unlisted: Dict[str, Dict[str, float]] = defaultdict(dict)
+        self._on_change: Optional[ContainerEventCallback] = None
+        self._watching = False
+        # Per-host cache maintenance (work volume scrubber, tool cache refresh)
+        self._background: List["asyncio.Task[None]"] = []
+        self._background_started = False
+
+        for endpoint in endpoints:
+            try:
+                self._add_host(endpoint)
+            except DockerException as e:
+                # A single host must be reachable, as before
+                if len(endpoints) == 1:
+                    raise
+                logger.error(
+                    "Docker host unreachable, will retry",
+                    docker_host=endpoint.name,
+                    error=str(e),
+                )
+                self._unconnected[endpoint.name] = endpoint
+                self.healthy[endpoint.name] = False
+        if not self.hosts:
+            raise RuntimeError("No Docker host is reachable")
+        self._connect_tried = time.monotonic()
+
+    def _add_host(self, endpoint: DockerEndpoint) -> None:
+        """Connect to ``endpoint`` and start using it."""
+        self._adopt(DockerClient(endpoint.url, endpoint.name, endpoint.capacity))
+
+    def _adopt(self, host: DockerClient) -> None:
+        """Register a connected ``host`` as healthy."""
+        self.hosts[host.name] = host
+        self.healthy[host.name] = True
+        self._unconnected.pop(host.name, None)
+        logger.info(
+            "Connected to Docker host",
+            docker_host=host.name,
+            url=host.base_url,
+            capacity=host.capacity,
+        )
+
+    async def _connect_pending(self) -> None:
+        """Retry hosts that were unreachable at startup."""
+        if (
+            not self._unconnected
+            or time.monotonic() - self._connect_tried < RECONNECT_INTERVAL
+        ):
+            return
+        self._connect_tried = time.monotonic()
+        loop = asyncio.get_running_loop()
+        for endpoint in list(self._unconnected.values()):
+            try:
+                # Construction talks to the daemon; keep it off the event loop
+                host = await loop.run_in_executor(
+                    None, DockerClient, endpoint.url, endpoint.name, endpoint.capacity
+                )
+            except DockerException as e:
+                logger.debug(
+                    "Docker host still unreachable", docker_host=endpoint.name, error=str(e)
+                )
+                continue
+            self._adopt(host)
+            if self._watching:
+                host.start_event_watch(on_change=self._on_change)
+            if self._background_started:
+                self._start_background(host)
+
+    # --- Aggregated reads -------------------------------------------------
+
+    @property
+    def removing(self) -> Set[str]:
+        """Containers being removed on any host."""
+        return set().union(*(host.removing for host in self.hosts.values()))
+
+    async def get_runners(self) -> List[Dict[str, Any]]:
+        """Managed runner containers of every host, listed concurrently.
+
+        A failing host contributes its last good listing while another
+        host answers.
+
+        Raises:
+            Exception: The listing error, when every host failed or a failing
+                host has never been listed (its containers would be missing)
+        """
+        await self._connect_pending()
+        names = list(self.hosts)
+        started = time.monotonic()
+        results = await asyncio.gather(
+            *(self.hosts[name].get_runners() for name in names),
+            return_exceptions=True,
+        )
+        runners: List[Dict[str, Any]] = []
+        errors: List[BaseException] = []
+        blind = False
+        for name, result in zip(names, results):
+            if isinstance(result, BaseException):
+                if self.healthy.get(name, True):
+                    logger.error(
+                        "Docker host unavailable", docker_host=name, error=str(result)
+                    )
+                self.healthy[name] = False
+                errors.append(result)
+                blind = blind or name not in self._last_seen
+                result = self._last_seen.get(name, [])
+            else:
+                if not self.healthy.get(name, True):
+                    logger.info("Docker host available again", docker_host=name)
+                self.healthy[name] = True
+                self._last_seen[name] = result
+                self._prune_unlisted(name, result, listed_at=started)
+            for runner in result:
+                self._owner[runner["id"]] = name
+            runners.extend(result)
+        if errors and (blind or len(errors) == len(names)):
+            # Never plan from a listing that is entirely stale or missing a host
+            raise errors[0]
+        return runners
+
+    async def get_runner_logs(self, container_id: str, tail: int = 100) -> str:
+        """Get the last ``tail`` log lines of a container on any host."""
+        host = await self._host_of(container_id)
+        return await host.get_runner_logs(container_id, tail=tail)
+
+    # --- Placement --------------------------------------------------------
+
+    async def create_runner(self, runner_name: str, repo_url: str, **kwargs: Any) -> str:
+        """Create a runner container on the host chosen by ``docker_placement``.
+
+        Takes the arguments of :meth:`DockerClient.create_runner`.
+
+        Raises:
+            RuntimeError: Every reachable host is at capacity
+        """
+        if any(
+            name not in self._last_seen for name in self.hosts if self.healthy.get(name)
+        ):
+            # A host's load is unknown until it has been listed once
+            try:
+                await self.get_runners()
+            except Exception as e:
+                logger.debug("Could not list Docker hosts before placement", error=str(e))
+        name = self._place()
+        try:
+            container_id = await self.hosts[name].create_runner(
+                runner_name, repo_url, **kwargs
+            )
+        finally:
+            self._placing[name] -= 1
+        self._owner[container_id] = name
+        self._unlisted[name][container_id] = time.monotonic()
+        return container_id
+
+    def _place(self) -> str:
+        """Reserve a slot on the best host for one new runner.
+
+        Works from cached per-host state without awaiting, so concurrent
+        creations never wait on a Docker listing and each sees the slots
+        reserved by the others. A host that has never been listed is skipped.
+        """
+        load = self._load()
+        candidates = []
+        for index, name in enumerate(self.hosts):
+            if not self.healthy.get(name) or name not in load:
+                continue
+            used = load[name] + self._placing[name]
+            capacity = self.capacity[name]
+            if used < capacity:
+                candidates.append((used / capacity, used, index, name))
+        if not candidates:
+            raise RuntimeError("No Docker host has free runner capacity")
+        if settings.docker_placement == "binpack":
+            # Fullest host first; ties go to the host listed first
+            _, _, _, name = min(candidates, key=lambda c: (-c[0], c[2]))
+        else:
+            _, _, _, name = min(candidates)
+        self._placing[name] += 1
+        return name
+
+    def _host_load(self, name: str) -> Optional[int]:
+        """Live containers on host ``name`` from cached state (None if never listed).
+
+        Reads the host's events index while it is current, else its last
+        listing, plus containers created since that neither shows yet.
+        """
+        index = self.hosts[name].index
+        if index is not None and not index.needs_resync(
+            settings.docker_index_resync_interval
+        ):
+            runners = index.list()
+        elif name in self._last_seen:
+            runners = self._last_seen[name]
+        else:
+            return None
+        self._prune_unlisted(name, runners)
+        live = sum(1 for r in runners if r["status"] not in DEAD_STATUSES)
+        return live + len(self._unlisted[name])
+
+    def _prune_unlisted(
+        self, name: str, runners: List[Dict[str, Any]], listed_at: Optional[float] = None
+    ) -> None:
+        """Forget creations on host ``name`` that ``runners`` accounts for.
+
+        A creation is accounted for once it is listed, or once a listing that
+        started after it was taken (absent from that, it is already gone).
+        """
+        unlisted = self._unlisted.get(name)
+        if not unlisted:
+            return
+        listed = {r["id"] for r in runners}
+        for container_id, created_at in list(unlisted.items()):
+            if container_id in listed or (listed_at is not None and created_at < listed_at):
+                del unlisted[container_id]
+
+    # --- Routed writes ----------------------------------------------------
+
+    async def _host_of(self, container_id: str) -> DockerClient:
+        """Host running ``container_id`` (a full or abbreviated ID)."""
+        name = self._lookup(container_id)
+        if name is None:
+            try:
+                await self.get_runners()
+            except Exception as e:
+                logger.debug("Could not refresh container owners", error=str(e))
+            name = self._lookup(container_id)
+        if name is None:
+            # Not a listed runner: any host will report it as gone
+            return next(iter(self.hosts.values()))
+        return self.hosts[name]
+
+    def _lookup(self, container_id: str) -> Optional[str]:
+        """Host name owning ``container_id`` as far as listings have shown."""
+        name = self._owner.get(container_id)
+        if name is None:
+            for full_id, owner in self._owner.items():
+                if full_id.startswith(container_id):
+                    return owner
+        return name if name in self.hosts else None
+
+    async def bind_runner(self, container_id: str, environment: Dict[str, str]) -> None:
+        """Bind a warm standby on its host (see :meth:`DockerClient.bind_runner`)."""
+        host = await self._host_of(container_id)
+        await host.bind_runner(container_id, environment)
+
+    async def remove_runner(self, container_id: str, force: bool = False) -> bool:
+        """Remove a container from whichever host runs it."""
+        host = await self._host_of(container_id)
+        removed = await host.remove_runner(container_id, force=force)
+        if removed:
+            self._forget(container_id)
+        return removed
+
+    async def remove_runners(
+        self, container_ids: Iterable[str], force: bool = False
+    ) -> Dict[str, Any]:
+        """Remove containers on all hosts concurrently (see :meth:`DockerClient.remove_runners`)."""
+        started = time.monotonic()
+        by_host: Dict[str, List[str]] = {}
+        for container_id in dict.fromkeys(container_ids):
+            host = await self._host_of(container_id)
+            by_host.setdefault(host.name, []).append(container_id)
+        results = await asyncio.gather(
+            *(self.hosts[name].remove_runners(ids, force=force) for name, ids in by_host.items())
+        )
+        removed: List[str] = []
+        failed: Dict[str, str] = {}
+        for result in results:
+            removed.extend(result["removed"])
+            failed.update(result["failed"])
+        for container_id in removed:
+            self._forget(container_id)
+        return {
+            "removed": removed,
+            "failed": failed,
+            "duration_ms": round((time.monotonic() - started) * 1000, 1),
+        }
+
+    def _forget(self, container_id: str) -> None:
+        """Drop a removed container from the ownership and placement caches."""
+        name = self._owner.pop(container_id, None)
+        if name is not None and name in self._unlisted:
+            self._unlisted[name].pop(container_id, None)
+
+    # --- Lifecycle --------------------------------------------------------
+
+    def start_event_watch(self, on_change: Optional[ContainerEventCallback] = None) -> None:
+        """Start every host's Docker events watcher, including hosts connected later."""
+        self._on_change = on_change
+        self._watching = True
+        for host in self.hosts.values():
+            host.start_event_watch(on_change=on_change)
+
+    def stop_event_watch(self) -> None:
+        """Stop every host's Docker events watcher."""
+        self._watching = False
+        for host in self.hosts.values():
+            host.stop_event_watch()
+
+    def start_background(self) -> None:
+        """Start every host's cache maintenance tasks."""
+        self._background_started = True
+        for host in self.hosts.values():
+            self._start_background(host)
+
+    def _start_background(self, host: DockerClient) -> None:
+        """Start the cache maintenance tasks of one host."""
+        if host.work_pool is not None:
+            self._background.append(asyncio.create_task(host.work_pool.run_scrubber()))
+        if host.shared_cache is not None:
+            self._background.append(asyncio.create_task(host.shared_cache.run_forever()))
+
+    async def stop_background(self) -> None:
+        """Cancel every host's cache maintenance tasks and wait for them."""
+        for task in self._background:
+            task.cancel()
+        await asyncio.gather(*self._background, return_exceptions=True)
+        self._background = []
+        self._background_started = False
+
+    async def refresh_shared_caches(self) -> Dict[str, Dict[str, Any]]:
+        """Refresh the shared tool cache of every host concurrently.
+
+        Returns:
+            Host name -> shared cache stats (empty if the cache is disabled)
+        """
+        caches = {
+            name: host.shared_cache
+            for name, host in self.hosts.items()
+            if host.shared_cache is not None
+        }
+        await asyncio.gather(*(cache.refresh() for cache in caches.values()))
+        return {name: cache.stats() for name, cache in caches.items()}
+
+    def close(self) -> None:
+        """Close the client of every connected host."""
+        for host in self.hosts.values():
+            host.close()
+
+    def _load(self) -> Counter:
+        """Live containers per connected host that has been listed (see :meth:`_host_load`)."""
+        load: Counter = Counter()
+        for name in self.hosts:
+            count = self._host_load(name)
+            if count is not None:
+                load[name] = count
+        return load
+
+    def free_capacity(self) -> int:
+        """Runners the reachable hosts can still take, from cached per-host state."""
+        load = self._load()
+        return sum(
+            max(0, self.capacity[name] - load[name] - self._placing[name])
+            for name in load
+            if self.healthy.get(name)
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Per-host capacity, load and cache state for status reporting."""
+        load = self._load()
+        stats: Dict[str, Any] = {}
+        for name, capacity in self.capacity.items():
+            host = self.hosts.get(name)
+            stats[name] = {
+                "url": host.base_url if host else self._unconnected[name].url,
+                "healthy": self.healthy.get(name, False),
+                "capacity": capacity,
+                "runners": load[name],
+                "placing": self._placing[name],
+                "dind_cache": host.dind_cache.stats() if host and host.dind_cache else None,
+                "work_pool": host.work_pool.stats() if host and host.work_pool else None,
+                "shared_cache": (
+                    host.shared_cache.stats() if host and host.shared_cache else None
+                ),
+            }
+        return stats
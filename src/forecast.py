@@ -0,0 +1,174 @@
+"""Short-horizon runner demand forecasting for predictive scaling."""
+
+import json
+import math
+import os
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, Optional
+
+import structlog
+
+logger = structlog.get_logger()
+
+# One seasonal slot per hour of the week (UTC): captures working hours and
+# weekday patterns such as release trains
+SEASON_SLOTS = 7 * 24
+BUCKET = timedelta(hours=1)
+
+# Holt-Winters smoothing factors for level, trend and season. A small ALPHA
+# keeps daily bursts in the seasonal profile instead of the level.
+ALPHA = 0.05
+BETA = 0.05
+GAMMA = 0.4
+# Trend damping so a short ramp isn't extrapolated over the whole horizon
+PHI = 0.9
+
+
+def season_slot(moment: datetime) -> int:
+    """Hour-of-week slot (0 = Monday 00:00 UTC) for ``moment``."""
+    moment = moment.astimezone(timezone.utc)
+    return moment.weekday() * 24 + moment.hour
+
+
+def _bucket_start(moment: datetime) -> datetime:
+    return moment.astimezone(timezone.utc).replace(minute=0, second=0, microsecond=0)
+
+
+class DemandForecaster:
+    """Additive Holt-Winters model of runner demand with weekly seasonality.
+
+    Demand (busy runners plus queued jobs) is sampled every reconcile tick
+    and averaged into hourly buckets; each completed bucket updates the
+    level, the damped trend and the seasonal offset of its hour of the week.
+    The model is optionally persisted as JSON so a restart keeps the
+    learned weekly profile.
+    """
+
+    def __init__(self, state_path: Optional[str] = None):
+        self.state_path = state_path
+        self.level: Optional[float] = None
+        self.trend = 0.0
+        self.seasonal: List[float] = [0.0] * SEASON_SLOTS
+        # Slots that have received at least one completed bucket
+        self.seen: List[bool] = [False] * SEASON_SLOTS
+        self._bucket: Optional[datetime] = None
+        self._bucket_sum = 0.0
+        self._bucket_count = 0
+        self.buckets_observed = 0
+        if state_path:
+            self._load()
+
+    def observe(self, now: datetime, demand: float) -> None:
+        """Record one demand sample taken at ``now``."""
+        bucket = _bucket_start(now)
+        if self._bucket is not None and bucket != self._bucket:
+            self._complete_bucket()
+        if self._bucket != bucket:
+            self._bucket, self._bucket_sum, self._bucket_count = bucket, 0.0, 0
+        self._bucket_sum += demand
+        self._bucket_count += 1
+
+    def _complete_bucket(self) -> None:
+        """Fold the finished hourly bucket into the model."""
+        if not self._bucket_count or self._bucket is None:
+            return
+        value = self._bucket_sum / self._bucket_count
+        slot = season_slot(self._bucket)
+        season = self.seasonal[slot]
+
+        if self.level is None:
+            self.level = value - season
+        else:
+            previous = self.level
+            self.level = ALPHA * (value - season) + (1 - ALPHA) * (
+                previous + PHI * self.trend
+            )
+            self.trend = BETA * (self.level - previous) + (1 - BETA) * PHI * self.trend
+
+        if self.seen[slot]:
+            self.seasonal[slot] = GAMMA * (value - self.level) + (1 - GAMMA) * season
+        else:
+            # First visit of this hour of the week: take the deviation as is
+            self.seasonal[slot] = value - self.level
+            self.seen[slot] = True
+
+        self.buckets_observed += 1
+        if self.state_path:
+            self._save()
+
+    def forecast(self, now: datetime, horizon_seconds: float) -> Optional[float]:
+        """Peak expected demand between ``now`` and ``now + horizon_seconds``.
+
+        Returns:
+            Forecast demand in runners, or None until a bucket has completed
+        """
+        if self.level is None:
+            return None
+        start = _bucket_start(now)
+        end = _bucket_start(now + timedelta(seconds=max(0.0, horizon_seconds)))
+        peak = 0.0
+        steps, damped, bucket = 0, 0.0, start
+        while bucket <= end:
+            steps += 1
+            damped += PHI**steps
+            value = self.level + damped * self.trend + self.seasonal[season_slot(bucket)]
+            peak = max(peak, value)
+            bucket += BUCKET
+        return peak
+
+    def _save(self) -> None:
+        """Write the model atomically to ``state_path``."""
+        state = {
+            "level": self.level,
+            "trend": self.trend,
+            "seasonal": self.seasonal,
+            "seen": self.seen,
+            "buckets_observed": self.buckets_observed,
+        }
+        tmp_path = f"{self.state_path}.tmp"
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(state, f)
+            os.replace(tmp_path, self.state_path)  # type: ignore[arg-type]
+        except OSError as e:
+            logger.warning("Failed to persist demand forecast", error=str(e))
+
+    def _load(self) -> None:
+        """Restore a model saved by :meth:`_save`; start fresh if unusable."""
+        try:
+            with open(self.state_path) as f:  # type: ignore[arg-type]
+                state = json.load(f)
+            seasonal = [float(v) for v in state["seasonal"]]
+            seen = [bool(v) for v in state["seen"]]
+            if len(seasonal) != SEASON_SLOTS or len(seen) != SEASON_SLOTS:
+                raise ValueError("unexpected season length")
+            level = state["level"]
+            self.level = None if level is None else float(level)
+            self.trend = float(state["trend"])
+            self.seasonal, self.seen = seasonal, seen
+            self.buckets_observed = int(state.get("buckets_observed", 0))
+            logger.info(
+                "Loaded demand forecast", buckets_observed=self.buckets_observed
+            )
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable demand forecast", error=str(e))
+
+    def stats(self, now: datetime, horizon_seconds: float) -> Dict[str, Any]:
+        """Return model state for status reporting."""
+        forecast = self.forecast(now, horizon_seconds)
+        return {
+            "level": None if self.level is None else round(self.level, 2),
+            "trend": round(self.trend, 3),
+            "buckets_observed": self.buckets_observed,
+            "seasonal_slots_seen": sum(self.seen),
+            "forecast": None if forecast is None else round(forecast, 2),
+        }
+
+
+def forecast_target(forecast: Optional[float]) -> int:
+    """Runners needed to serve a forecast demand (0 if there is none yet)."""
+    if forecast is None or forecast <= 0:
+        return 0
+    return math.ceil(forecast)
@@ -1,19 +1,75 @@
 """GitHub API client for managing runners."""
 
-from typing import List, Dict, Optional, Any
+import asyncio
+import math
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, List, Dict, Optional, Any, FrozenSet, Set, Tuple
 
 import httpx
 import structlog
-from tenacity import retry, stop_after_attempt, wait_exponential
+from tenacity import retry, retry_if_exception, stop_after_attempt
+
+from .demand import labels_satisfiable
+from .rate_limit import (
+    Priority,
+    RateLimitExceeded,
+    RateLimitScheduler,
+    should_retry,
+    should_retry_unsent,
+    wait_rate_limit,
+)
+from .utils.http_cache import ConditionalRequestCache
+from .utils.request_budget import RequestBudget
+from .utils.singleflight import SingleFlight
 
 logger = structlog.get_logger()
 
+# Largest page size the GitHub REST API accepts
+PER_PAGE = 100
+
+
+def _link_urls(response: httpx.Response) -> Dict[str, str]:
+    """Map ``Link`` header relations (``next``, ``last``, ...) to URLs."""
+    return {
+        rel: link["url"] for rel, link in response.links.items() if link.get("url")
+    }
+
+
+def _last_page(body: Any, links: Dict[str, str]) -> Optional[int]:
+    """Number of pages of a listing, or None if it cannot be determined."""
+    if "next" not in links:
+        return 1
+    if isinstance(body, dict) and isinstance(body.get("total_count"), int):
+        return max(1, math.ceil(body["total_count"] / PER_PAGE))
+    if "last" in links:
+        page = httpx.URL(links["last"]).params.get("page")
+        if page and page.isdigit():
+            return int(page)
+    return None
+
 
 class GitHubClient:
     """GitHub API client for runner management."""
 
     def __init__(
-        self, token: str, org: Optional[str] = None, repo: Optional[str] = None
+        self,
+        token: str,
+        org: Optional[str] = None,
+        repo: Optional[str] = None,
+        http2: bool = True,
+        max_connections: int = 20,
+        max_keepalive_connections: int = 10,
+        keepalive_expiry: float = 60.0,
+        timeout: float = 10.0,
+        conditional_requests: bool = True,
+        response_cache_size: int = 256,
+        read_freshness: float = 0.0,
+        runner_labels: Optional[FrozenSet[str]] = None,
+        jobs_concurrency: int = 8,
+        org_repo_cache_ttl: float = 600.0,
+        demand_request_budget: Optional[int] = None,
+        rate_limiter: Optional[RateLimitScheduler] = None,
+        token_refresh_margin: float = 300.0,
     ):
         """Initialize GitHub client.
 
@@ -21,12 +77,60 @@ class GitHubClient:
             token: GitHub Personal Access Token (fine-grained supported)
             org: GitHub organization (optional)
             repo: GitHub repository in format "owner/repo" (optional)
+            http2: Multiplex requests over HTTP/2 if the h2 package is installed
+            max_connections: Upper bound on pooled connections
+            max_keepalive_connections: Idle connections kept open for reuse
+            keepalive_expiry: Seconds before an idle connection is closed
+            timeout: Per-request timeout in seconds
+            conditional_requests: Revalidate cached GET responses with ETags
+            response_cache_size: Maximum number of cached GET responses
+            read_freshness: Seconds a listing result is shared with later callers
+            runner_labels: Labels our runners carry; queued jobs needing other
+                labels are not counted as demand (None counts every job)
+            jobs_concurrency: Maximum concurrent listing page requests (runner
+                pages, per-repo run listings, per-run job listings)
+            org_repo_cache_ttl: Seconds the organization repository list is cached
+            demand_request_budget: Maximum fan-out requests per demand cycle
+                (None for unlimited)
+            rate_limiter: Scheduler tracking this token's rate-limit budget
+            token_refresh_margin: Seconds before expiry a cached registration
+                token stops being handed out (refreshed in the background
+                during the margin before that)
         """
         self.token = token
         self.org = org
         self.repo = repo
         self.base_url = "https://api.github.com"
 
+        self.http2 = http2
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.timeout = httpx.Timeout(timeout)
+        self._client: Optional[httpx.AsyncClient] = None
+        self.response_cache: Optional[ConditionalRequestCache] = (
+            ConditionalRequestCache(max_entries=response_cache_size)
+            if conditional_requests
+            else None
+        )
+        # Concurrent pollers share one in-flight listing per resource
+        self._reads = SingleFlight(ttl=read_freshness)
+        self.runner_labels = runner_labels
+        self._fanout_semaphore = asyncio.Semaphore(max(1, jobs_concurrency))
+        self._org_repos = SingleFlight(ttl=org_repo_cache_ttl)
+        # Rotation offset into the less recently pushed repositories
+        self._repo_cursor = 0
+        self.demand_request_budget = demand_request_budget
+        self.rate_limiter = rate_limiter or RateLimitScheduler()
+
+        # Registration tokens are valid for an hour; share one between creates
+        self.token_refresh_margin = timedelta(seconds=token_refresh_margin)
+        self._registration_token: Optional[Tuple[str, datetime]] = None
+        self._token_refresh = SingleFlight()
+        self._background: Set["asyncio.Task[Any]"] = set()
+
         # Determine the API endpoint based on org vs repo
         if org:
             self.runners_url = f"{self.base_url}/orgs/{org}/actions/runners"
@@ -49,6 +153,206 @@ class GitHubClient:
             "User-Agent": "GitHub-Actions-Runner-Orchestrator/2.0.0",
         }
 
+    async def open(self) -> None:
+        """Open the shared, connection-pooled HTTP client."""
+        if self._client is not None and not self._client.is_closed:
+            return
+
+        try:
+            self._client = httpx.AsyncClient(
+                http2=self.http2, limits=self.limits, timeout=self.timeout
+            )
+        except ImportError:
+            # HTTP/2 needs the optional h2 package; HTTP/1.1 keep-alive still
+            # avoids the per-request handshake.
+            logger.warning("HTTP/2 support not installed, falling back to HTTP/1.1")
+            self._client = httpx.AsyncClient(limits=self.limits, timeout=self.timeout)
+
+        logger.debug(
+            "Opened GitHub HTTP client",
+            http2=self.http2,
+            max_connections=self.limits.max_connections,
+        )
+
+    async def close(self) -> None:
+        """Close the shared HTTP client and release pooled connections."""
+        for task in list(self._background):
+            task.cancel()
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+            logger.debug("Closed GitHub HTTP client")
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared HTTP client, opening it on first use."""
+        if self._client is None or self._client.is_closed:
+            await self.open()
+        return self._client  # type: ignore[return-value]
+
+    async def _request(
+        self,
+        method: str,
+        url: str,
+        priority: Priority = Priority.NORMAL,
+        headers: Optional[Dict[str, str]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+    ) -> httpx.Response:
+        """Send a request through the rate-limit scheduler.
+
+        Every GitHub call goes through here so the remaining budget is known
+        before the next one is sent.
+
+        Raises:
+            RateLimitExceeded: The scheduler deferred the request, or GitHub
+                refused it with a primary/secondary rate limit
+        """
+        await self.rate_limiter.acquire(priority)
+        client = await self._get_client()
+        response = await client.request(
+            method,
+            url,
+            headers={**self.headers, **(headers or {})},
+            params=params,
+            json=json,
+        )
+        retry_after = self.rate_limiter.update(response)
+        if retry_after is not None:
+            raise RateLimitExceeded(
+                f"GitHub API rate limit hit ({response.status_code})",
+                retry_after=retry_after,
+            )
+        return response
+
+    async def _get_page(
+        self,
+        url: str,
+        params: Optional[Dict[str, Any]] = None,
+        priority: Priority = Priority.NORMAL,
+    ) -> Tuple[Any, Dict[str, str]]:
+        """GET a JSON resource and its ``Link`` header relations.
+
+        When a cached response exists its validators are sent as
+        ``If-None-Match``/``If-Modified-Since`` and a ``304 Not Modified``
+        answer is served from the cache without re-parsing.
+
+        Returns:
+            The parsed body and a mapping of link relation to URL
+        """
+        cache = self.response_cache
+        if cache is None:
+            response = await self._request("GET", url, priority, params=params)
+            response.raise_for_status()
+            return response.json(), _link_urls(response)
+
+        key = cache.make_key(url, params)
+        response = await self._request(
+            "GET", url, priority, headers=cache.conditional_headers(key), params=params
+        )
+
+        if response.status_code == 304:
+            cached = cache.get(key)
+            if cached is not None:
+                cache.hits += 1
+                logger.debug("GitHub response not modified (cache hit)", url=url)
+                return cached.body, cached.links
+            # Entry was evicted between the request and the reply; refetch plainly
+            response = await self._request("GET", url, priority, params=params)
+
+        response.raise_for_status()
+        cache.misses += 1
+        body = response.json()
+        links = _link_urls(response)
+        cache.store(
+            key,
+            body,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+            links=links,
+        )
+        return body, links
+
+    async def paginate(
+        self,
+        url: str,
+        items_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: Priority = Priority.NORMAL,
+        budget: Optional[RequestBudget] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """Stream every item of a paginated listing.
+
+        The first page is fetched alone; once the page count is known (from
+        ``total_count`` or the ``Link: rel="last"`` relation) the remaining
+        pages are fetched concurrently and yielded in order. Listings that only
+        advertise ``rel="next"`` are followed page by page.
+
+        Args:
+            url: Listing endpoint
+            items_key: Body key holding the items (None if the body is a list)
+            params: Extra query parameters
+            priority: Rate-limit priority of every page request
+            budget: Request budget charged one request per page; pages it
+                cannot pay for are skipped
+
+        Yields:
+            Items across all pages, in API order
+        """
+        base = {**(params or {}), "per_page": PER_PAGE}
+
+        async def fetch(page: int) -> Tuple[Any, Dict[str, str]]:
+            async with self._fanout_semaphore:
+                return await self._get_page(url, {**base, "page": page}, priority)
+
+        def items(body: Any) -> List[Dict[str, Any]]:
+            return body.get(items_key, []) if items_key else body
+
+        def affordable() -> bool:
+            return budget is None or budget.try_spend()
+
+        if not affordable():
+            return
+        body, links = await fetch(1)
+        for item in items(body):
+            yield item
+
+        last_page = _last_page(body, links)
+        if last_page is None:
+            # Page count unknown: follow rel="next" sequentially
+            page = 1
+            while "next" in links and affordable():
+                page += 1
+                body, links = await fetch(page)
+                for item in items(body):
+                    yield item
+            return
+
+        pages = [page for page in range(2, last_page + 1) if affordable()]
+        tasks = [asyncio.ensure_future(fetch(page)) for page in pages]
+        try:
+            for task in tasks:
+                body, _ = await task
+                for item in items(body):
+                    yield item
+        finally:
+            # Consumer stopped early or a page failed: drop the rest
+            for task in tasks:
+                task.cancel()
+
+    async def get_paginated(
+        self,
+        url: str,
+        items_key: Optional[str] = None,
+        params: Optional[Dict[str, Any]] = None,
+        priority: Priority = Priority.NORMAL,
+        budget: Optional[RequestBudget] = None,
+    ) -> List[Dict[str, Any]]:
+        """Materialize :meth:`paginate` into a list."""
+        return [
+            item
+            async for item in self.paginate(url, items_key, params, priority, budget)
+        ]
+
     async def validate_token(self) -> bool:
         """
         Validate the GitHub token and required permissions.
@@ -96,238 +400,543 @@ class GitHubClient:
             raise Exception(f"GitHub API error during validation: {code}")
 
         try:
-            async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-                # 1) Token validity
-                url = f"{self.base_url}/user"
+            # 1) Token validity
+            url = f"{self.base_url}/user"
+            try:
+                resp = await self._request("GET", url)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                _raise_perm("GET", url, e)
+
+            # Branch by target type
+            if self.org:
+                # 2) Org visibility
+                url = f"{self.base_url}/orgs/{self.org}"
                 try:
-                    resp = await client.get(url, headers=self.headers)
+                    resp = await self._request("GET", url)
                     resp.raise_for_status()
                 except httpx.HTTPStatusError as e:
                     _raise_perm("GET", url, e)
 
-                # Branch by target type
-                if self.org:
-                    # 2) Org visibility
-                    url = f"{self.base_url}/orgs/{self.org}"
-                    try:
-                        resp = await client.get(url, headers=self.headers)
-                        resp.raise_for_status()
-                    except httpx.HTTPStatusError as e:
-                        _raise_perm("GET", url, e)
-
-                    # 3) Read access to runners list (org)
-                    url = self.runners_url  # /orgs/{org}/actions/runners
-                    try:
-                        resp = await client.get(url, headers=self.headers)
-                        resp.raise_for_status()
-                    except httpx.HTTPStatusError as e:
-                        _raise_perm("GET", url, e)
-
-                    # 4) Write/admin permission: create registration token (org)
-                    url = (
-                        self.registration_url
-                    )  # /orgs/{org}/actions/runners/registration-token
-                    try:
-                        resp = await client.post(url, headers=self.headers)
-                        resp.raise_for_status()
-                    except httpx.HTTPStatusError as e:
-                        _raise_perm("POST", url, e)
-
-                    data = resp.json()
-                    if not isinstance(data, dict) or "token" not in data:
-                        logger.error(
-                            "Unexpected registration-token response payload (org)"
-                        )
-                        raise Exception(
-                            "Unexpected GitHub response while validating token permissions"
-                        )
-
-                    logger.info("GitHub token validation successful (org)")
-                    return True
-
-                # Repo flow
-                owner_repo = (self.repo or "").strip()
-                if "/" not in owner_repo:
-                    raise ValueError("repo must be in 'owner/repo' format")
-                owner, repo = owner_repo.split("/", 1)
-
-                # 2) Repo visibility
-                url = f"{self.base_url}/repos/{owner}/{repo}"
+                # 3) Read access to runners list (org)
+                url = self.runners_url  # /orgs/{org}/actions/runners
                 try:
-                    resp = await client.get(url, headers=self.headers)
+                    resp = await self._request("GET", url)
                     resp.raise_for_status()
                 except httpx.HTTPStatusError as e:
                     _raise_perm("GET", url, e)
 
-                # 3) STRICT: can we mint a registration token at repo scope?
-                # (This is the most authoritative check for runner admin on the repo
-                #  and avoids misleading 403s that sometimes occur when listing runners.)
+                # 4) Write/admin permission: create registration token (org)
                 url = (
                     self.registration_url
-                )  # /repos/{owner}/{repo}/actions/runners/registration-token
+                )  # /orgs/{org}/actions/runners/registration-token
                 try:
-                    reg_resp = await client.post(url, headers=self.headers)
-                    reg_resp.raise_for_status()
+                    resp = await self._request("POST", url)
+                    resp.raise_for_status()
                 except httpx.HTTPStatusError as e:
                     _raise_perm("POST", url, e)
 
-                data = reg_resp.json()
+                data = resp.json()
                 if not isinstance(data, dict) or "token" not in data:
                     logger.error(
-                        "Unexpected registration-token response payload (repo)"
+                        "Unexpected registration-token response payload (org)"
                     )
                     raise Exception(
                         "Unexpected GitHub response while validating token permissions"
                     )
+                # The token minted for validation is good for the first creates
+                self._store_registration_token(data)
 
-                # 4) Optional: read runners list for diagnostics; ignore failures here
-                # Some fine-grained PATs can create registration tokens but still 403 on list
-                # if "Self-hosted runners: Read" wasn't granted. That shouldn't fail validation.
-                url = self.runners_url  # /repos/{owner}/{repo}/actions/runners
-                try:
-                    runners_read = await client.get(url, headers=self.headers)
-                    runners_read.raise_for_status()
-                except httpx.HTTPStatusError as e:
-                    logger.warning(
-                        "Repo runners list not readable with this token (continuing)",
-                        method="GET",
-                        url=url,
-                        status_code=e.response.status_code,
-                    )
-
-                logger.info("GitHub token validation successful (repo)")
+                logger.info("GitHub token validation successful (org)")
                 return True
 
+            # Repo flow
+            owner_repo = (self.repo or "").strip()
+            if "/" not in owner_repo:
+                raise ValueError("repo must be in 'owner/repo' format")
+            owner, repo = owner_repo.split("/", 1)
+
+            # 2) Repo visibility
+            url = f"{self.base_url}/repos/{owner}/{repo}"
+            try:
+                resp = await self._request("GET", url)
+                resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                _raise_perm("GET", url, e)
+
+            # 3) STRICT: can we mint a registration token at repo scope?
+            # (This is the most authoritative check for runner admin on the repo
+            #  and avoids misleading 403s that sometimes occur when listing runners.)
+            url = (
+                self.registration_url
+            )  # /repos/{owner}/{repo}/actions/runners/registration-token
+            try:
+                reg_resp = await self._request("POST", url)
+                reg_resp.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                _raise_perm("POST", url, e)
+
+            data = reg_resp.json()
+            if not isinstance(data, dict) or "token" not in data:
+                logger.error(
+                    "Unexpected registration-token response payload (repo)"
+                )
+                raise Exception(
+                    "Unexpected GitHub response while validating token permissions"
+                )
+            # The token minted for validation is good for the first creates
+            self._store_registration_token(data)
+
+            # 4) Optional: read runners list for diagnostics; ignore failures here
+            # Some fine-grained PATs can create registration tokens but still 403 on list
+            # if "Self-hosted runners: Read" wasn't granted. That shouldn't fail validation.
+            url = self.runners_url  # /repos/{owner}/{repo}/actions/runners
+            try:
+                runners_read = await self._request("GET", url)
+                runners_read.raise_for_status()
+            except httpx.HTTPStatusError as e:
+                logger.warning(
+                    "Repo runners list not readable with this token (continuing)",
+                    method="GET",
+                    url=url,
+                    status_code=e.response.status_code,
+                )
+
+            logger.info("GitHub token validation successful (repo)")
+            return True
+
         except Exception as e:
             logger.error("GitHub token validation failed", error=str(e))
             raise Exception(f"Token validation failed: {e}")
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
     )
+    async def _fetch_registration_token(self) -> str:
+        """Mint a new registration token and cache it until it expires."""
+        response = await self._request(
+            "POST", self.registration_url, Priority.CRITICAL
+        )
+        response.raise_for_status()
+        return self._store_registration_token(response.json())
+
+    def _store_registration_token(self, data: Dict[str, Any]) -> str:
+        """Cache a registration-token payload (``token`` + ``expires_at``)."""
+        token = data["token"]
+        try:
+            expires_at = datetime.fromisoformat(
+                str(data["expires_at"]).replace("Z", "+00:00")
+            )
+        except (KeyError, ValueError):
+            # Documented lifetime is one hour
+            expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+        self._registration_token = (token, expires_at)
+        logger.debug("Cached registration token", expires_at=expires_at.isoformat())
+        return token
+
     async def get_registration_token(self) -> str:
-        """Get a registration token for new runners."""
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            response = await client.post(self.registration_url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            return data["token"]
+        """Get a registration token for new runners.
+
+        The current token is reused until ``token_refresh_margin`` before it
+        expires. During the margin before that it is still returned while a
+        replacement is fetched in the background. Concurrent refreshes are
+        deduplicated.
+        """
+        cached = self._registration_token
+        if cached is not None:
+            token, expires_at = cached
+            remaining = expires_at - datetime.now(timezone.utc)
+            if remaining > self.token_refresh_margin * 2:
+                return token
+            if remaining > self.token_refresh_margin:
+                self._refresh_registration_token_in_background()
+                return token
+
+        return await self._token_refresh.do(
+            "registration_token", self._fetch_registration_token
+        )
+
+    def _refresh_registration_token_in_background(self) -> None:
+        """Start (or join) a registration-token refresh without awaiting it."""
+        task = asyncio.ensure_future(
+            self._token_refresh.do("registration_token", self._fetch_registration_token)
+        )
+        self._background.add(task)
+        task.add_done_callback(self._on_background_refresh_done)
+
+    def _on_background_refresh_done(self, task: "asyncio.Task[Any]") -> None:
+        """Log failed background refreshes; the next create retries inline."""
+        self._background.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            logger.warning(
+                "Background registration token refresh failed",
+                error=str(task.exception()),
+            )
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry_unsent),
     )
-    async def get_all_runners(self) -> List[Dict[str, Any]]:
-        """Get list of ALL runners including actions-runner-* ones we don't manage."""
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            response = await client.get(self.runners_url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            return data.get("runners", [])
+    async def generate_jit_config(
+        self,
+        name: str,
+        labels: List[str],
+        runner_group_id: int = 1,
+        work_folder: str = "_work",
+    ) -> Dict[str, Any]:
+        """Register a just-in-time runner and return its encoded configuration.
+
+        The runner is registered server-side, so the container can start
+        ``run.sh --jitconfig`` directly without running ``config.sh``. JIT
+        runners are ephemeral: GitHub removes them after one job.
+
+        The POST is not idempotent, so it is only retried when GitHub never
+        received it. A request that timed out after being sent may still
+        have registered the runner; that registration is deleted before the
+        error is raised. A 409 name conflict (left by such an attempt) is
+        resolved by deleting the existing runner and registering again.
+
+        Args:
+            name: Runner name
+            labels: Labels to register the runner with
+            runner_group_id: Runner group (1 is the default group)
+            work_folder: Runner work directory
+
+        Returns:
+            ``{"runner": {...}, "encoded_jit_config": "..."}``
+        """
+        url = f"{self.runners_url}/generate-jitconfig"
+        payload = {
+            "name": name,
+            "runner_group_id": runner_group_id,
+            "labels": labels,
+            "work_folder": work_folder,
+        }
+        try:
+            response = await self._request("POST", url, Priority.CRITICAL, json=payload)
+            if response.status_code == 409:
+                logger.warning("JIT runner name already registered, replacing", name=name)
+                await self._delete_runner_named(name)
+                response = await self._request(
+                    "POST", url, Priority.CRITICAL, json=payload
+                )
+        except (httpx.TimeoutException, httpx.RemoteProtocolError) as e:
+            if not should_retry_unsent(e):
+                # GitHub may have registered the runner without us seeing it
+                await self._delete_runner_named(name)
+            raise
+        response.raise_for_status()
+        # A new registration exists; don't serve a stale listing
+        self._reads.forget("runners")
+        return response.json()
+
+    async def _delete_runner_named(self, name: str) -> None:
+        """Delete the registration called ``name``, if one exists (best effort)."""
+        self._reads.forget("runners")
+        try:
+            runners = await self.get_all_runners(Priority.CRITICAL)
+            for runner in runners:
+                if runner.get("name") == name:
+                    await self.delete_runner(runner["id"])
+        except Exception as e:
+            logger.warning(
+                "Failed to delete runner registration", name=name, error=str(e)
+            )
+
+    def invalidate_registration_token(self) -> None:
+        """Drop the cached registration token (e.g. after GitHub rejected it)."""
+        self._registration_token = None
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
     )
-    async def get_runners(self) -> List[Dict[str, Any]]:
+    async def _fetch_all_runners(
+        self, priority: Priority = Priority.NORMAL
+    ) -> List[Dict[str, Any]]:
+        """Fetch every page of the runner listing from the GitHub API."""
+        return await self.get_paginated(self.runners_url, "runners", priority=priority)
+
+    async def get_all_runners(
+        self, priority: Priority = Priority.NORMAL
+    ) -> List[Dict[str, Any]]:
+        """Get list of ALL runners including actions-runner-* ones we don't manage.
+
+        Concurrent callers share one listing, fetched at the first caller's
+        ``priority``.
+        """
+        return list(
+            await self._reads.do("runners", lambda: self._fetch_all_runners(priority))
+        )
+
+    async def get_runners(
+        self, priority: Priority = Priority.NORMAL
+    ) -> List[Dict[str, Any]]:
         """Get list of all runners, excluding actions-runner-* runners from management."""
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            response = await client.get(self.runners_url, headers=self.headers)
-            response.raise_for_status()
-            data = response.json()
-            all_runners = data.get("runners", [])
-
-            # Filter out existing actions-runner-* runners that we should not manage
-            managed_runners = []
-            for runner in all_runners:
-                runner_name = runner.get("name", "")
-                if runner_name.startswith("actions-runner-"):
-                    logger.debug(
-                        "Ignoring existing actions-runner from GitHub API",
-                        name=runner_name,
+        all_runners = await self.get_all_runners(priority)
+
+        # Filter out existing actions-runner-* runners that we should not manage
+        managed_runners = []
+        for runner in all_runners:
+            runner_name = runner.get("name", "")
+            if runner_name.startswith("actions-runner-"):
+                logger.debug(
+                    "Ignoring existing actions-runner from GitHub API",
+                    name=runner_name,
+                )
+                continue
+            managed_runners.append(runner)
+
+        return managed_runners
+
+    async def get_org_repositories(self) -> List[str]:
+        """Get active repositories of the organization, most recently pushed first.
+
+        The listing is cached for ``org_repo_cache_ttl`` seconds.
+        """
+        if not self.org:
+            return [self.repo] if self.repo else []
+        return list(await self._org_repos.do("repos", self._fetch_org_repositories))
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
+    )
+    async def _fetch_org_repositories(self) -> List[str]:
+        """Fetch every repository of the organization from the GitHub API."""
+        url = f"{self.base_url}/orgs/{self.org}/repos"
+        repos = await self.get_paginated(url, priority=Priority.CRITICAL)
+
+        # Archived/disabled repositories cannot run workflows
+        active = [r for r in repos if not r.get("archived") and not r.get("disabled")]
+        # Recently pushed repositories are the likeliest to have queued jobs, so
+        # they are queried first when the request budget runs short
+        active.sort(key=lambda r: r.get("pushed_at") or "", reverse=True)
+
+        logger.info(
+            "Discovered organization repositories",
+            org=self.org,
+            total=len(repos),
+            active=len(active),
+        )
+        return [r["full_name"] for r in active]
+
+    def _select_repositories(
+        self, repos: List[str], budget: Optional[RequestBudget]
+    ) -> List[str]:
+        """Repositories one demand cycle's run listings can afford to query.
+
+        Every repository costs at least one request per listed status
+        (queued and in-progress). When the budget cannot cover them all, the
+        most recently pushed half of the affordable slots is queried every
+        cycle and the other half rotates through the remaining repositories,
+        so each is polled within a bounded number of cycles.
+        """
+        limit = budget.limit if budget is not None else None
+        affordable = limit // 2 if limit else len(repos)
+        if affordable >= len(repos):
+            return repos
+        hot = affordable // 2
+        cold = repos[hot:]
+        start = self._repo_cursor % len(cold)
+        window = (cold[start:] + cold[:start])[: affordable - hot]
+        self._repo_cursor = start + len(window)
+        logger.debug(
+            "Request budget covers part of the organization this cycle",
+            repositories=len(repos),
+            queried=hot + len(window),
+            rotation_start=start,
+        )
+        return repos[:hot] + window
+
+    async def get_workflow_runs(
+        self,
+        status: str = "queued",
+        repo: Optional[str] = None,
+        budget: Optional[RequestBudget] = None,
+        repos: Optional[List[str]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get workflow runs by status.
+
+        Args:
+            status: Run status to filter by
+            repo: Repository ("owner/repo"); in org mode None means every
+                active repository of the organization (or ``repos``)
+            budget: Request budget for the current demand cycle
+            repos: Org repositories to query instead of all of them
+
+        Returns:
+            Matching runs; repositories skipped for budget reasons contribute none
+        """
+        if repo is None and self.org:
+            if repos is None:
+                repos = await self.get_org_repositories()
+            results = await asyncio.gather(
+                *(self.get_workflow_runs(status, r, budget) for r in repos),
+                return_exceptions=True,
+            )
+            runs: List[Dict[str, Any]] = []
+            for r, result in zip(repos, results):
+                if isinstance(result, BaseException):
+                    # One repository (e.g. Actions disabled) must not blind the rest
+                    logger.warning(
+                        "Failed to get workflow runs", repo=r, error=str(result)
                     )
                     continue
-                managed_runners.append(runner)
-
-            return managed_runners
+                runs.extend(result)
+            return runs
+
+        repo = repo or self.repo
+        return list(
+            await self._reads.do(
+                ("workflow_runs", repo, status),
+                lambda: self._fetch_workflow_runs(repo, status, budget),
+            )
+        )
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
     )
-    async def get_workflow_runs(self, status: str = "queued") -> List[Dict[str, Any]]:
-        """Get workflow runs by status."""
-        if self.org:
-            # For organization-level runners, we can't get workflow runs directly
-            # The GitHub API doesn't support /orgs/{org}/actions/runs
-            # Instead, we'll return an empty list and rely on runner count-based scaling
-            logger.debug(
-                "Organization-level workflow run monitoring not supported by GitHub API",
-                org=self.org,
-                status=status,
+    async def _fetch_workflow_runs(
+        self, repo: str, status: str, budget: Optional[RequestBudget] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch workflow runs of one repository by status from the GitHub API."""
+        url = f"{self.base_url}/repos/{repo}/actions/runs"
+        return await self.get_paginated(
+            url, "workflow_runs", {"status": status}, Priority.CRITICAL, budget
+        )
+
+    async def get_run_jobs(
+        self,
+        run_id: int,
+        repo: Optional[str] = None,
+        budget: Optional[RequestBudget] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get the jobs of one workflow run (latest attempt)."""
+        repo = repo or self.repo
+        return list(
+            await self._reads.do(
+                ("run_jobs", repo, run_id),
+                lambda: self._fetch_run_jobs(repo, run_id, budget),
             )
-            return []
-        else:
-            url = f"{self.base_url}/repos/{self.repo}/actions/runs"
-            params = {"status": status, "per_page": 100}
+        )
+
+    @retry(
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
+    )
+    async def _fetch_run_jobs(
+        self, repo: str, run_id: int, budget: Optional[RequestBudget] = None
+    ) -> List[Dict[str, Any]]:
+        """Fetch the jobs of a workflow run from the GitHub API."""
+        url = f"{self.base_url}/repos/{repo}/actions/runs/{run_id}/jobs"
+        # A matrix can hold up to 256 jobs, i.e. more than one page
+        return await self.get_paginated(
+            url, "jobs", {"filter": "latest"}, Priority.CRITICAL, budget
+        )
+
+    async def get_queued_jobs(self) -> List[Dict[str, Any]]:
+        """Get queued jobs our runners can serve, across queued and in-progress runs.
+
+        A run with a matrix fans out into many jobs, so demand is counted per
+        job. In-progress runs are included because later jobs of a running
+        workflow (``needs:`` chains, partially started matrices) queue there.
+        Concurrent callers share one demand cycle.
+        """
+        return list(await self._reads.do("queued_jobs", self._collect_queued_jobs))
 
-            async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-                response = await client.get(url, headers=self.headers, params=params)
-                response.raise_for_status()
-                data = response.json()
-                return data.get("workflow_runs", [])
+    async def _collect_queued_jobs(self) -> List[Dict[str, Any]]:
+        """Run one demand cycle within the per-cycle request budget.
+
+        Run listings may use at most half of the budget so that job listings
+        (which carry the actual demand) are never starved. Organization
+        repositories the run budget cannot cover are rotated through across
+        cycles (see :meth:`_select_repositories`).
+        """
+        limit = self.demand_request_budget or None
+        runs_budget = RequestBudget(limit // 2 if limit else None)
+        repos = (
+            self._select_repositories(await self.get_org_repositories(), runs_budget)
+            if self.org
+            else None
+        )
+        queued_runs, in_progress_runs = await asyncio.gather(
+            self.get_workflow_runs("queued", budget=runs_budget, repos=repos),
+            self.get_workflow_runs("in_progress", budget=runs_budget, repos=repos),
+        )
+        runs = {
+            run["id"]: (run.get("repository") or {}).get("full_name") or self.repo
+            for run in queued_runs + in_progress_runs
+        }
+        jobs_budget = RequestBudget(limit - runs_budget.spent if limit else None)
+        job_lists = await asyncio.gather(
+            *(self.get_run_jobs(rid, repo, jobs_budget) for rid, repo in runs.items())
+        )
+
+        queued_jobs = []
+        unserviceable = 0
+        for jobs in job_lists:
+            for job in jobs:
+                if job.get("status") != "queued":
+                    continue
+                if self.runner_labels is not None and not labels_satisfiable(
+                    job.get("labels") or [], self.runner_labels
+                ):
+                    unserviceable += 1
+                    continue
+                queued_jobs.append(job)
+
+        skipped = runs_budget.denied + jobs_budget.denied
+        if skipped:
+            logger.warning(
+                "GitHub request budget exhausted, demand may be under-counted",
+                budget=limit,
+                skipped_requests=skipped,
+            )
+        logger.debug(
+            "Job demand analysis",
+            runs=len(runs),
+            queued_jobs=len(queued_jobs),
+            unserviceable_jobs=unserviceable,
+            requests=runs_budget.spent + jobs_budget.spent,
+        )
+        return queued_jobs
 
     @retry(
-        stop=stop_after_attempt(3), wait=wait_exponential(multiplier=1, min=4, max=10)
+        stop=stop_after_attempt(3),
+        wait=wait_rate_limit(),
+        retry=retry_if_exception(should_retry),
     )
     async def delete_runner(self, runner_id: int) -> bool:
         """Delete a runner."""
         url = f"{self.runners_url}/{runner_id}"
-        async with httpx.AsyncClient(timeout=httpx.Timeout(10.0)) as client:
-            response = await client.delete(url, headers=self.headers)
-            if response.status_code == 204:
-                return True
-            elif response.status_code == 404:
-                logger.warning("Runner not found for deletion", runner_id=runner_id)
-                return True
-            else:
-                response.raise_for_status()
-                return False
+        response = await self._request("DELETE", url)
+        if response.status_code in (204, 404):
+            # The runner set changed; don't serve a stale listing to the next caller
+            self._reads.forget("runners")
+        if response.status_code == 204:
+            return True
+        elif response.status_code == 404:
+            logger.warning("Runner not found for deletion", runner_id=runner_id)
+            return True
+        else:
+            response.raise_for_status()
+            return False
 
-    async def get_queue_length(self) -> int:
-        """Get the current queue length of pending workflow runs, considering runner availability."""
+    async def get_queued_job_count(self) -> int:
+        """Get the number of queued jobs our runners can serve (0 if unknown)."""
         try:
-            if self.org:
-                # For organization-level runners, queue-based scaling is not supported
-                logger.debug(
-                    "Queue-based scaling disabled for organization-level runners",
-                    org=self.org,
-                )
-                return 0
-
-            queued_runs = await self.get_workflow_runs("queued")
-            in_progress_runs = await self.get_workflow_runs("in_progress")
-            github_runners = await self.get_runners()
-            available_runners = len(
-                [
-                    r
-                    for r in github_runners
-                    if r.get("status") == "online" and not r.get("busy", False)
-                ]
-            )
-
-            total_demand = len(queued_runs) + len(in_progress_runs)
-            queue_length = max(0, total_demand - available_runners)
-
-            logger.debug(
-                "Queue analysis",
-                queued_runs=len(queued_runs),
-                in_progress_runs=len(in_progress_runs),
-                available_runners=available_runners,
-                total_demand=total_demand,
-                calculated_queue_length=queue_length,
-            )
-
-            return queue_length
+            return len(await self.get_queued_jobs())
         except Exception as e:
-            logger.error("Failed to get queue length", error=str(e))
+            logger.error("Failed to get queued jobs", error=str(e))
             return 0
 
     async def get_runner_url(self) -> str:
@@ -1,6 +1,7 @@
 """Main orchestrator that manages GitHub Actions runners."""
 
 import asyncio
+import time
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timezone
 import uuid
@@ -9,7 +10,25 @@ import structlog
 
 from .config import settings
 from .github_client import GitHubClient
-from .docker_client import DockerClient
+from .rate_limit import Priority, RateLimitScheduler
+from .docker_cluster import DockerCluster
+from .forecast import DemandForecaster
+from .demand import (
+    DemandTracker,
+    entrypoint_labels,
+    labels_satisfiable,
+    runner_label_set,
+)
+from .reconciler import (
+    DEAD_STATUSES,
+    ClusterSnapshot,
+    ReconcilePlan,
+    Reconciler,
+    RunnerRemoval,
+)
+from .scaling_policy import uses_forecast
+from .utils.token_bucket import TokenBucket
+from .warm_pool import WarmPool
 
 logger = structlog.get_logger()
 
@@ -19,12 +38,74 @@ class RunnerOrchestrator:
 
     def __init__(self):
         """Initialize the orchestrator."""
+        # Labels our runners register with; jobs needing others are not demand
+        self.runner_labels = runner_label_set(
+            settings.runner_labels, settings.runner_no_default_labels
+        )
         self.github_client = GitHubClient(
             token=settings.github_token,
             org=settings.github_org,
             repo=settings.github_repo,
+            http2=settings.github_http2,
+            max_connections=settings.github_max_connections,
+            max_keepalive_connections=settings.github_max_keepalive_connections,
+            keepalive_expiry=settings.github_keepalive_expiry,
+            timeout=settings.github_request_timeout,
+            conditional_requests=settings.github_conditional_requests,
+            response_cache_size=settings.github_response_cache_size,
+            read_freshness=settings.read_freshness_window,
+            runner_labels=self.runner_labels,
+            jobs_concurrency=settings.github_jobs_concurrency,
+            org_repo_cache_ttl=settings.github_org_repo_cache_ttl,
+            demand_request_budget=settings.github_demand_request_budget,
+            rate_limiter=RateLimitScheduler(
+                reserve=settings.github_rate_limit_reserve,
+                low_watermark=settings.github_rate_limit_low_watermark,
+                max_poll_multiplier=settings.github_rate_limit_max_poll_multiplier,
+            ),
+            token_refresh_margin=settings.registration_token_refresh_margin,
+        )
+        # One client per Docker host; placement picks the host for new runners
+        self.docker_client = DockerCluster()
+        # Webhook-fed job demand (only when a webhook secret is configured)
+        self.demand: Optional[DemandTracker] = (
+            DemandTracker(
+                stale_after=settings.webhook_job_ttl,
+                accepts=lambda labels: labels_satisfiable(labels, self.runner_labels),
+            )
+            if settings.github_webhook_secret
+            else None
+        )
+        # Booted standby containers waiting for a registration (0 disables)
+        self.warm_pool: Optional[WarmPool] = (
+            WarmPool(
+                self.docker_client,
+                self.github_client,
+                size=settings.warm_pool_size,
+                max_runners=settings.max_runners,
+            )
+            if settings.warm_pool_size > 0
+            else None
+        )
+        self.reconciler = Reconciler(
+            self.github_client,
+            self.docker_client,
+            demand=self.demand,
+            warm_pool=self.warm_pool,
+            forecaster=(
+                DemandForecaster(state_path=settings.predictive_state_path)
+                if uses_forecast()
+                else None
+            ),
         )
-        self.docker_client = DockerClient()
+        # Paces container creation so a large batch doesn't stampede Docker/GitHub
+        self._create_limiter = TokenBucket(
+            settings.runner_create_rate, settings.runner_create_burst
+        )
+        # Serializes reconcile ticks with manual scale requests from the API
+        self._reconcile_lock = asyncio.Lock()
+        # Set to run the next reconcile tick immediately instead of after the interval
+        self._reconcile_requested = asyncio.Event()
         self.is_running = False
         self.running_tasks: List[asyncio.Task] = []
         self.active_runners: Dict[str, Dict] = {}
@@ -36,12 +117,16 @@ class RunnerOrchestrator:
             "last_poll_time": None,
             "failed_scale_attempts": 0,  # Track consecutive failures
             "circuit_breaker_active": False,  # Emergency brake
+            "last_reconcile": None,  # Plan summary and duration of the last tick
         }
 
     async def start(self) -> None:
         """Start the orchestrator."""
         logger.info("Starting Runner Orchestrator")
 
+        # Open the shared GitHub connection pool used by every poller
+        await self.github_client.open()
+
         # Validate GitHub token before starting
         try:
             await self.github_client.validate_token()
@@ -51,18 +136,16 @@ class RunnerOrchestrator:
 
         self.is_running = True
 
-        # Start background tasks
+        # Track containers from the Docker events stream; deaths wake the loop
+        if settings.docker_events_enabled:
+            self.docker_client.start_event_watch(on_change=self._on_container_event)
+
+        # Single reconcile loop; its first tick brings up the minimum runners
         self.running_tasks = [
-            asyncio.create_task(self._monitor_queue()),
-            asyncio.create_task(self._manage_runners()),
-            asyncio.create_task(self._cleanup_dead_containers()),
-            asyncio.create_task(self._sync_runners()),
-            asyncio.create_task(self._monitor_runner_utilization()),
-            asyncio.create_task(self._maintain_minimum_runners()),
+            asyncio.create_task(self._reconcile_loop()),
         ]
-
-        # Initialize minimum runners
-        await self._scale_to_minimum()
+        # Work volume scrubbing and shared tool cache refresh on every host
+        self.docker_client.start_background()
 
         logger.info("Orchestrator started successfully")
 
@@ -77,595 +160,386 @@ class RunnerOrchestrator:
 
         # Wait for tasks to complete
         await asyncio.gather(*self.running_tasks, return_exceptions=True)
+        await self.docker_client.stop_background()
+        if self.warm_pool is not None:
+            await self.warm_pool.close()
+
+        # Release pooled GitHub connections
+        await self.github_client.close()
+        self.docker_client.close()
 
         logger.info("Orchestrator stopped")
 
-    async def _monitor_queue(self) -> None:
-        """Monitor GitHub Actions queue and trigger scaling decisions."""
-        while self.is_running:
-            try:
-                # EMERGENCY SAFETY CHECK: Count all containers before any scaling decision
-                try:
-                    docker_runners = await self.docker_client.get_runners()
-                    total_containers = len(
-                        [
-                            r
-                            for r in docker_runners
-                            if r["status"] in ["running", "created", "restarting"]
-                        ]
-                    )
+    def request_reconcile(self) -> None:
+        """Run the next reconcile tick now rather than at the end of the interval."""
+        self._reconcile_requested.set()
 
-                    # CIRCUIT BREAKER: If we have too many containers, activate emergency brake
-                    if total_containers >= settings.max_runners:
-                        if not self.metrics["circuit_breaker_active"]:
-                            logger.error(
-                                "EMERGENCY: Container limit reached, activating circuit breaker",
-                                total_containers=total_containers,
-                                max_allowed=settings.max_runners,
-                            )
-                            self.metrics["circuit_breaker_active"] = True
-
-                        # Skip all scaling operations
-                        await asyncio.sleep(settings.poll_interval)
-                        continue
-                    elif self.metrics["circuit_breaker_active"]:
-                        logger.info(
-                            "Circuit breaker deactivated, container count within limits",
-                            total_containers=total_containers,
-                            max_allowed=settings.max_runners,
-                        )
-                        self.metrics["circuit_breaker_active"] = False
+    def record_workflow_job(self, action: str, job: Dict[str, Any]) -> bool:
+        """Feed a ``workflow_job`` webhook delivery into demand tracking.
 
-                except Exception as container_check_error:
-                    logger.error(
-                        "Failed container safety check",
-                        error=str(container_check_error),
-                    )
-                    # If we can't count containers, don't scale
-                    await asyncio.sleep(settings.poll_interval)
-                    continue
-
-                queue_length = await self.github_client.get_queue_length()
-                self.metrics["current_queue_length"] = queue_length
-                self.metrics["last_poll_time"] = datetime.now(timezone.utc).isoformat()
-
-                logger.debug(
-                    "Queue monitoring",
-                    queue_length=queue_length,
-                    total_containers=total_containers,
-                    circuit_breaker=self.metrics["circuit_breaker_active"],
+        Newly queued jobs trigger a reconcile tick immediately.
+
+        Returns:
+            True if the delivery changed tracked demand
+        """
+        if self.demand is None:
+            return False
+        changed = self.demand.record(action, job)
+        if changed and action == "queued":
+            logger.info(
+                "Workflow job queued, requesting reconcile",
+                job_id=job.get("id"),
+                labels=job.get("labels"),
+            )
+            self.request_reconcile()
+        return changed
+
+    def _on_container_event(self, status: str, runner: Dict[str, Any]) -> None:
+        """React to runner container state changes from the Docker events stream."""
+        if runner.get("id") in self.docker_client.removing:
+            return
+        if status in DEAD_STATUSES:
+            logger.info(
+                "Runner container exited",
+                runner_name=runner.get("runner_name"),
+                container_id=runner.get("id"),
+            )
+            self.request_reconcile()
+
+    async def _reconcile_loop(self) -> None:
+        """Run one reconcile tick every poll interval, or sooner when requested."""
+        while self.is_running:
+            self._reconcile_requested.clear()
+            await self.reconcile_once()
+
+            # Poll less often while the GitHub rate-limit budget is low
+            multiplier = self.github_client.rate_limiter.poll_multiplier()
+            if multiplier > 1:
+                logger.info(
+                    "Stretching poll interval to conserve GitHub API budget",
+                    multiplier=round(multiplier, 2),
+                    remaining=self.github_client.rate_limiter.remaining,
                 )
-                await self.debug_scaling_state()  # Debug call
+            try:
+                await asyncio.wait_for(
+                    self._reconcile_requested.wait(),
+                    timeout=settings.poll_interval * multiplier,
+                )
+            except asyncio.TimeoutError:
+                pass
+
+    async def reconcile_once(self, force: Optional[str] = None) -> Optional[ReconcilePlan]:
+        """Snapshot the cluster, plan once and apply the resulting diff.
 
-                # Only scale if circuit breaker is not active
-                if not self.metrics["circuit_breaker_active"]:
-                    # Scale up if queue is too long
-                    if queue_length >= settings.scale_up_threshold:
-                        await self._scale_up()
-                    # Scale down if queue is minimal
-                    elif queue_length <= settings.scale_down_threshold:
-                        await self._scale_down()
+        Args:
+            force: ``"up"`` or ``"down"`` for a manually requested scale action
 
+        Returns:
+            The applied plan, or None if no snapshot could be taken
+        """
+        async with self._reconcile_lock:
+            started = time.monotonic()
+            try:
+                snapshot = await self.reconciler.snapshot()
             except Exception as e:
-                logger.error("Error monitoring queue", error=str(e))
+                logger.error("Failed to build cluster snapshot", error=str(e))
                 self.metrics["failed_scale_attempts"] += 1
 
                 # If too many failures, activate circuit breaker
                 if self.metrics["failed_scale_attempts"] >= 5:
-                    logger.error(
-                        "Too many monitoring failures, activating circuit breaker"
-                    )
+                    if not self.metrics["circuit_breaker_active"]:
+                        logger.error(
+                            "Too many monitoring failures, activating circuit breaker"
+                        )
                     self.metrics["circuit_breaker_active"] = True
+                return None
 
-            await asyncio.sleep(settings.poll_interval)
+            self.metrics["failed_scale_attempts"] = 0
+            self.metrics["current_queue_length"] = snapshot.queue_length
+            self.metrics["last_poll_time"] = snapshot.taken_at.isoformat()
+            self._track_runners(snapshot)
+
+            plan = self.reconciler.plan(
+                snapshot, self.metrics["last_scale_action"], force=force
+            )
+            self._update_circuit_breaker(plan, snapshot)
+            await self.debug_scaling_state(snapshot)
 
-    async def _manage_runners(self) -> None:
-        """Manage runner lifecycle and health."""
-        while self.is_running:
             try:
-                # Get current runners from Docker
-                docker_runners = await self.docker_client.get_runners()
-
-                # Update active runners tracking
-                active_ids = set()
-                for runner in docker_runners:
-                    if runner["status"] == "running":
-                        active_ids.add(runner["id"])
-                        if runner["id"] not in self.active_runners:
-                            self.active_runners[runner["id"]] = {
-                                "name": runner["runner_name"],
-                                "created_at": runner["created_at"],
-                                "container_id": runner["id"],
-                                "last_seen": datetime.now(timezone.utc),
-                            }
-
-                # Remove inactive runners from tracking
-                inactive_ids = set(self.active_runners.keys()) - active_ids
-                for inactive_id in inactive_ids:
-                    logger.info(
-                        "Removing inactive runner from tracking", runner_id=inactive_id
-                    )
-                    del self.active_runners[inactive_id]
+                await self._apply_plan(plan)
+            except Exception as e:
+                logger.error("Error applying reconcile plan", error=str(e))
 
-                logger.debug(
-                    "Runner health check",
-                    active_count=len(self.active_runners),
-                    docker_count=len(
-                        [r for r in docker_runners if r["status"] == "running"]
-                    ),
-                )
+            if self.warm_pool is not None:
+                self.warm_pool.request_refill()
 
-            except Exception as e:
-                logger.error("Error managing runners", error=str(e))
+            duration_ms = round((time.monotonic() - started) * 1000, 1)
+            self.metrics["last_reconcile"] = {
+                **plan.summary(),
+                "timestamp": snapshot.taken_at.isoformat(),
+                "duration_ms": duration_ms,
+            }
+            log = logger.debug if plan.is_noop else logger.info
+            log("Reconcile tick complete", duration_ms=duration_ms, **plan.summary())
+            return plan
+
+    def _update_circuit_breaker(
+        self, plan: ReconcilePlan, snapshot: ClusterSnapshot
+    ) -> None:
+        """Track the container-limit emergency brake for status reporting."""
+        total_containers = len(snapshot.active_containers)
+        if plan.circuit_breaker and not self.metrics["circuit_breaker_active"]:
+            logger.error(
+                "EMERGENCY: Container limit reached, activating circuit breaker",
+                total_containers=total_containers,
+                max_allowed=settings.max_runners,
+            )
+        elif not plan.circuit_breaker and self.metrics["circuit_breaker_active"]:
+            logger.info(
+                "Circuit breaker deactivated, container count within limits",
+                total_containers=total_containers,
+                max_allowed=settings.max_runners,
+            )
+        self.metrics["circuit_breaker_active"] = plan.circuit_breaker
+
+    def _track_runners(self, snapshot: ClusterSnapshot) -> None:
+        """Update active runner tracking from the snapshot."""
+        active_ids = set()
+        for runner in snapshot.running_containers:
+            active_ids.add(runner["id"])
+            if runner["id"] not in self.active_runners:
+                self.active_runners[runner["id"]] = {
+                    "name": runner["runner_name"],
+                    "created_at": runner["created_at"],
+                    "container_id": runner["id"],
+                    "last_seen": snapshot.taken_at,
+                }
+            else:
+                self.active_runners[runner["id"]]["last_seen"] = snapshot.taken_at
 
-            await asyncio.sleep(30)  # Check every 30 seconds
+        # Remove inactive runners from tracking
+        for inactive_id in set(self.active_runners.keys()) - active_ids:
+            logger.info("Removing inactive runner from tracking", runner_id=inactive_id)
+            del self.active_runners[inactive_id]
 
-    async def _cleanup_dead_containers(self) -> None:
-        """Periodically clean up dead containers."""
-        while self.is_running:
+    async def _apply_plan(self, plan: ReconcilePlan) -> None:
+        """Apply a reconcile plan: housekeeping first, then scaling."""
+        for runner in plan.deregister:
             try:
-                cleaned = await self.docker_client.cleanup_dead_containers()
-                if cleaned > 0:
-                    self.metrics["total_runners_destroyed"] += cleaned
+                await self.github_client.delete_runner(runner["id"])
+                logger.info("Removed orphaned runner from GitHub", name=runner["name"])
             except Exception as e:
-                logger.error("Error cleaning up containers", error=str(e))
+                logger.error(
+                    "Failed to remove orphaned runner",
+                    name=runner["name"],
+                    error=str(e),
+                )
 
-            await asyncio.sleep(300)  # Clean up every 5 minutes
+        if plan.reap:
+            await self._reap(plan.reap)
 
-    async def _sync_runners(self) -> None:
-        """Sync with GitHub to remove orphaned runners and unregistered containers."""
-        while self.is_running:
-            try:
-                # Get runners from GitHub (only managed ones, not actions-runner-*)
-                github_runners = await self.github_client.get_runners()
-                github_names = {runner["name"] for runner in github_runners}
-
-                # Also get all runners for logging/monitoring purposes
-                all_github_runners = await self.github_client.get_all_runners()
-                # Determine which existing GitHub runners we should ignore when
-                # syncing. Historically we ignored names like "actions-runner-*"
-                # and "Mac-Build-*". Use the configured prefix so the
-                # orchestrator only manages runners it created.
-                configured_prefix = settings.runner_name_prefix
-                ignored_runners = [
-                    r["name"]
-                    for r in all_github_runners
-                    if not r["name"].startswith(configured_prefix)
-                ]
-
-                if ignored_runners:
-                    logger.debug(
-                        "Found existing non-orchestrated runners (ignoring)",
-                        count=len(ignored_runners),
-                        names=ignored_runners[:5],  # Log first 5 names to avoid spam
-                    )
+        if plan.create:
+            await self._scale_up(plan)
+        elif plan.remove:
+            await self._scale_down(plan)
 
-                # Get local container runners
-                docker_runners = await self.docker_client.get_runners()
-                docker_names = {
-                    runner["runner_name"]
-                    for runner in docker_runners
-                    if runner["runner_name"]
-                }
-
-                # Find containers that exist locally but aren't registered with GitHub
-                # These are likely failed registrations that should be removed
-                unregistered_containers = docker_names - github_names
-                if unregistered_containers:
-                    logger.info(
-                        "Found unregistered containers (removing)",
-                        count=len(unregistered_containers),
-                        names=list(unregistered_containers)[:5],
-                    )
-                    for runner in docker_runners:
-                        if (
-                            runner["runner_name"] in unregistered_containers
-                            and runner["status"] == "running"
-                        ):
-                            try:
-                                # Check if container has been running for more than 2 minutes
-                                # Give it time to register before removing
-                                container_age = self._get_container_age_minutes(runner)
-                                if container_age > 2:
-                                    await self.docker_client.remove_runner(runner["id"])
-                                    logger.info(
-                                        "Removed unregistered container",
-                                        runner_name=runner["runner_name"],
-                                        container_id=runner["id"],
-                                        age_minutes=container_age,
-                                    )
-                                    self.metrics["total_runners_destroyed"] += 1
-                            except Exception as e:
-                                logger.error(
-                                    "Failed to remove unregistered container",
-                                    runner_name=runner["runner_name"],
-                                    error=str(e),
-                                )
-
-                # Find runners that exist in GitHub but not locally (might be from previous instances)
-                orphaned_github = github_names - docker_names
-                if orphaned_github:
-                    logger.info(
-                        "Found orphaned runners in GitHub", count=len(orphaned_github)
-                    )
-                    prefix = settings.runner_name_prefix
-                    for runner in github_runners:
-                        if runner["name"] in orphaned_github:
-                            # Only remove runners that match our naming prefix to avoid
-                            # deleting unrelated runners (e.g., Mac build agents).
-                            if not runner["name"].startswith(prefix):
-                                logger.info(
-                                    "Skipping orphaned runner - not managed by this orchestrator",
-                                    name=runner["name"],
-                                )
-                                continue
-
-                            try:
-                                await self.github_client.delete_runner(runner["id"])
-                                logger.info(
-                                    "Removed orphaned runner from GitHub",
-                                    name=runner["name"],
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    "Failed to remove orphaned runner",
-                                    name=runner["name"],
-                                    error=str(e),
-                                )
+    async def _reap(self, runners: List[Dict[str, Any]]) -> None:
+        """Remove dead or never-registered containers in one parallel batch."""
 
+        async def drop_registration(runner: Dict[str, Any]) -> None:
+            runner_id = runner.get("runner_id")
+            if runner_id is None and self.warm_pool is not None:
+                runner_id = self.warm_pool.runner_id(runner["id"])
+            if runner_id is None:
+                return
+            # JIT runner: drop its registration directly (404 if GitHub
+            # already removed it after its job)
+            try:
+                await self.github_client.delete_runner(runner_id)
             except Exception as e:
-                logger.error("Error syncing runners", error=str(e))
+                logger.error(
+                    "Failed to delete registration of reaped runner",
+                    runner_name=runner["runner_name"],
+                    error=str(e),
+                )
 
-            await asyncio.sleep(120)  # Sync more frequently - every 2 minutes
+        await asyncio.gather(*(drop_registration(r) for r in runners))
+        # A running token-registered container that never showed up in GitHub
+        # may have been handed a rejected token; mint a new one for the next
+        if not settings.runner_jit_config and any(
+            r["status"] not in DEAD_STATUSES for r in runners
+        ):
+            self.github_client.invalidate_registration_token()
+        result = await self.docker_client.remove_runners(r["id"] for r in runners)
+        removed = set(result["removed"])
+        for runner in runners:
+            if runner["id"] in removed:
+                logger.info(
+                    "Reaped runner container",
+                    runner_name=runner["runner_name"],
+                    container_id=runner["id"],
+                    status=runner["status"],
+                )
+            else:
+                logger.error(
+                    "Failed to reap runner container",
+                    runner_name=runner["runner_name"],
+                    error=result["failed"].get(runner["id"]),
+                )
+        self.metrics["total_runners_destroyed"] += len(removed)
 
-    async def _scale_up(self) -> None:
-        """Scale up runners based on both registered and docker container counts."""
-        # CRITICAL: Count ALL containers first to prevent runaway scaling
-        try:
-            docker_runners = await self.docker_client.get_runners()
-            total_containers = len(
-                [
-                    r
-                    for r in docker_runners
-                    if r["status"] in ["running", "created", "restarting"]
-                ]
-            )
-        except Exception as e:
-            logger.error(
-                "Could not get Docker containers for scale up safety check",
-                error=str(e),
-            )
-            return
+    async def _scale_up(self, plan: Optional[ReconcilePlan] = None) -> None:
+        """Create the runners requested by ``plan``.
 
-        # HARD LIMIT: Never exceed max_runners containers regardless of registration status
-        if total_containers >= settings.max_runners:
-            logger.warning(
-                "Cannot scale up, at maximum container limit",
-                total_containers=total_containers,
-                max=settings.max_runners,
-            )
+        Called without a plan (manual API trigger) this runs a forced
+        scale-up reconcile tick, which still honours limits and cooldown.
+        """
+        if plan is None:
+            await self.reconcile_once(force="up")
             return
 
-        # Count registered runners for scaling logic
-        try:
-            github_runners = await self.github_client.get_runners()
-            registered_count = len(github_runners)
-        except Exception as e:
-            logger.warning(
-                "Could not get GitHub runners for scale up, using container count",
-                error=str(e),
-            )
-            registered_count = total_containers
+        logger.info(
+            "Scaling up runners",
+            current_online=plan.current_runners,
+            desired=plan.desired_runners,
+            adding=plan.create,
+            reason=plan.reason,
+        )
+
+        # Booted standbys already hold their host slot; claim them first
+        standbys: List[Dict[str, Any]] = []
+        while self.warm_pool is not None and len(standbys) < plan.create:
+            standby = await self.warm_pool.acquire()
+            if standby is None:
+                break
+            standbys.append(standby)
 
-        if registered_count >= settings.max_runners:
+        # max_runners may exceed what the Docker hosts declare they can hold
+        needed = plan.create - len(standbys)
+        fresh = min(needed, self.docker_client.free_capacity())
+        if fresh < needed:
             logger.warning(
-                "Cannot scale up, at maximum registered runners",
-                registered_count=registered_count,
-                max=settings.max_runners,
+                "Docker hosts are at capacity, creating fewer runners",
+                requested=plan.create,
+                binding=len(standbys),
+                creating=fresh,
             )
-            return
 
-        # Check if we recently scaled up to prevent runaway scaling
-        if self.metrics["last_scale_action"]:
-            last_action = self.metrics["last_scale_action"]
-            if (
-                isinstance(last_action, dict)
-                and last_action.get("action") == "scale_up"
-            ):
-                timestamp = last_action.get("timestamp")
-                if timestamp:
-                    last_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
-                else:
-                    last_time = datetime.min
-                time_diff = datetime.now(timezone.utc) - last_time
-                if time_diff.total_seconds() < 60:
-                    logger.debug("Scale up cooldown active, skipping")
-                    return
-
-        # Be more aggressive in scaling - create up to 2 runners at once if needed
-        docker_runners = await self.docker_client.get_runners()
-        total_containers = len(
-            [
-                r for r in docker_runners if r["status"] in ["running", "created", "restarting"]
-            ]
-        )
-        github_runners = await self.github_client.get_runners()
-        registered_count = len(github_runners)
-        max_new_containers = min(2, settings.max_runners - total_containers)
-        max_new_registered = min(2, settings.max_runners - registered_count)
-        runners_needed = min(max_new_containers, max_new_registered)
-
-        if runners_needed <= 0:
-            logger.debug(
-                "No runners needed",
-                total_containers=total_containers,
-                registered_count=registered_count,
-            )
-            return
+        semaphore = asyncio.Semaphore(max(1, settings.runner_create_concurrency))
 
-        logger.info(
-            "Scaling up runners",
-            registered_count=registered_count,
-            total_containers=total_containers,
-            adding=runners_needed,
-        )
+        async def create_one(standby: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+            async with semaphore:
+                await self._create_limiter.acquire()
+                return await self._launch_runner(standby)
 
-        successful_creates = 0
-        for _ in range(runners_needed):
-            try:
-                container_id = await self._create_runner()
-                if container_id:
-                    successful_creates += 1
-                    # Add a delay between creating runners
-                    await asyncio.sleep(10)  # Increased delay
-                else:
-                    logger.warning("Failed to create runner (returned None)")
-                    break  # Stop trying if creation fails
-            except Exception as e:
-                logger.error("Failed to create runner during scale up", error=str(e))
-                break  # Stop trying if creation fails
+        results = await asyncio.gather(
+            *(create_one(standby) for standby in standbys),
+            *(create_one(None) for _ in range(fresh)),
+        )
+        successful_creates = len([r for r in results if r["ok"]])
+        failed = [r for r in results if not r["ok"]]
+        if failed:
+            logger.warning(
+                "Some runners failed to start",
+                requested=plan.create,
+                created=successful_creates,
+                errors=[r["error"] for r in failed],
+            )
 
+        # Topping up to the minimum does not start the scale-up cooldown
         self.metrics["last_scale_action"] = {
-            "action": "scale_up",
+            "action": (
+                "scale_to_minimum" if plan.reason == "below_minimum" else "scale_up"
+            ),
             "timestamp": datetime.now(timezone.utc).isoformat(),
             "runners_added": successful_creates,
+            "runners_failed": len(failed),
+            "results": results,
         }
 
-    async def _scale_down(self) -> None:
-        """Scale down runners based on ONLINE runner count (not just registered)."""
-        # CRITICAL FIX: Count only ONLINE runners, not offline registered ones
-        try:
-            github_runners = await self.github_client.get_runners()
-            online_runners = [
-                r for r in github_runners
-                if r.get("status") == "online"
-            ]
-            current_count = len(online_runners)
-            online_names = {runner["name"] for runner in online_runners}
-        except Exception as e:
-            logger.warning(
-                "Could not get GitHub runners for scale down, using active runners",
-                error=str(e),
-            )
-            current_count = len(self.active_runners)
-            online_names = set()
-
-        if current_count <= settings.min_runners:
-            logger.debug(
-                "Cannot scale down, at minimum runners",
-                current_online=current_count,
-                min=settings.min_runners,
-            )
-            return
+    async def _scale_down(self, plan: Optional[ReconcilePlan] = None) -> None:
+        """Retire the runners selected by ``plan``.
 
-        # Only scale down if we have more than minimum + threshold
-        if current_count <= settings.min_runners + 1:
+        Called without a plan (manual API trigger) this runs a forced
+        scale-down reconcile tick, which still honours the minimum.
+        """
+        if plan is None:
+            await self.reconcile_once(force="down")
             return
 
-        runners_to_remove = min(1, current_count - settings.min_runners)
-
         logger.info(
             "Scaling down runners",
-            current_online=current_count,
-            removing=runners_to_remove,
-        )
-
-        # Remove oldest idle runners first, but only if they're ONLINE (not offline)
-        docker_runners = await self.docker_client.get_runners()
-        online_containers = [
-            r
-            for r in docker_runners
-            if r["runner_name"] in online_names and r["status"] == "running"
-        ]
-
-        # Sort by creation time (oldest first)
-        runners_by_age = sorted(
-            online_containers, key=lambda x: x.get("created_at", "")
+            current_online=plan.current_runners,
+            removing=len(plan.remove),
         )
 
-        removed = 0
-        for runner_info in runners_by_age:
-            if removed >= runners_to_remove:
-                break
-
+        async def deregister(removal: RunnerRemoval) -> bool:
+            """De-register from GitHub; a refusal (e.g. busy) keeps the container."""
+            if not removal.github_runner:
+                return True
             try:
-                # CRITICAL FIX: De-register from GitHub before removing container
-                runner_name = runner_info["runner_name"]
-
-                # Find the GitHub runner ID to delete
-                github_runners_full = await self.github_client.get_runners()
-                github_runner = next(
-                    (r for r in github_runners_full if r["name"] == runner_name),
-                    None
-                )
-
-                if github_runner:
-                    # De-register from GitHub first
-                    await self.github_client.delete_runner(github_runner["id"])
-                    logger.info(
-                        "De-registered runner from GitHub before removal",
-                        runner_name=runner_name,
-                        github_id=github_runner["id"]
-                    )
-
-                # Now remove the container
-                await self.docker_client.remove_runner(runner_info["id"])
+                await self.github_client.delete_runner(removal.github_runner["id"])
                 logger.info(
-                    "Removed runner during scale down",
-                    runner_id=runner_info["id"],
-                    runner_name=runner_name
+                    "De-registered runner from GitHub before removal",
+                    runner_name=removal.container["runner_name"],
+                    github_id=removal.github_runner["id"],
                 )
-                removed += 1
-                self.metrics["total_runners_destroyed"] += 1
+                return True
             except Exception as e:
                 logger.error(
-                    "Failed to remove runner during scale down",
-                    runner_id=runner_info["id"],
+                    "Failed to de-register runner, keeping its container",
+                    runner_id=removal.container["id"],
                     error=str(e),
                 )
+                return False
+
+        deregistered = await asyncio.gather(*(deregister(r) for r in plan.remove))
+        result = await self.docker_client.remove_runners(
+            removal.container["id"]
+            for removal, ok in zip(plan.remove, deregistered)
+            if ok
+        )
+        for container_id in result["removed"]:
+            logger.info("Removed runner during scale down", runner_id=container_id)
+        self.metrics["total_runners_destroyed"] += len(result["removed"])
 
         self.metrics["last_scale_action"] = {
             "action": "scale_down",
             "timestamp": datetime.now(timezone.utc).isoformat(),
-            "runners_removed": removed,
+            "runners_removed": len(result["removed"]),
+            "failed": result["failed"],
         }
 
-    async def _scale_to_minimum(self) -> None:
-        """Ensure minimum number of runners are running and registered with HARD SAFETY LIMITS."""
-        # CRITICAL: Get all Docker containers first for safety checks
-        try:
-            docker_runners = await self.docker_client.get_runners()
-            all_containers = [
-                r
-                for r in docker_runners
-                if r["status"] in ["running", "created", "restarting"]
-            ]
-            running_containers = [r for r in docker_runners if r["status"] == "running"]
-        except Exception as e:
-            logger.error(
-                "Could not get Docker containers for scaling safety", error=str(e)
-            )
-            return
-
-        # HARD SAFETY LIMIT: Never exceed max_runners containers
-        if len(all_containers) >= settings.max_runners:
-            logger.warning(
-                "Cannot scale to minimum, already at container limit",
-                total_containers=len(all_containers),
-                max=settings.max_runners,
-            )
-            return
-
-        # Get registered runners from GitHub (only our managed ones)
-        try:
-            github_runners = await self.github_client.get_runners()
-            registered_names = {runner["name"] for runner in github_runners}
-
-            # CRITICAL FIX: Count only ONLINE runners, not offline ones
-            online_runners = [
-                r for r in github_runners
-                if r.get("status") == "online"
-            ]
-            online_names = {runner["name"] for runner in online_runners}
-
-            # Count only containers that are both running AND registered AND online
-            online_registered_running_count = len(
-                [r for r in running_containers if r["runner_name"] in online_names]
-            )
-
-            logger.debug(
-                "Runner count analysis",
-                docker_running=len(running_containers),
-                docker_total=len(all_containers),
-                github_registered=len(github_runners),
-                github_online=len(online_runners),
-                online_and_running=online_registered_running_count,
-                min_required=settings.min_runners,
-            )
-
-            # Use ONLINE count for scaling decisions
-            current_count = online_registered_running_count
-
-        except Exception as e:
-            logger.warning(
-                "Could not get GitHub runners for scaling, using Docker count",
-                error=str(e),
-            )
-            current_count = len(running_containers)
-
-        needed = settings.min_runners - current_count
-
-        if needed > 0:
-            # SAFETY: Respect hard container limits
-            max_containers_allowed = settings.max_runners - len(all_containers)
-            safe_needed = min(
-                needed, max_containers_allowed, 2
-            )  # Never create more than 2 at once
-
-            if safe_needed <= 0:
-                logger.warning(
-                    "Cannot scale to minimum due to container limits",
-                    needed=needed,
-                    total_containers=len(all_containers),
-                    max_allowed=settings.max_runners,
-                )
-                return
-
-            logger.info(
-                "Scaling to minimum runners",
-                current_online=current_count,
-                needed=needed,
-                safe_needed=safe_needed,
-                docker_running=len(running_containers),
-                docker_total=len(all_containers),
-            )
+    async def _launch_runner(
+        self, standby: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Create a new runner (or bind ``standby``) and report the outcome.
 
-            failed_attempts = 0
-            successful_creates = 0
-
-            for i in range(safe_needed):
-                try:
-                    runner_id = await self._create_runner()
-                    if runner_id is None:
-                        failed_attempts += 1
-                        logger.warning("Failed to create runner (returned None)")
-                        if failed_attempts >= 2:  # Strict failure threshold
-                            logger.error(
-                                "Too many failed attempts to create runners, stopping"
-                            )
-                            break
-                    else:
-                        successful_creates += 1
-                        failed_attempts = 0  # Reset on success
-                        # Add delay between creates to avoid overwhelming systems
-                        await asyncio.sleep(10)  # Increased delay
-                except Exception as e:
-                    failed_attempts += 1
-                    logger.error("Failed to create minimum runner", error=str(e))
-                    if failed_attempts >= 2:  # More strict failure threshold
-                        logger.error("Too many failures, stopping scale to minimum")
-                        break
+        Args:
+            standby: Warm-pool container claimed for this runner, if any
 
-            logger.info(
-                "Scale to minimum completed",
-                successful_creates=successful_creates,
-                failed_attempts=failed_attempts,
-            )
-
-    async def _create_runner(self) -> Optional[str]:
-        """Create a new runner."""
+        Returns:
+            Dict with ``runner_name``, ``container_id`` (None on failure),
+            ``ok`` and ``error``
+        """
+        # Generate unique runner name
+        runner_name = f"orchestrated-{uuid.uuid4().hex[:8]}"
         try:
-            # Get registration token
-            token = await self.github_client.get_registration_token()
             repo_url = await self.github_client.get_runner_url()
 
-            # Generate unique runner name
-            runner_name = f"orchestrated-{uuid.uuid4().hex[:8]}"
-
-            # Create container
-            container_id = await self.docker_client.create_runner(
-                runner_name=runner_name, repo_url=repo_url, runner_token=token
-            )
+            if standby is not None:
+                runner_name = standby["runner_name"]
+                container_id = await self._bind_warm_runner(standby)
+            elif settings.runner_jit_config:
+                container_id = await self._create_jit_runner(runner_name, repo_url)
+            else:
+                # Get registration token
+                token = await self.github_client.get_registration_token()
+
+                # Create container
+                container_id = await self.docker_client.create_runner(
+                    runner_name=runner_name, repo_url=repo_url, runner_token=token
+                )
 
             # Track the new runner
             self.active_runners[container_id] = {
@@ -680,85 +554,109 @@ class RunnerOrchestrator:
             logger.info(
                 "Created new runner", runner_name=runner_name, container_id=container_id
             )
-            return container_id
+            return {
+                "runner_name": runner_name,
+                "container_id": container_id,
+                "ok": True,
+                "error": None,
+            }
 
         except Exception as e:
-            logger.error("Failed to create runner", error=str(e))
-            return None
+            logger.error("Failed to create runner", runner_name=runner_name, error=str(e))
+            if not settings.runner_jit_config:
+                # Don't hand the same (possibly rejected) token to the retry
+                self.github_client.invalidate_registration_token()
+            return {
+                "runner_name": runner_name,
+                "container_id": None,
+                "ok": False,
+                "error": str(e),
+            }
 
-    async def _monitor_runner_utilization(self) -> None:
-        """Monitor runner utilization and scale based on usage."""
-        while self.is_running:
-            try:
-                github_runners = await self.github_client.get_runners()
-                # CRITICAL FIX: Only count ONLINE runners for utilization calculation
-                online_runners = [r for r in github_runners if r.get("status") == "online"]
-                total_runners = len(online_runners)
-                busy_runners = len([r for r in online_runners if r.get("busy", False)])
-                idle_runners = total_runners - busy_runners
-                utilization = (busy_runners / total_runners * 100) if total_runners > 0 else 0
-                logger.debug(
-                    "Runner utilization check",
-                    total_online_runners=total_runners,
-                    busy_runners=busy_runners,
-                    idle_runners=idle_runners,
-                    utilization_percent=utilization,
+    async def _bind_warm_runner(self, standby: Dict[str, Any]) -> str:
+        """Hand a registration to a booted warm-pool container."""
+        runner_name = standby["runner_name"]
+        runner_id = None
+        try:
+            if settings.runner_jit_config:
+                jit = await self.github_client.generate_jit_config(
+                    name=runner_name,
+                    labels=entrypoint_labels(
+                        settings.runner_labels, settings.runner_no_default_labels
+                    ),
+                    runner_group_id=settings.runner_group_id,
                 )
-                if utilization >= 80 and total_runners < settings.max_runners:
-                    queue_length = await self.github_client.get_queue_length()
-                    if queue_length > 0:
-                        logger.info(
-                            "High utilization detected, scaling up",
-                            utilization=utilization,
-                            queue_length=queue_length,
-                        )
-                        await self._scale_up()
-                elif utilization <= 20 and idle_runners > 1 and total_runners > settings.min_runners:
-                    logger.info(
-                        "Low utilization detected, considering scale down",
-                        utilization=utilization,
-                        idle_runners=idle_runners,
+                runner_id = jit["runner"]["id"]
+                binding = {"RUNNER_JITCONFIG": jit["encoded_jit_config"]}
+            else:
+                binding = {
+                    "RUNNER_TOKEN": await self.github_client.get_registration_token()
+                }
+            await self.warm_pool.bind(  # type: ignore[union-attr]
+                standby, binding, runner_id=runner_id
+            )
+            return standby["id"]
+        except Exception:
+            # A half-bound standby cannot be reused; replace it
+            await self.docker_client.remove_runner(standby["id"], force=True)
+            self.warm_pool.forget(standby["id"])  # type: ignore[union-attr]
+            if runner_id is not None:
+                try:
+                    await self.github_client.delete_runner(runner_id)
+                except Exception as e:
+                    logger.warning(
+                        "Failed to delete unused JIT registration",
+                        runner_id=runner_id,
+                        error=str(e),
                     )
-                    await self._scale_down()
-            except Exception as e:
-                logger.error("Error monitoring runner utilization", error=str(e))
-            await asyncio.sleep(60)
-
-    async def _maintain_minimum_runners(self) -> None:
-        """Periodically ensure minimum number of ONLINE runners are maintained."""
-        while self.is_running:
+            raise
+
+    async def _create_jit_runner(self, runner_name: str, repo_url: str) -> str:
+        """Register a just-in-time runner with GitHub and start its container."""
+        jit = await self.github_client.generate_jit_config(
+            name=runner_name,
+            labels=entrypoint_labels(
+                settings.runner_labels, settings.runner_no_default_labels
+            ),
+            runner_group_id=settings.runner_group_id,
+        )
+        runner_id = jit["runner"]["id"]
+        try:
+            return await self.docker_client.create_runner(
+                runner_name=runner_name,
+                repo_url=repo_url,
+                jit_config=jit["encoded_jit_config"],
+                runner_id=runner_id,
+            )
+        except Exception:
+            # Don't leave a registration behind that no container will use
             try:
-                # Wait before first check to let initial runners come online
-                await asyncio.sleep(60)
-
-                # Only maintain minimum if circuit breaker is not active
-                if not self.metrics.get("circuit_breaker_active", False):
-                    await self._scale_to_minimum()
-                else:
-                    logger.debug("Skipping minimum maintenance due to circuit breaker")
-
+                await self.github_client.delete_runner(runner_id)
             except Exception as e:
-                logger.error("Error maintaining minimum runners", error=str(e))
-
-            # Check every 60 seconds to ensure we always have minimum runners
-            await asyncio.sleep(60)
+                logger.warning(
+                    "Failed to delete unused JIT registration",
+                    runner_id=runner_id,
+                    error=str(e),
+                )
+            raise
 
-    async def debug_scaling_state(self) -> None:
+    async def debug_scaling_state(
+        self, snapshot: Optional[ClusterSnapshot] = None
+    ) -> None:
         """Debug method to log current scaling state."""
         try:
-            github_runners = await self.github_client.get_runners()
-            docker_runners = await self.docker_client.get_runners()
-            queue_length = await self.github_client.get_queue_length()
+            if snapshot is None:
+                snapshot = await self.reconciler.snapshot()
             logger.info(
                 "SCALING DEBUG",
-                github_runners_count=len(github_runners),
+                github_runners_count=len(snapshot.github_runners),
                 github_runners=[{
                     "name": r["name"],
                     "status": r.get("status"),
                     "busy": r.get("busy", False)
-                } for r in github_runners],
-                docker_runners_count=len([r for r in docker_runners if r["status"] == "running"]),
-                queue_length=queue_length,
+                } for r in snapshot.github_runners],
+                docker_runners_count=len(snapshot.running_containers),
+                queue_length=snapshot.queue_length,
                 min_runners=settings.min_runners,
                 max_runners=settings.max_runners,
                 circuit_breaker=self.metrics["circuit_breaker_active"],
@@ -766,40 +664,24 @@ class RunnerOrchestrator:
         except Exception as e:
             logger.error("Debug scaling state failed", error=str(e))
 
-    def _get_container_age_minutes(self, runner_info: Dict) -> float:
-        """Calculate how long a container has been running in minutes."""
-        try:
-            if "created_at" in runner_info and runner_info["created_at"]:
-                # Try to parse the created_at timestamp
-                created_at_str = runner_info["created_at"]
-                if isinstance(created_at_str, str):
-                    # Handle different timestamp formats
-                    if created_at_str.endswith("Z"):
-                        created_at_str = created_at_str.replace("Z", "+00:00")
-                    elif "+" not in created_at_str and not created_at_str.endswith(
-                        "+00:00"
-                    ):
-                        created_at_str += "+00:00"
-
-                    created_at = datetime.fromisoformat(created_at_str)
-                    age_seconds = (
-                        datetime.now(timezone.utc) - created_at
-                    ).total_seconds()
-                    return age_seconds / 60.0
-        except Exception as e:
-            logger.warning("Could not calculate container age", error=str(e))
-
-        # Fallback: assume container is old enough if we can't determine age
-        return 5.0
-
     async def get_status(self) -> Dict:
         """Get orchestrator status."""
-        docker_runners = await self.docker_client.get_runners()
+        try:
+            docker_runners = await self.docker_client.get_runners()
+        except Exception as e:
+            # Status stays available while Docker is down; reconcile won't plan
+            logger.warning("Could not list runner containers for status", error=str(e))
+            docker_runners = []
 
         # Get info about ignored runners for monitoring
         try:
-            all_github_runners = await self.github_client.get_all_runners()
-            github_runners = await self.github_client.get_runners()  # Only managed ones
+            # Diagnostics: skipped first when the rate-limit budget is low
+            all_github_runners = await self.github_client.get_all_runners(
+                priority=Priority.LOW
+            )
+            github_runners = await self.github_client.get_runners(
+                priority=Priority.LOW
+            )  # Only managed ones
             # Report runners that are not managed by this orchestrator for monitoring
             configured_prefix = settings.runner_name_prefix
             ignored_runners = [
@@ -838,21 +720,43 @@ class RunnerOrchestrator:
                 "total_created": self.metrics["total_runners_created"],
                 "total_destroyed": self.metrics["total_runners_destroyed"],
                 "ignored_existing": len(ignored_runners),
+                "activity": self.reconciler.activity.stats(datetime.now(timezone.utc)),
             },
             "queue": {
                 "current_length": self.metrics["current_queue_length"],
                 "last_poll": self.metrics["last_poll_time"],
+                "webhook": self.demand.stats() if self.demand else None,
+                "rate_limit": self.github_client.rate_limiter.stats(),
+                "response_cache": (
+                    self.github_client.response_cache.stats()
+                    if self.github_client.response_cache
+                    else None
+                ),
             },
+            "warm_pool": self.warm_pool.stats() if self.warm_pool else None,
+            # Capacity, load and DinD/work volume/tool caches per Docker host
+            "docker_hosts": self.docker_client.stats(),
             "scaling": {
+                "policy": settings.scaling_policy,
                 "min_runners": settings.min_runners,
                 "max_runners": settings.max_runners,
                 "scale_up_threshold": settings.scale_up_threshold,
                 "scale_down_threshold": settings.scale_down_threshold,
                 "last_action": self.metrics["last_scale_action"],
+                "last_reconcile": self.metrics["last_reconcile"],
+                "forecast": (
+                    self.reconciler.forecaster.stats(
+                        datetime.now(timezone.utc), settings.predictive_horizon
+                    )
+                    if self.reconciler.forecaster
+                    else None
+                ),
             },
             "settings": {
                 "poll_interval": settings.poll_interval,
                 "idle_timeout": settings.idle_timeout,
+                "scale_down_order": settings.scale_down_order,
                 "runner_image": settings.runner_image,
+                "docker_placement": settings.docker_placement,
             },
         }
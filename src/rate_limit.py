@@ -0,0 +1,254 @@
+"""GitHub API rate-limit tracking and request scheduling."""
+
+import asyncio
+import time
+from enum import IntEnum
+from typing import Any, Dict, Optional
+
+import httpx
+import structlog
+from tenacity import RetryCallState
+from tenacity.wait import wait_base, wait_exponential
+
+logger = structlog.get_logger()
+
+# GitHub asks clients to wait at least a minute after a secondary limit
+# response that carries no Retry-After header
+SECONDARY_LIMIT_BACKOFF = 60.0
+# Longest a request will be delayed to spread the remaining budget
+MAX_PACING_DELAY = 10.0
+# Longest a retry will wait out a rate limit; longer blocks fail the call
+MAX_RETRY_WAIT = 60.0
+
+
+class Priority(IntEnum):
+    """Importance of a GitHub request when the rate-limit budget runs low."""
+
+    # Scaling cannot proceed without it (registration tokens, queued jobs)
+    CRITICAL = 0
+    # Regular reconcile reads and writes
+    NORMAL = 1
+    # Diagnostics that may be skipped entirely
+    LOW = 2
+
+
+class RateLimitExceeded(Exception):
+    """A request was refused or deferred because of GitHub rate limits."""
+
+    def __init__(self, message: str, retry_after: float = 0.0):
+        super().__init__(message)
+        self.retry_after = retry_after
+
+
+class RateLimitScheduler:
+    """Tracks the remaining request budget of one token and paces requests.
+
+    The budget is read from the ``X-RateLimit-*`` headers of every response;
+    ``Retry-After`` (secondary limits) and exhausted primary limits block
+    requests until the indicated time. While blocked, critical requests wait
+    (up to ``max_critical_wait``) and everything else fails fast. When the
+    remaining budget falls below ``low_watermark`` of the limit, low-priority
+    requests are refused and normal requests are spread across the rest of
+    the reset window; ``reserve`` requests are kept for critical calls only.
+    """
+
+    def __init__(
+        self,
+        reserve: int = 100,
+        low_watermark: float = 0.25,
+        max_critical_wait: float = 60.0,
+        max_poll_multiplier: float = 8.0,
+    ):
+        self.reserve = reserve
+        self.low_watermark = low_watermark
+        self.max_critical_wait = max_critical_wait
+        self.max_poll_multiplier = max_poll_multiplier
+
+        self.limit: Optional[int] = None
+        self.remaining: Optional[int] = None
+        self.reset_at: Optional[float] = None
+        # Wall-clock time until which no request should be sent
+        self.blocked_until = 0.0
+        self._next_paced_at = 0.0
+        self.throttled = 0
+        self.deferred = 0
+
+    @property
+    def fraction_remaining(self) -> float:
+        """Share of the primary budget left (1.0 until headers are seen)."""
+        if not self.limit or self.remaining is None:
+            return 1.0
+        return self.remaining / self.limit
+
+    def seconds_until_reset(self, now: Optional[float] = None) -> float:
+        """Seconds until the primary budget resets (0 if unknown)."""
+        if self.reset_at is None:
+            return 0.0
+        return max(0.0, self.reset_at - (now or time.time()))
+
+    async def acquire(self, priority: Priority = Priority.NORMAL) -> None:
+        """Wait until a request of ``priority`` may be sent.
+
+        Raises:
+            RateLimitExceeded: The request should not be sent now
+        """
+        now = time.time()
+        if self.reset_at is not None and now >= self.reset_at:
+            # The window rolled over; trust the budget again until told otherwise
+            self.remaining, self.reset_at = self.limit, None
+
+        blocked_for = self.blocked_until - now
+        if blocked_for > 0:
+            if priority is Priority.CRITICAL and blocked_for <= self.max_critical_wait:
+                self.throttled += 1
+                logger.info("Waiting for GitHub rate limit", seconds=round(blocked_for, 1))
+                await asyncio.sleep(blocked_for)
+            else:
+                self.deferred += 1
+                raise RateLimitExceeded(
+                    "GitHub API rate limited", retry_after=blocked_for
+                )
+
+        if priority is Priority.CRITICAL or self.remaining is None:
+            return
+
+        if self.remaining <= self.reserve:
+            self.deferred += 1
+            raise RateLimitExceeded(
+                "GitHub API budget reserved for critical requests",
+                retry_after=self.seconds_until_reset(),
+            )
+
+        if self.fraction_remaining >= self.low_watermark:
+            return
+
+        if priority is Priority.LOW:
+            self.deferred += 1
+            raise RateLimitExceeded(
+                "GitHub API budget low, skipping diagnostic request",
+                retry_after=self.seconds_until_reset(),
+            )
+
+        # Spread the remaining non-reserved budget evenly over the reset window
+        interval = self.seconds_until_reset(now) / max(1, self.remaining - self.reserve)
+        slot = max(now, self._next_paced_at)
+        self._next_paced_at = slot + interval
+        delay = min(slot - now, MAX_PACING_DELAY)
+        if delay > 0:
+            self.throttled += 1
+            await asyncio.sleep(delay)
+
+    def update(self, response: httpx.Response) -> Optional[float]:
+        """Record budget headers and rate-limit refusals from ``response``.
+
+        Returns:
+            Seconds to wait before retrying if ``response`` is a rate-limit
+            refusal, else None
+        """
+        headers = response.headers
+        remaining = _int_header(headers, "X-RateLimit-Remaining")
+        if remaining is not None:
+            self.remaining = remaining
+            self.limit = _int_header(headers, "X-RateLimit-Limit") or self.limit
+            reset = _int_header(headers, "X-RateLimit-Reset")
+            if reset is not None:
+                self.reset_at = float(reset)
+
+        if response.status_code not in (403, 429):
+            return None
+
+        retry_after = _int_header(headers, "Retry-After")
+        now = time.time()
+        if retry_after is not None:
+            until = now + retry_after
+        elif remaining == 0 and self.reset_at is not None:
+            until = self.reset_at
+        elif response.status_code == 429:
+            until = now + SECONDARY_LIMIT_BACKOFF
+        else:
+            # A plain 403 is a permission problem, not a rate limit
+            return None
+
+        self.blocked_until = max(self.blocked_until, until)
+        logger.warning(
+            "GitHub API rate limit hit",
+            status_code=response.status_code,
+            blocked_for=round(until - now, 1),
+            remaining=self.remaining,
+        )
+        return max(0.0, until - now)
+
+    def poll_multiplier(self) -> float:
+        """Factor to stretch the poll interval by while the budget is low."""
+        if self.blocked_until > time.time():
+            return self.max_poll_multiplier
+        fraction = self.fraction_remaining
+        if fraction >= 0.5:
+            return 1.0
+        return min(self.max_poll_multiplier, 0.5 / max(fraction, 0.01))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return budget state for status reporting."""
+        return {
+            "limit": self.limit,
+            "remaining": self.remaining,
+            "seconds_until_reset": round(self.seconds_until_reset(), 1),
+            "blocked_for": round(max(0.0, self.blocked_until - time.time()), 1),
+            "poll_multiplier": round(self.poll_multiplier(), 2),
+            "throttled": self.throttled,
+            "deferred": self.deferred,
+        }
+
+
+class wait_rate_limit(wait_base):
+    """Tenacity wait that honours ``RateLimitExceeded.retry_after``.
+
+    Other failures fall back to exponential backoff. Rate-limit waits are
+    capped at ``max_wait``; longer blocks should fail the call instead of
+    holding a reconcile tick hostage.
+    """
+
+    def __init__(
+        self, fallback: Optional[wait_base] = None, max_wait: float = MAX_RETRY_WAIT
+    ):
+        self.fallback = fallback or wait_exponential(multiplier=1, min=4, max=10)
+        self.max_wait = max_wait
+
+    def __call__(self, retry_state: RetryCallState) -> float:
+        outcome = retry_state.outcome
+        error = outcome.exception() if outcome is not None else None
+        if isinstance(error, RateLimitExceeded):
+            return min(max(error.retry_after, 1.0), self.max_wait)
+        return self.fallback(retry_state)
+
+
+def should_retry(error: BaseException) -> bool:
+    """Retry predicate: anything except rate-limit blocks too long to wait out."""
+    return not (
+        isinstance(error, RateLimitExceeded) and error.retry_after > MAX_RETRY_WAIT
+    )
+
+
+def should_retry_unsent(error: BaseException) -> bool:
+    """Retry predicate for non-idempotent calls: only requests GitHub never acted on.
+
+    Rate-limit refusals (short enough to wait out) and connection failures
+    are safe to repeat; a request that timed out after being sent may
+    already have taken effect.
+    """
+    if isinstance(error, RateLimitExceeded):
+        return should_retry(error)
+    return isinstance(
+        error, (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+    )
+
+
+def _int_header(headers: httpx.Headers, name: str) -> Optional[int]:
+    """Parse an integer header, ignoring malformed values."""
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return int(float(value))
+    except ValueError:
+        return None
@@ -0,0 +1,444 @@
+"""Reconciliation engine: one cluster snapshot per tick, one plan per snapshot."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
+
+import structlog
+
+from .config import settings
+from .demand import DemandTracker
+from .forecast import DemandForecaster
+from .runner_activity import REMOVAL_ORDERS, RunnerActivityTracker
+from .scaling_policy import ScalingDecision, ScalingPolicy, build_policy
+
+logger = structlog.get_logger()
+
+# Container states that occupy a runner slot on the host
+ACTIVE_STATUSES = ("running", "created", "restarting")
+# Container states that will never pick up a job again
+DEAD_STATUSES = ("exited", "dead")
+
+# Grace period before a running-but-unregistered container is treated as failed
+REGISTRATION_GRACE_MINUTES = 2
+
+
+def container_age_minutes(runner_info: Dict[str, Any], now: datetime) -> float:
+    """Calculate how long a container has existed in minutes."""
+    try:
+        created_at_str = runner_info.get("created_at")
+        if isinstance(created_at_str, str) and created_at_str:
+            # Handle different timestamp formats
+            if created_at_str.endswith("Z"):
+                created_at_str = created_at_str.replace("Z", "+00:00")
+            elif "+" not in created_at_str and not created_at_str.endswith("+00:00"):
+                created_at_str += "+00:00"
+
+            created_at = datetime.fromisoformat(created_at_str)
+            return (now - created_at).total_seconds() / 60.0
+    except Exception as e:
+        logger.warning("Could not calculate container age", error=str(e))
+
+    # Fallback: assume container is old enough if we can't determine age
+    return 5.0
+
+
+@dataclass(frozen=True)
+class ClusterSnapshot:
+    """Immutable view of Docker, GitHub and queue state taken once per tick."""
+
+    taken_at: datetime
+    docker_runners: Tuple[Dict[str, Any], ...]
+    github_runners: Tuple[Dict[str, Any], ...]
+    all_github_runners: Tuple[Dict[str, Any], ...]
+    # Queued jobs not covered by an idle runner
+    queue_length: int
+    github_ok: bool = True
+    # Every queued job our runners can serve, idle runners notwithstanding
+    queued_jobs: int = 0
+    # Unbound warm-pool containers; kept out of every other view
+    standby_runners: Tuple[Dict[str, Any], ...] = ()
+    # Peak demand expected over the predictive horizon (None when disabled)
+    forecast_demand: Optional[float] = None
+
+    @property
+    def active_containers(self) -> List[Dict[str, Any]]:
+        """Containers occupying a runner slot (running, created, restarting)."""
+        return [r for r in self.docker_runners if r["status"] in ACTIVE_STATUSES]
+
+    @property
+    def running_containers(self) -> List[Dict[str, Any]]:
+        """Containers that are currently running."""
+        return [r for r in self.docker_runners if r["status"] == "running"]
+
+    @property
+    def dead_containers(self) -> List[Dict[str, Any]]:
+        """Containers that have exited or died."""
+        return [r for r in self.docker_runners if r["status"] in DEAD_STATUSES]
+
+    @property
+    def online_runners(self) -> List[Dict[str, Any]]:
+        """Managed GitHub runners reporting status ``online``."""
+        return [r for r in self.github_runners if r.get("status") == "online"]
+
+    @property
+    def busy_runners(self) -> List[Dict[str, Any]]:
+        """Online runners currently executing a job."""
+        return [r for r in self.online_runners if r.get("busy", False)]
+
+    @property
+    def github_names(self) -> FrozenSet[str]:
+        """Names of managed runners registered with GitHub."""
+        return frozenset(r["name"] for r in self.github_runners)
+
+    @property
+    def online_names(self) -> FrozenSet[str]:
+        """Names of managed runners that are online in GitHub."""
+        return frozenset(r["name"] for r in self.online_runners)
+
+    @property
+    def docker_names(self) -> FrozenSet[str]:
+        """Runner names of all managed containers, whatever their state."""
+        return frozenset(
+            r["runner_name"] for r in self.docker_runners if r["runner_name"]
+        )
+
+    @property
+    def online_running_count(self) -> int:
+        """Containers that are running AND whose runner is online in GitHub."""
+        if not self.github_ok:
+            return len(self.running_containers)
+        online = self.online_names
+        return len([r for r in self.running_containers if r["runner_name"] in online])
+
+    @property
+    def utilization(self) -> float:
+        """Percentage of online runners that are busy."""
+        online = len(self.online_runners)
+        return (len(self.busy_runners) / online * 100) if online else 0.0
+
+
+@dataclass(frozen=True)
+class RunnerRemoval:
+    """A runner to retire: its container and (if registered) its GitHub record."""
+
+    container: Dict[str, Any]
+    github_runner: Optional[Dict[str, Any]] = None
+
+
+@dataclass
+class ReconcilePlan:
+    """Actions computed from one snapshot; applied as a single diff."""
+
+    current_runners: int
+    desired_runners: int
+    # Containers already starting/registering; they count toward the desired total
+    pending_runners: int = 0
+    create: int = 0
+    remove: List[RunnerRemoval] = field(default_factory=list)
+    reap: List[Dict[str, Any]] = field(default_factory=list)
+    deregister: List[Dict[str, Any]] = field(default_factory=list)
+    circuit_breaker: bool = False
+    reason: str = "steady"
+
+    @property
+    def is_noop(self) -> bool:
+        """True when the plan changes nothing."""
+        return not (self.create or self.remove or self.reap or self.deregister)
+
+    def summary(self) -> Dict[str, Any]:
+        """Compact description for logging and status reporting."""
+        return {
+            "reason": self.reason,
+            "current": self.current_runners,
+            "desired": self.desired_runners,
+            "pending": self.pending_runners,
+            "create": self.create,
+            "remove": len(self.remove),
+            "reap": len(self.reap),
+            "deregister": len(self.deregister),
+            "circuit_breaker": self.circuit_breaker,
+        }
+
+
+class Reconciler:
+    """Builds cluster snapshots and turns them into reconcile plans."""
+
+    def __init__(
+        self,
+        github_client,
+        docker_client,
+        demand: Optional[DemandTracker] = None,
+        warm_pool=None,
+        forecaster: Optional[DemandForecaster] = None,
+        clock: Optional[Callable[[], datetime]] = None,
+        policy: Optional[ScalingPolicy] = None,
+    ):
+        self.github_client = github_client
+        self.docker_client = docker_client
+        self.warm_pool = warm_pool
+        # Webhook-fed demand; when set, queue polling becomes a slow fallback
+        self.demand = demand
+        # Learns the weekly demand profile; when set, scaling pre-provisions for it
+        self.forecaster = forecaster
+        # Turns each snapshot into a desired runner count
+        self.policy = policy or build_policy(settings.scaling_policy)
+        # Source of snapshot timestamps; the simulator substitutes a virtual clock
+        self.clock = clock or (lambda: datetime.now(timezone.utc))
+        self._last_queue_poll = 0.0
+        if settings.scale_down_order not in REMOVAL_ORDERS:
+            raise ValueError(
+                f"Unknown scale_down_order {settings.scale_down_order!r}; "
+                f"expected one of {', '.join(REMOVAL_ORDERS)}"
+            )
+        # Last-busy history per runner; only runners idle past idle_timeout are retired
+        self.activity = RunnerActivityTracker()
+
+    async def snapshot(self) -> ClusterSnapshot:
+        """Read Docker, GitHub and queue state once.
+
+        Docker failures propagate (we must never scale blind on containers);
+        with several Docker hosts, one that stops answering is represented by
+        its last listing as long as another host answers. GitHub failures
+        degrade to a container-only snapshot.
+        """
+        docker_result, github_result = await asyncio.gather(
+            self.docker_client.get_runners(),
+            self.github_client.get_all_runners(),
+            return_exceptions=True,
+        )
+        if isinstance(docker_result, BaseException):
+            raise docker_result
+
+        github_ok = not isinstance(github_result, BaseException)
+        if github_ok:
+            all_github = list(github_result)
+            # Keep the same management filter as GitHubClient.get_runners()
+            managed = [
+                r for r in all_github if not r.get("name", "").startswith("actions-runner-")
+            ]
+            queued_jobs = await self._queued_jobs()
+            idle = len(
+                [
+                    r
+                    for r in managed
+                    if r.get("status") == "online" and not r.get("busy", False)
+                ]
+            )
+            queue_length = max(0, queued_jobs - idle)
+        else:
+            logger.warning(
+                "Could not get GitHub runners for snapshot, using Docker state only",
+                error=str(github_result),
+            )
+            all_github, managed, queued_jobs, queue_length = [], [], 0, 0
+
+        docker_runners, standby = list(docker_result), []
+        if self.warm_pool is not None:
+            if github_ok:
+                self.warm_pool.adopt_registered(
+                    docker_runners, (r["name"] for r in managed)
+                )
+            docker_runners, standby = self.warm_pool.split(docker_runners)
+
+        taken_at = self.clock()
+        forecast = None
+        if github_ok:
+            self.activity.observe(managed, taken_at)
+            if self.forecaster is not None:
+                busy = len(
+                    [r for r in managed if r.get("status") == "online" and r.get("busy")]
+                )
+                self.forecaster.observe(taken_at, busy + queued_jobs)
+        if self.forecaster is not None:
+            forecast = self.forecaster.forecast(taken_at, settings.predictive_horizon)
+
+        return ClusterSnapshot(
+            taken_at=taken_at,
+            docker_runners=tuple(docker_runners),
+            standby_runners=tuple(standby),
+            github_runners=tuple(managed),
+            all_github_runners=tuple(all_github),
+            queue_length=queue_length,
+            queued_jobs=queued_jobs,
+            github_ok=github_ok,
+            forecast_demand=forecast,
+        )
+
+    async def _queued_jobs(self) -> int:
+        """Queued jobs from webhook demand, polling GitHub only as a fallback."""
+        if self.demand is None:
+            return await self.github_client.get_queued_job_count()
+
+        pushed = self.demand.queued
+        now = time.monotonic()
+        if now - self._last_queue_poll < settings.webhook_fallback_poll_interval:
+            return pushed
+
+        # Periodic poll heals missed deliveries and orchestrator restarts
+        self._last_queue_poll = now
+        polled = await self.github_client.get_queued_job_count()
+        return max(polled, pushed)
+
+    def plan(
+        self,
+        snapshot: ClusterSnapshot,
+        last_scale_action: Optional[Dict[str, Any]] = None,
+        force: Optional[str] = None,
+    ) -> ReconcilePlan:
+        """Compute the desired state for ``snapshot`` and diff it against reality.
+
+        Args:
+            snapshot: State captured at the start of the tick
+            last_scale_action: Previous scale action, used for the scale-up cooldown
+            force: ``"up"`` or ``"down"`` to request a manual scale action
+
+        Returns:
+            The plan; scale-up and scale-down are mutually exclusive per tick
+        """
+        now = snapshot.taken_at
+        active_count = len(snapshot.active_containers)
+        current = snapshot.online_running_count
+
+        plan = ReconcilePlan(current_runners=current, desired_runners=current)
+        plan.circuit_breaker = active_count >= settings.max_runners
+
+        self._plan_housekeeping(snapshot, plan, now)
+
+        # Slots freed by this tick's reaping, and containers that will come
+        # online without further action
+        active_count -= len([r for r in plan.reap if r["status"] in ACTIVE_STATUSES])
+        pending = max(0, active_count - current)
+        plan.pending_runners = pending
+
+        if force == "up":
+            # At least one runner, more if jobs are waiting
+            deficit = max(snapshot.queue_length - pending, 1)
+            decision = ScalingDecision(current + pending + deficit, "scale_up")
+        elif force == "down":
+            decision = ScalingDecision(settings.min_runners, "scale_down")
+        else:
+            decision = self.policy.decide(snapshot, pending)
+        desired = decision.desired
+
+        if current < settings.min_runners and force != "down":
+            plan.desired_runners = max(settings.min_runners, desired)
+            plan.reason = "below_minimum"
+        elif desired > current + pending:
+            if self._in_scale_up_cooldown(last_scale_action, now):
+                plan.reason = "scale_up_cooldown"
+            else:
+                plan.desired_runners = desired
+                plan.reason = decision.reason
+        elif desired < current and snapshot.github_ok:
+            # Retire runners idle past the timeout, never below the minimum
+            surplus = current - max(settings.min_runners, desired)
+            if surplus > 0:
+                plan.remove = self._select_removals(snapshot, surplus)
+                if plan.remove:
+                    plan.desired_runners = current - len(plan.remove)
+                    plan.reason = "scale_down"
+                else:
+                    plan.reason = "scale_down_none_idle"
+        else:
+            plan.reason = decision.reason
+
+        if plan.desired_runners > current + pending:
+            headroom = settings.max_runners - active_count
+            if snapshot.github_ok:
+                headroom = min(headroom, settings.max_runners - len(snapshot.github_runners))
+            plan.create = max(
+                0,
+                min(
+                    plan.desired_runners - current - pending,
+                    settings.scale_up_max_batch,
+                    headroom,
+                ),
+            )
+            if plan.create == 0:
+                plan.reason = "at_capacity"
+
+        return plan
+
+    def _plan_housekeeping(
+        self, snapshot: ClusterSnapshot, plan: ReconcilePlan, now: datetime
+    ) -> None:
+        """Reap dead/unregistered containers and deregister orphaned runners."""
+        plan.reap.extend(snapshot.dead_containers)
+
+        if not snapshot.github_ok:
+            return
+
+        # Containers that exist locally but never registered with GitHub
+        github_names = snapshot.github_names
+        for runner in snapshot.running_containers:
+            if runner["runner_name"] in github_names:
+                continue
+            # Give it time to register before removing
+            if self._registration_age_minutes(runner, now) > REGISTRATION_GRACE_MINUTES:
+                plan.reap.append(runner)
+
+        # Runners registered in GitHub without a local container (previous instances)
+        docker_names = snapshot.docker_names
+        prefix = settings.runner_name_prefix
+        for runner in snapshot.github_runners:
+            if runner["name"] in docker_names:
+                continue
+            # Only remove runners that match our naming prefix to avoid
+            # deleting unrelated runners (e.g., Mac build agents).
+            if runner["name"].startswith(prefix):
+                plan.deregister.append(runner)
+
+    def _registration_age_minutes(
+        self, runner_info: Dict[str, Any], now: datetime
+    ) -> float:
+        """Minutes a container has had to register with GitHub.
+
+        A warm-pool container only starts registering once it is bound, so
+        its grace period runs from the bind rather than from creation.
+        """
+        if self.warm_pool is not None:
+            bound_at = self.warm_pool.bound_at(runner_info["id"])
+            if bound_at is not None:
+                return (now - bound_at).total_seconds() / 60.0
+        return container_age_minutes(runner_info, now)
+
+    @staticmethod
+    def _in_scale_up_cooldown(
+        last_scale_action: Optional[Dict[str, Any]], now: datetime
+    ) -> bool:
+        """Check if we recently scaled up to prevent runaway scaling."""
+        if not isinstance(last_scale_action, dict):
+            return False
+        if last_scale_action.get("action") != "scale_up":
+            return False
+        timestamp = last_scale_action.get("timestamp")
+        if not timestamp:
+            return False
+        last_time = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+        return (now - last_time).total_seconds() < settings.scale_up_cooldown
+
+    def _select_removals(
+        self, snapshot: ClusterSnapshot, count: int
+    ) -> List[RunnerRemoval]:
+        """Pick up to ``count`` online runners idle longer than ``idle_timeout``.
+
+        Busy runners are never selected. A runner that picks up a job after
+        the snapshot is still protected: GitHub refuses to delete a busy
+        runner, and the container is only removed after deregistration.
+        """
+        online_names = snapshot.online_names
+        candidates = self.activity.idle_candidates(
+            (r for r in snapshot.running_containers if r["runner_name"] in online_names),
+            snapshot.taken_at,
+            settings.idle_timeout,
+            order=settings.scale_down_order,
+        )
+
+        by_name = {r["name"]: r for r in snapshot.github_runners}
+        return [
+            RunnerRemoval(container=r, github_runner=by_name.get(r["runner_name"]))
+            for r in candidates[:count]
+        ]
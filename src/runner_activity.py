@@ -0,0 +1,117 @@
+"""Per-runner busy history used to decide which runners are safe to retire."""
+
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+
+class RunnerActivity:
+    """Compact busy record for one GitHub runner."""
+
+    __slots__ = ("first_seen", "last_busy", "busy")
+
+    def __init__(self, first_seen: datetime):
+        self.first_seen = first_seen
+        # Last snapshot in which the runner was executing a job
+        self.last_busy: Optional[datetime] = None
+        self.busy = False
+
+    @property
+    def idle_since(self) -> datetime:
+        """When the runner last finished (or, if never busy, first appeared)."""
+        return self.last_busy or self.first_seen
+
+    def idle_seconds(self, now: datetime) -> float:
+        """Seconds the runner has been idle at ``now`` (0 while busy)."""
+        if self.busy:
+            return 0.0
+        return (now - self.idle_since).total_seconds()
+
+
+# Sort key for idle removal candidates, given (container, activity)
+RemovalOrder = Callable[[Dict[str, Any], RunnerActivity], Any]
+
+
+def _created_at(container: Dict[str, Any], activity: RunnerActivity) -> Any:
+    # ISO timestamps sort chronologically
+    return container.get("created_at") or ""
+
+
+# Name -> (sort key, descending)
+REMOVAL_ORDERS: Dict[str, Tuple[RemovalOrder, bool]] = {
+    # Newest containers first: long-lived runners keep their warm caches
+    "newest": (_created_at, True),
+    # Oldest containers first (FIFO)
+    "oldest": (_created_at, False),
+    # Runners idle the longest first
+    "longest_idle": (lambda container, activity: activity.idle_since, False),
+}
+
+
+class RunnerActivityTracker:
+    """Remembers when each managed runner was last seen busy.
+
+    GitHub only reports whether a runner is busy *right now*, so the tracker
+    folds every snapshot into a per-runner record keyed by runner name.
+    Records of runners that have left GitHub are dropped.
+    """
+
+    def __init__(self) -> None:
+        self._records: Dict[str, RunnerActivity] = {}
+
+    def observe(self, github_runners: Iterable[Dict[str, Any]], now: datetime) -> None:
+        """Fold one GitHub runner listing taken at ``now`` into the records."""
+        seen = set()
+        for runner in github_runners:
+            name = runner["name"]
+            seen.add(name)
+            record = self._records.get(name)
+            if record is None:
+                record = self._records[name] = RunnerActivity(now)
+            record.busy = bool(runner.get("busy", False))
+            if record.busy:
+                record.last_busy = now
+
+        for name in [n for n in self._records if n not in seen]:
+            del self._records[name]
+
+    def get(self, runner_name: str) -> Optional[RunnerActivity]:
+        """Activity record for ``runner_name``, if it has been observed."""
+        return self._records.get(runner_name)
+
+    def idle_candidates(
+        self,
+        containers: Iterable[Dict[str, Any]],
+        now: datetime,
+        idle_timeout: float,
+        order: str = "newest",
+    ) -> List[Dict[str, Any]]:
+        """Containers whose runner has been idle longer than ``idle_timeout``.
+
+        Args:
+            containers: Running containers whose runner is online
+            now: Time of the snapshot being planned
+            idle_timeout: Seconds a runner must have been idle
+            order: Key of :data:`REMOVAL_ORDERS` to sort the result by
+
+        Returns:
+            Eligible containers, best removal candidate first
+        """
+        key, reverse = REMOVAL_ORDERS[order]
+        eligible = []
+        for container in containers:
+            record = self._records.get(container["runner_name"])
+            if record is None or record.idle_seconds(now) < idle_timeout:
+                continue
+            eligible.append((container, record))
+        eligible.sort(key=lambda pair: key(*pair), reverse=reverse)
+        return [container for container, _ in eligible]
+
+    def stats(self, now: datetime) -> Dict[str, Any]:
+        """Return idle durations for status reporting."""
+        return {
+            name: {
+                "busy": record.busy,
+                "idle_seconds": round(record.idle_seconds(now)),
+            }
+            for name, record in self._records.items()
+        }
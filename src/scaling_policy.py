@@ -0,0 +1,171 @@
+"""Pluggable policies that turn a cluster snapshot into a desired runner count."""
+
+import math
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Type
+
+from .config import settings
+from .forecast import forecast_target
+
+if TYPE_CHECKING:
+    from .reconciler import ClusterSnapshot
+
+
+@dataclass(frozen=True)
+class ScalingDecision:
+    """Runners a policy wants (online plus starting) and why."""
+
+    desired: int
+    reason: str = "steady"
+
+
+class ScalingPolicy(ABC):
+    """Decides how many runners the current demand needs.
+
+    Policies only express the target; the reconciler enforces the minimum and
+    maximum, the scale-up cooldown and batch size, and retires only runners
+    idle past ``idle_timeout`` when the target is below the current count.
+    """
+
+    name = ""
+
+    @abstractmethod
+    def decide(self, snapshot: "ClusterSnapshot", pending: int) -> ScalingDecision:
+        """Return the desired runner count for ``snapshot``.
+
+        Args:
+            snapshot: State captured at the start of the tick
+            pending: Containers that are starting and not yet online
+
+        Returns:
+            The desired total of online and starting runners
+        """
+
+
+class ThresholdPolicy(ScalingPolicy):
+    """Step on queue-length and utilization thresholds.
+
+    Scales up by the queued demand once ``scale_up_threshold`` jobs wait (or
+    utilization is high with anything queued) and releases idle runners
+    toward the minimum only once the queue has drained and utilization is
+    low. Between the two bands the fleet is held, idle runners included, so
+    moderate load keeps warm spares that ``queue_proportional`` would retire.
+    """
+
+    name = "threshold"
+
+    def decide(self, snapshot: "ClusterSnapshot", pending: int) -> ScalingDecision:
+        current = snapshot.online_running_count
+        queue_length = snapshot.queue_length
+        utilization = snapshot.utilization
+
+        if queue_length >= settings.scale_up_threshold or (
+            utilization >= settings.scale_up_utilization and queue_length > 0
+        ):
+            # Demand not already covered by starting containers
+            deficit = queue_length - pending
+            if deficit <= 0:
+                return ScalingDecision(current + pending, "scale_up_pending")
+            return ScalingDecision(current + pending + deficit, "scale_up")
+
+        # Hysteresis: a drained queue alone doesn't release runners while
+        # utilization is above the low band
+        if (
+            queue_length <= settings.scale_down_threshold
+            and utilization <= settings.scale_down_utilization
+        ):
+            desired = settings.min_runners
+            return ScalingDecision(desired, _direction(desired, current, pending))
+
+        return ScalingDecision(current + pending)
+
+
+class TargetUtilizationPolicy(ScalingPolicy):
+    """Size the fleet so demand keeps runners ``scale_target_utilization`` busy."""
+
+    name = "target_utilization"
+
+    def decide(self, snapshot: "ClusterSnapshot", pending: int) -> ScalingDecision:
+        current = snapshot.online_running_count
+        # Idle runners don't lower demand: they are what serves the queue
+        demand = len(snapshot.busy_runners) + snapshot.queued_jobs
+        target = max(0.01, min(1.0, settings.scale_target_utilization))
+        desired = math.ceil(demand / target)
+        return ScalingDecision(desired, _direction(desired, current, pending))
+
+
+class QueueProportionalPolicy(ScalingPolicy):
+    """One runner per busy or queued job, reached in a single step either way."""
+
+    name = "queue_proportional"
+
+    def decide(self, snapshot: "ClusterSnapshot", pending: int) -> ScalingDecision:
+        current = snapshot.online_running_count
+        desired = len(snapshot.busy_runners) + snapshot.queued_jobs
+        return ScalingDecision(desired, _direction(desired, current, pending))
+
+
+class PredictivePolicy(ScalingPolicy):
+    """Another policy, floored at the forecast demand over the predictive horizon."""
+
+    name = "predictive"
+
+    def __init__(self, base: ScalingPolicy):
+        self.base = base
+
+    def decide(self, snapshot: "ClusterSnapshot", pending: int) -> ScalingDecision:
+        decision = self.base.decide(snapshot, pending)
+        predicted = forecast_target(snapshot.forecast_demand)
+        if predicted <= decision.desired:
+            return decision
+        # Pre-provision ahead of a predictable burst, and don't scale a
+        # pre-provisioned fleet back below the forecast
+        reason = _direction(predicted, snapshot.online_running_count, pending)
+        if reason == "scale_up":
+            reason = "predictive_scale_up"
+        return ScalingDecision(predicted, reason)
+
+
+def _direction(desired: int, current: int, pending: int) -> str:
+    """Plan reason for a policy that sets its target directly."""
+    if desired > current + pending:
+        return "scale_up"
+    if desired < current:
+        return "scale_down"
+    return "steady"
+
+
+POLICIES: Dict[str, Type[ScalingPolicy]] = {
+    ThresholdPolicy.name: ThresholdPolicy,
+    TargetUtilizationPolicy.name: TargetUtilizationPolicy,
+    QueueProportionalPolicy.name: QueueProportionalPolicy,
+}
+
+
+def uses_forecast() -> bool:
+    """True if the configured scaling needs a demand forecast."""
+    return (
+        settings.predictive_scaling_enabled
+        or settings.scaling_policy == PredictivePolicy.name
+    )
+
+
+def build_policy(name: str) -> ScalingPolicy:
+    """Instantiate the policy called ``name``.
+
+    ``predictive`` wraps the threshold policy; with predictive scaling
+    enabled any other policy is wrapped in the forecast floor as well.
+
+    Raises:
+        ValueError: ``name`` is not a known policy
+    """
+    if name == PredictivePolicy.name:
+        return PredictivePolicy(ThresholdPolicy())
+    if name not in POLICIES:
+        known = ", ".join([*POLICIES, PredictivePolicy.name])
+        raise ValueError(f"Unknown scaling_policy {name!r}; expected one of {known}")
+    policy = POLICIES[name]()
+    if settings.predictive_scaling_enabled:
+        return PredictivePolicy(policy)
+    return policy
@@ -0,0 +1,196 @@
+"""Shared, pre-populated tool cache and Playwright browser volumes."""
+
+import asyncio
+import time
+from datetime import datetime, timezone
+from typing import Any, Awaitable, Callable, Dict, Optional, Set
+
+import structlog
+
+from .config import settings
+from .utils.oneshot import remove_stale, run_oneshot
+
+logger = structlog.get_logger()
+
+# Container label carrying the generation a runner's entrypoint mounted, and
+# volume/populator label identifying shared cache objects
+GENERATION_LABEL = "shared-cache-generation"
+SHARED_CACHE_LABEL = "shared-cache"
+# Read-only mount point of the volumes inside runners and the populator
+SHARED_CACHE_ROOT = "/opt/shared-cache"
+# Volume kind -> directory the entrypoint overlays the current generation on
+CACHE_KINDS = {
+    "toolcache": "/actions-runner/_tool",
+    "playwright": "/ms-playwright",
+}
+POPULATE_SCRIPT = "/usr/local/bin/populate-shared-cache.sh"
+
+
+class SharedToolCache:
+    """Keeps ``{prefix}-toolcache`` and ``{prefix}-playwright`` volumes populated.
+
+    A one-shot populator container (the runner image running
+    ``populate-shared-cache.sh``) builds a new generation directory in each
+    volume, hardlinked from the previous one so only new versions are
+    downloaded, and then swaps the ``current`` symlink to it. Runners mount
+    both volumes read-only and their entrypoint overlays the generation they
+    were created with onto ``/actions-runner/_tool`` and ``/ms-playwright``,
+    so tools are writable copy-on-write while the shared copy stays pristine.
+
+    Old generations are pruned by the populator unless a runner container
+    still carries them in its ``shared-cache-generation`` label.
+    """
+
+    def __init__(self, client, run: Callable[..., Awaitable[Any]]):
+        self.client = client
+        # Runs a blocking docker-py call off the event loop (DockerClient._run)
+        self._run = run
+        self.prefix = settings.runner_name_prefix
+        self._lock = asyncio.Lock()
+        # Generation new runners mount; None until the first refresh finishes
+        # (runners then fall back to whatever ``current`` points at)
+        self.generation: Optional[str] = None
+        self.last_refresh: Optional[datetime] = None
+        self.last_duration: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self.refreshes = 0
+        self.failures = 0
+
+    def volume_name(self, kind: str) -> str:
+        return f"{self.prefix}-{kind}"
+
+    def volumes(self, mode: str = "ro") -> Dict[str, Dict[str, str]]:
+        """Volume bindings for a container's ``volumes`` config."""
+        return {
+            self.volume_name(kind): {"bind": f"{SHARED_CACHE_ROOT}/{kind}", "mode": mode}
+            for kind in CACHE_KINDS
+        }
+
+    def environment(self) -> Dict[str, str]:
+        """Runner variables telling the entrypoint which generation to overlay."""
+        return {
+            "SHARED_CACHE_ROOT": SHARED_CACHE_ROOT,
+            "SHARED_CACHE_GENERATION": self.generation or "",
+        }
+
+    async def ensure_volumes(self) -> None:
+        """Create the shared volumes if they don't exist yet (idempotent)."""
+        for kind in CACHE_KINDS:
+            await self._run(
+                self.client.api.create_volume,
+                name=self.volume_name(kind),
+                labels={
+                    "managed-by": "runner-orchestrator",
+                    SHARED_CACHE_LABEL: kind,
+                },
+            )
+
+    async def run_forever(self) -> None:
+        """Refresh now and then every ``shared_cache_refresh_interval`` seconds."""
+        while True:
+            await self.refresh()
+            await asyncio.sleep(max(60, settings.shared_cache_refresh_interval))
+
+    async def refresh(self) -> bool:
+        """Build and publish a new generation of both volumes.
+
+        Returns:
+            True if the populator succeeded and new runners use its generation
+        """
+        async with self._lock:
+            generation = datetime.now(timezone.utc).strftime("gen-%Y%m%dT%H%M%SZ")
+            started = time.monotonic()
+            try:
+                await self.ensure_volumes()
+                await self._populate(generation)
+            except Exception as e:
+                self.failures += 1
+                self.last_error = str(e)
+                logger.error(
+                    "Shared tool cache refresh failed",
+                    generation=generation,
+                    error=str(e),
+                )
+                return False
+
+            self.generation = generation
+            self.refreshes += 1
+            self.last_error = None
+            self.last_refresh = datetime.now(timezone.utc)
+            self.last_duration = round(time.monotonic() - started, 1)
+            logger.info(
+                "Shared tool cache refreshed",
+                generation=generation,
+                duration_s=self.last_duration,
+            )
+            return True
+
+    async def _generations_in_use(self) -> Optional[Set[str]]:
+        """Generations mounted by existing runner containers.
+
+        Returns:
+            The generation names, or None if some runner mounted ``current``
+            without recording which generation that was (nothing may be pruned)
+        """
+        summaries = await self._run(
+            self.client.api.containers,
+            all=True,
+            filters={"label": [GENERATION_LABEL, "managed-by=runner-orchestrator"]},
+        )
+        in_use: Set[str] = set()
+        for summary in summaries:
+            value = (summary.get("Labels") or {}).get(GENERATION_LABEL, "")
+            if not value:
+                return None
+            in_use.add(value)
+        return in_use
+
+    async def _populate(self, generation: str) -> None:
+        """Run the populator container to completion.
+
+        Raises:
+            RuntimeError: The populator exited non-zero or timed out
+        """
+        # Left behind by an orchestrator that stopped mid-refresh
+        await remove_stale(self.client, self._run, f"{SHARED_CACHE_LABEL}=populator")
+        in_use = await self._generations_in_use()
+        if self.generation:
+            in_use = None if in_use is None else in_use | {self.generation}
+        environment = {
+            "SHARED_CACHE_ROOT": SHARED_CACHE_ROOT,
+            "GENERATION": generation,
+            "KEEP_GENERATIONS": " ".join(sorted(in_use or ())),
+            "PRUNE": "false" if in_use is None else "true",
+            "NODE_VERSIONS": settings.shared_cache_node_versions,
+            "PYTHON_VERSIONS": settings.shared_cache_python_versions,
+            "PLAYWRIGHT_VERSIONS": settings.shared_cache_playwright_versions,
+            "PLAYWRIGHT_BROWSERS": settings.shared_cache_playwright_browsers,
+        }
+        logger.info("Populating shared tool cache", generation=generation)
+        # Not labelled managed-by: the populator must never be mistaken for a runner
+        status, logs = await run_oneshot(
+            self.client,
+            self._run,
+            settings.shared_cache_refresh_timeout,
+            image=settings.runner_image,
+            name=f"{self.prefix}-cache-populator-{generation}",
+            entrypoint=[POPULATE_SCRIPT],
+            environment=environment,
+            volumes=self.volumes(mode="rw"),
+            network=settings.runner_network,
+            labels={SHARED_CACHE_LABEL: "populator"},
+        )
+        if status != 0:
+            raise RuntimeError(f"populator exited with {status}: {logs}")
+
+    def stats(self) -> Dict[str, Any]:
+        """Return refresh state for status reporting."""
+        return {
+            "generation": self.generation,
+            "last_refresh": self.last_refresh.isoformat() if self.last_refresh else None,
+            "last_duration_s": self.last_duration,
+            "refreshes": self.refreshes,
+            "failures": self.failures,
+            "last_error": self.last_error,
+        }
+
@@ -0,0 +1,546 @@
+"""Offline discrete-event simulator for evaluating scaling settings.
+
+Replays a job-arrival trace against the real :class:`Reconciler` using fake
+GitHub and Docker clients and a virtual clock, then reports queue wait
+percentiles, runner-minutes consumed and churn. Nothing touches the network
+or a Docker daemon, so thresholds, cooldowns and policies can be tuned on a
+laptop::
+
+    python -m src.simulator --synthetic-hours 24 --rate 40 --set min_runners=1
+    python -m src.simulator --trace jobs.jsonl --set idle_timeout=120
+"""
+
+import argparse
+import asyncio
+import csv
+import heapq
+import json
+import logging
+import math
+import os
+import random
+import sys
+from collections import Counter, deque
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta, timezone
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+# The simulator never talks to GitHub, but settings require a token
+os.environ.setdefault("ORCHESTRATOR_GITHUB_TOKEN", "simulator")
+
+from .config import settings  # noqa: E402
+from .forecast import DemandForecaster  # noqa: E402
+from .reconciler import ReconcilePlan, Reconciler  # noqa: E402
+from .scaling_policy import uses_forecast  # noqa: E402
+from .utils.logging import setup_logging  # noqa: E402
+
+# Monday 00:00 UTC, so synthetic traces line up with the weekly forecast season
+DEFAULT_START = datetime(2026, 1, 5, tzinfo=timezone.utc)
+
+
+@dataclass(frozen=True)
+class TraceJob:
+    """One job of a trace: seconds after the trace start, and run time."""
+
+    arrival: float
+    duration: float
+
+
+@dataclass
+class SimJob:
+    arrival: float
+    duration: float
+    started: Optional[float] = None
+
+
+@dataclass
+class SimRunner:
+    """A simulated runner container and its GitHub registration."""
+
+    name: str
+    container_id: str
+    created: float
+    online_at: float
+    online: bool = False
+    job: Optional[SimJob] = None
+    removed: Optional[float] = None
+
+
+@dataclass
+class SimulationReport:
+    """Aggregated outcome of one simulation run."""
+
+    jobs: int
+    completed: int
+    wait_p50: float
+    wait_p90: float
+    wait_p99: float
+    wait_max: float
+    wait_mean: float
+    runner_minutes: float
+    busy_minutes: float
+    runners_created: int
+    runners_removed: int
+    runners_reaped: int
+    peak_runners: int
+    ticks: int
+    reasons: Dict[str, int] = field(default_factory=dict)
+
+    @property
+    def churn(self) -> int:
+        """Containers started plus containers retired."""
+        return self.runners_created + self.runners_removed + self.runners_reaped
+
+    @property
+    def utilization(self) -> float:
+        """Share of runner time spent executing jobs."""
+        return self.busy_minutes / self.runner_minutes if self.runner_minutes else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the report as plain JSON-serializable data."""
+        return {
+            "jobs": self.jobs,
+            "completed": self.completed,
+            "wait_seconds": {
+                "p50": round(self.wait_p50, 1),
+                "p90": round(self.wait_p90, 1),
+                "p99": round(self.wait_p99, 1),
+                "max": round(self.wait_max, 1),
+                "mean": round(self.wait_mean, 1),
+            },
+            "runner_minutes": round(self.runner_minutes, 1),
+            "busy_minutes": round(self.busy_minutes, 1),
+            "utilization": round(self.utilization, 3),
+            "runners_created": self.runners_created,
+            "runners_removed": self.runners_removed,
+            "runners_reaped": self.runners_reaped,
+            "churn": self.churn,
+            "peak_runners": self.peak_runners,
+            "ticks": self.ticks,
+            "reasons": self.reasons,
+        }
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of ``values`` (0 for an empty list)."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, math.ceil(pct / 100 * len(ordered)))
+    return ordered[rank - 1]
+
+
+class SimGitHubClient:
+    """Just enough of GitHubClient for Reconciler.snapshot()."""
+
+    def __init__(self, sim: "Simulation"):
+        self.sim = sim
+
+    async def get_all_runners(self, priority=None) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": index,
+                "name": runner.name,
+                "status": "online" if runner.online else "offline",
+                "busy": runner.job is not None,
+                "labels": [],
+            }
+            # Registered at creation, like config.sh, and offline until booted;
+            # otherwise booting runners would be reaped as never registered
+            for index, runner in enumerate(self.sim.live_runners(), start=1)
+        ]
+
+    async def get_queued_job_count(self) -> int:
+        return len(self.sim.queue)
+
+
+class SimDockerClient:
+    """Just enough of DockerClient for Reconciler.snapshot()."""
+
+    def __init__(self, sim: "Simulation"):
+        self.sim = sim
+
+    async def get_runners(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "id": runner.container_id,
+                "name": f"{settings.runner_name_prefix}-{runner.name}",
+                "runner_name": runner.name,
+                "status": "running",
+                "created_at": self.sim.at(runner.created).isoformat(),
+                "pool": None,
+            }
+            for runner in self.sim.live_runners()
+        ]
+
+
+class Simulation:
+    """Event loop replaying ``trace`` against the reconciler.
+
+    Jobs are dispatched to idle online runners in arrival order, runners
+    register (offline) when created, come online ``boot_seconds`` later and
+    are reused between jobs. The reconciler runs every ``poll_interval`` virtual seconds and
+    its plans are applied instantly (creation latency is modelled by the
+    boot time).
+    """
+
+    def __init__(
+        self,
+        trace: List[TraceJob],
+        boot_seconds: float = 45.0,
+        tail_seconds: Optional[float] = None,
+        start: datetime = DEFAULT_START,
+    ):
+        self.trace = sorted(trace, key=lambda job: job.arrival)
+        self.boot_seconds = boot_seconds
+        self.start = start
+        last = max((job.arrival + job.duration for job in self.trace), default=0.0)
+        tail = tail_seconds if tail_seconds is not None else settings.idle_timeout * 2
+        self.end = last + tail
+
+        self.now = 0.0
+        self.queue: Deque[SimJob] = deque()
+        self.runners: List[SimRunner] = []
+        self.jobs: List[SimJob] = []
+        self.last_scale_action: Optional[Dict[str, Any]] = None
+        self.removed = 0
+        self.reaped = 0
+        self.ticks = 0
+        self.peak = 0
+        self.reasons: Counter = Counter()
+        self._events: List[Tuple[float, int, str, Any]] = []
+        self._seq = 0
+
+        self.reconciler = Reconciler(
+            SimGitHubClient(self),
+            SimDockerClient(self),
+            forecaster=(
+                DemandForecaster() if uses_forecast() else None
+            ),
+            clock=lambda: self.at(self.now),
+        )
+
+    def at(self, offset: float) -> datetime:
+        """Virtual wall-clock time ``offset`` seconds into the run."""
+        return self.start + timedelta(seconds=offset)
+
+    def live_runners(self) -> List[SimRunner]:
+        return [r for r in self.runners if r.removed is None]
+
+    def _schedule(self, when: float, kind: str, payload: Any = None) -> None:
+        self._seq += 1
+        heapq.heappush(self._events, (when, self._seq, kind, payload))
+
+    def _dispatch(self) -> None:
+        """Start queued jobs on idle online runners."""
+        for runner in self.live_runners():
+            if not self.queue:
+                return
+            if runner.online and runner.job is None:
+                job = self.queue.popleft()
+                job.started = self.now
+                runner.job = job
+                self._schedule(self.now + job.duration, "finish", runner)
+
+    async def run(self) -> SimulationReport:
+        """Replay the whole trace and return the report."""
+        for item in self.trace:
+            self._schedule(item.arrival, "arrive", item)
+        tick = 0.0
+        while tick <= self.end:
+            self._schedule(tick, "tick")
+            tick += settings.poll_interval
+
+        while self._events:
+            self.now, _, kind, payload = heapq.heappop(self._events)
+            if kind == "arrive":
+                job = SimJob(payload.arrival, payload.duration)
+                self.jobs.append(job)
+                self.queue.append(job)
+            elif kind == "finish":
+                payload.job = None
+            elif kind == "online":
+                if payload.removed is None:
+                    payload.online = True
+            elif kind == "tick":
+                await self._reconcile()
+            self._dispatch()
+
+        return self._report()
+
+    async def _reconcile(self) -> None:
+        snapshot = await self.reconciler.snapshot()
+        plan = self.reconciler.plan(snapshot, self.last_scale_action)
+        self.ticks += 1
+        self.reasons[plan.reason] += 1
+        self._apply(plan)
+        self.peak = max(self.peak, len(self.live_runners()))
+
+    def _apply(self, plan: ReconcilePlan) -> None:
+        by_id = {r.container_id: r for r in self.live_runners()}
+        for container in plan.reap:
+            runner = by_id.get(container["id"])
+            if runner is not None:
+                self._retire(runner)
+                self.reaped += 1
+
+        for removal in plan.remove:
+            runner = by_id.get(removal.container["id"])
+            # GitHub refuses to delete a busy runner, which aborts the removal
+            if runner is None or runner.job is not None:
+                continue
+            self._retire(runner)
+            self.removed += 1
+
+        for _ in range(plan.create):
+            index = len(self.runners) + 1
+            runner = SimRunner(
+                name=f"sim-{index}",
+                container_id=f"container-{index}",
+                created=self.now,
+                online_at=self.now + self.boot_seconds,
+            )
+            self.runners.append(runner)
+            self._schedule(runner.online_at, "online", runner)
+
+        if plan.create:
+            # Mirrors RunnerOrchestrator._scale_up: topping up skips the cooldown
+            self.last_scale_action = {
+                "action": (
+                    "scale_to_minimum" if plan.reason == "below_minimum" else "scale_up"
+                ),
+                "timestamp": self.at(self.now).isoformat(),
+            }
+        elif plan.remove:
+            self.last_scale_action = {
+                "action": "scale_down",
+                "timestamp": self.at(self.now).isoformat(),
+            }
+
+    def _retire(self, runner: SimRunner) -> None:
+        runner.removed = self.now
+        runner.online = False
+        if runner.job is not None:
+            # A reaped container loses its job; GitHub requeues it
+            self.queue.appendleft(runner.job)
+            runner.job.started = None
+            runner.job = None
+
+    def _report(self) -> SimulationReport:
+        waits = [j.started - j.arrival for j in self.jobs if j.started is not None]
+        runner_seconds = sum(
+            (r.removed if r.removed is not None else self.end) - r.created
+            for r in self.runners
+        )
+        busy_seconds = sum(j.duration for j in self.jobs if j.started is not None)
+        return SimulationReport(
+            jobs=len(self.trace),
+            completed=len(waits),
+            wait_p50=percentile(waits, 50),
+            wait_p90=percentile(waits, 90),
+            wait_p99=percentile(waits, 99),
+            wait_max=max(waits, default=0.0),
+            wait_mean=sum(waits) / len(waits) if waits else 0.0,
+            runner_minutes=runner_seconds / 60,
+            busy_minutes=busy_seconds / 60,
+            runners_created=len(self.runners),
+            runners_removed=self.removed,
+            runners_reaped=self.reaped,
+            peak_runners=self.peak,
+            ticks=self.ticks,
+            reasons=dict(self.reasons),
+        )
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    if not value:
+        return None
+    return datetime.fromisoformat(str(value).replace("Z", "+00:00"))
+
+
+def _trace_row(row: Dict[str, Any]) -> Tuple[Any, float]:
+    """(arrival, duration) from a trace row.
+
+    Rows either carry ``arrival``/``duration`` seconds or are GitHub job
+    objects with ``created_at``, ``started_at`` and ``completed_at``.
+    """
+    if "created_at" in row:
+        started = _parse_time(row.get("started_at"))
+        completed = _parse_time(row.get("completed_at"))
+        duration = (
+            (completed - started).total_seconds() if started and completed else 0.0
+        )
+        return _parse_time(row["created_at"]), duration
+    return float(row["arrival"]), float(row["duration"])
+
+
+def load_trace(path: str) -> Tuple[List[TraceJob], Optional[datetime]]:
+    """Load a JSON-lines or CSV trace.
+
+    Returns:
+        Jobs relative to the earliest arrival, and that arrival's wall-clock
+        time if the trace carried timestamps
+    """
+    with open(path, newline="") as f:
+        if path.endswith(".csv"):
+            rows: List[Dict[str, Any]] = list(csv.DictReader(f))
+        else:
+            rows = [json.loads(line) for line in f if line.strip()]
+
+    parsed = [_trace_row(row) for row in rows]
+    if not parsed:
+        return [], None
+    if isinstance(parsed[0][0], datetime):
+        origin = min(arrival for arrival, _ in parsed)
+        jobs = [
+            TraceJob((arrival - origin).total_seconds(), duration)
+            for arrival, duration in parsed
+        ]
+        return jobs, origin
+    origin_offset = min(arrival for arrival, _ in parsed)
+    return [TraceJob(a - origin_offset, d) for a, d in parsed], None
+
+
+def synthetic_trace(
+    hours: float,
+    jobs_per_hour: float,
+    mean_duration: float = 600.0,
+    working_hours_factor: float = 4.0,
+    seed: int = 0,
+    start: datetime = DEFAULT_START,
+) -> List[TraceJob]:
+    """Poisson job arrivals, ``working_hours_factor`` times denser 9-17 on weekdays.
+
+    Job durations are exponentially distributed around ``mean_duration``.
+    """
+    rng = random.Random(seed)
+    jobs: List[TraceJob] = []
+    peak_rate = jobs_per_hour * max(1.0, working_hours_factor) / 3600
+    t = 0.0
+    # Thinning: draw at the peak rate and keep arrivals in proportion
+    while True:
+        t += rng.expovariate(peak_rate)
+        if t >= hours * 3600:
+            return jobs
+        moment = start + timedelta(seconds=t)
+        busy = moment.weekday() < 5 and 9 <= moment.hour < 17
+        rate = jobs_per_hour * (working_hours_factor if busy else 1.0) / 3600
+        if rng.random() < rate / peak_rate:
+            jobs.append(TraceJob(t, rng.expovariate(1 / mean_duration)))
+
+
+@contextmanager
+def overridden_settings(overrides: Dict[str, Any]) -> Iterator[None]:
+    """Temporarily apply setting overrides, coercing strings to the field type."""
+    saved = {}
+    try:
+        for key, value in overrides.items():
+            if key not in type(settings).model_fields:
+                raise ValueError(f"Unknown setting: {key}")
+            current = getattr(settings, key)
+            if isinstance(value, str) and not isinstance(current, str):
+                if isinstance(current, bool):
+                    value = value.lower() in ("1", "true", "yes", "on")
+                elif current is not None:
+                    value = type(current)(value)
+            saved[key] = current
+            setattr(settings, key, value)
+        yield
+    finally:
+        for key, value in saved.items():
+            setattr(settings, key, value)
+
+
+def simulate(
+    trace: List[TraceJob],
+    overrides: Optional[Dict[str, Any]] = None,
+    boot_seconds: float = 45.0,
+    tail_seconds: Optional[float] = None,
+    start: datetime = DEFAULT_START,
+) -> SimulationReport:
+    """Run one simulation with ``overrides`` applied to the settings.
+
+    Args:
+        trace: Jobs to replay
+        overrides: Setting names and values to use for this run only
+        boot_seconds: Time from container creation until the runner is online
+        tail_seconds: Simulated time after the last job (default 2 x idle_timeout)
+        start: Virtual wall-clock time of the trace start
+
+    Returns:
+        The aggregated report
+    """
+    with overridden_settings(overrides or {}):
+        sim = Simulation(trace, boot_seconds, tail_seconds, start)
+        return asyncio.run(sim.run())
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(
+        prog="python -m src.simulator",
+        description="Replay a job trace against the scaling logic offline.",
+    )
+    source = parser.add_mutually_exclusive_group(required=True)
+    source.add_argument("--trace", help="JSON-lines or CSV job trace")
+    source.add_argument(
+        "--synthetic-hours", type=float, help="Generate a synthetic trace of this length"
+    )
+    parser.add_argument("--rate", type=float, default=20.0, help="Off-peak jobs per hour")
+    parser.add_argument(
+        "--peak-factor", type=float, default=4.0, help="Working-hours rate multiplier"
+    )
+    parser.add_argument(
+        "--duration", type=float, default=600.0, help="Mean job duration in seconds"
+    )
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument(
+        "--boot", type=float, default=45.0, help="Seconds until a new runner is online"
+    )
+    parser.add_argument("--tail", type=float, help="Seconds simulated after the last job")
+    parser.add_argument(
+        "--set",
+        action="append",
+        default=[],
+        metavar="KEY=VALUE",
+        help="Override a setting, e.g. --set scale_up_threshold=2 (repeatable)",
+    )
+    args = parser.parse_args(argv)
+
+    # Keep stdout for the report; only warnings go to stderr
+    logging.basicConfig(format="%(message)s", stream=sys.stderr, level=logging.WARNING)
+    setup_logging("WARNING", structured=False)
+
+    overrides = {}
+    for item in args.set:
+        key, sep, value = item.partition("=")
+        if not sep:
+            parser.error(f"--set expects KEY=VALUE, got {item!r}")
+        overrides[key.strip().lower()] = value
+
+    start = DEFAULT_START
+    if args.trace:
+        trace, origin = load_trace(args.trace)
+        start = origin or start
+    else:
+        trace = synthetic_trace(
+            args.synthetic_hours,
+            args.rate,
+            mean_duration=args.duration,
+            working_hours_factor=args.peak_factor,
+            seed=args.seed,
+        )
+    if not trace:
+        parser.error("trace contains no jobs")
+
+    try:
+        report = simulate(trace, overrides, args.boot, args.tail, start)
+    except ValueError as e:
+        parser.error(str(e))
+    json.dump(report.to_dict(), sys.stdout, indent=2)
+    sys.stdout.write("\n")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Conditional-request (ETag / Last-Modified) response cache."""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+CacheKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+@dataclass
+class CachedResponse:
+    """Validators and parsed body of a previously fetched response."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    body: Any
+    # Pagination links (rel -> URL), so a 304 still knows the page count
+    links: Dict[str, str] = field(default_factory=dict)
+
+
+class ConditionalRequestCache:
+    """LRU cache of parsed JSON bodies keyed by URL and query parameters.
+
+    Callers send the stored validators as ``If-None-Match`` /
+    ``If-Modified-Since`` and reuse the cached body when the server answers
+    ``304 Not Modified``. GitHub does not count 304s against the primary
+    rate limit.
+    """
+
+    def __init__(self, max_entries: int = 256):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[CacheKey, CachedResponse]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(url: str, params: Optional[Mapping[str, Any]] = None) -> CacheKey:
+        """Build a cache key that is independent of parameter ordering."""
+        items = tuple(sorted((str(k), str(v)) for k, v in (params or {}).items()))
+        return url, items
+
+    def get(self, key: CacheKey) -> Optional[CachedResponse]:
+        """Return the cached entry for ``key`` and mark it recently used."""
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def conditional_headers(self, key: CacheKey) -> Dict[str, str]:
+        """Return the validator headers to send for ``key`` (may be empty)."""
+        entry = self.get(key)
+        if entry is None:
+            return {}
+        headers = {}
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+    def store(
+        self,
+        key: CacheKey,
+        body: Any,
+        etag: Optional[str],
+        last_modified: Optional[str],
+        links: Optional[Dict[str, str]] = None,
+    ) -> None:
+        """Store a fresh response; responses without validators are not cached."""
+        if not etag and not last_modified:
+            self._entries.pop(key, None)
+            return
+        self._entries[key] = CachedResponse(
+            etag=etag, last_modified=last_modified, body=body, links=links or {}
+        )
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Return hit (304 Not Modified) and miss (full response) counters."""
+        return {"entries": len(self._entries), "hits": self.hits, "misses": self.misses}
@@ -0,0 +1,62 @@
+"""Run short-lived helper containers to completion."""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Tuple
+
+from docker.errors import APIError, NotFound as DockerNotFound
+
+# Seconds between status polls of a running helper container
+POLL_SECONDS = 5.0
+
+
+async def run_oneshot(
+    client, run: Callable[..., Awaitable[Any]], timeout: float, **config: Any
+) -> Tuple[int, str]:
+    """Start a detached container, wait for it to exit and remove it.
+
+    The container is polled rather than waited on so a long-running helper
+    doesn't hold a Docker executor thread for its whole duration.
+
+    Args:
+        client: docker-py client
+        run: Runs a blocking docker-py call off the event loop
+        timeout: Seconds before the container is killed
+        **config: ``containers.run`` arguments
+
+    Returns:
+        The exit code and the last lines of the container's output
+
+    Raises:
+        RuntimeError: The container was still running after ``timeout``
+    """
+    container = await run(client.containers.run, detach=True, **config)
+    try:
+        deadline = time.monotonic() + timeout
+        while True:
+            await run(container.reload)
+            if container.status in ("exited", "dead"):
+                break
+            if time.monotonic() >= deadline:
+                raise RuntimeError(f"{container.name} timed out after {timeout:.0f}s")
+            await asyncio.sleep(POLL_SECONDS)
+        status = int(container.attrs["State"].get("ExitCode", 1))
+        logs = await run(container.logs, tail=20)
+        return status, logs.decode(errors="replace").strip()
+    finally:
+        try:
+            await run(container.remove, force=True)
+        except (DockerNotFound, APIError, asyncio.TimeoutError):
+            pass
+
+
+async def remove_stale(client, run: Callable[..., Awaitable[Any]], label: str) -> int:
+    """Remove helper containers labelled ``label`` left by an earlier process.
+
+    Returns:
+        Number of containers removed
+    """
+    stale = await run(client.containers.list, all=True, filters={"label": label})
+    for container in stale:
+        await run(container.remove, force=True)
+    return len(stale)
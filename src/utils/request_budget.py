@@ -0,0 +1,25 @@
+"""Per-cycle cap on GitHub API requests spent on fan-out queries."""
+
+from typing import Optional
+
+
+class RequestBudget:
+    """Counts requests spent during one demand cycle.
+
+    A ``limit`` of ``None`` (or ``0``) means unlimited. Callers ask
+    :meth:`try_spend` before each request (every page of a listing) and skip
+    the request when the budget is exhausted.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        self.limit = limit or None
+        self.spent = 0
+        self.denied = 0
+
+    def try_spend(self, cost: int = 1) -> bool:
+        """Reserve ``cost`` requests; return False if that would exceed the limit."""
+        if self.limit is not None and self.spent + cost > self.limit:
+            self.denied += cost
+            return False
+        self.spent += cost
+        return True
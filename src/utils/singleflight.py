@@ -0,0 +1,64 @@
+"""Single-flight coalescing of concurrent async reads."""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Share one in-flight call (and its recent result) between callers.
+
+    Concurrent callers of :meth:`do` with the same key await the same
+    underlying task instead of issuing duplicate requests. A successful
+    result is additionally reused for ``ttl`` seconds; failures are never
+    cached so the next caller retries immediately.
+    """
+
+    def __init__(self, ttl: float = 0.0):
+        self.ttl = ttl
+        self._inflight: Dict[Hashable, "asyncio.Task[Any]"] = {}
+        self._results: Dict[Hashable, Tuple[float, Any]] = {}
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Return ``fn()``'s result, sharing it with concurrent callers of ``key``."""
+        loop = asyncio.get_running_loop()
+
+        cached = self._results.get(key)
+        if cached is not None:
+            expires_at, value = cached
+            if loop.time() < expires_at:
+                return value
+            del self._results[key]
+
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._on_done(k, t))
+
+        # Shield so a cancelled waiter does not cancel the shared call
+        return await asyncio.shield(task)
+
+    def _on_done(self, key: Hashable, task: "asyncio.Task[Any]") -> None:
+        """Store a finished call's result unless it was forgotten meanwhile."""
+        if self._inflight.get(key) is not task:
+            return
+        del self._inflight[key]
+        if task.cancelled() or task.exception() is not None or self.ttl <= 0:
+            return
+        expires_at = asyncio.get_running_loop().time() + self.ttl
+        self._results[key] = (expires_at, task.result())
+
+    def forget(self, key: Optional[Hashable] = None) -> None:
+        """Invalidate ``key`` (or everything) after a state-changing operation.
+
+        Calls already in flight keep running for their current waiters, but
+        later callers start a fresh call.
+        """
+        if key is None:
+            self._inflight.clear()
+            self._results.clear()
+            return
+        self._inflight.pop(key, None)
+        self._results.pop(key, None)
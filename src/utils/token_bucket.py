@@ -0,0 +1,38 @@
+"""Async token-bucket rate limiter."""
+
+import asyncio
+import time
+
+
+class TokenBucket:
+    """Allow ``rate`` operations per second with bursts of up to ``capacity``.
+
+    :meth:`acquire` waits until a token is available. A non-positive
+    ``rate`` disables limiting.
+    """
+
+    def __init__(self, rate: float, capacity: int = 1):
+        self.rate = rate
+        self.capacity = max(1, capacity)
+        self._tokens = float(self.capacity)
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+
+    async def acquire(self) -> None:
+        """Take one token, waiting for the bucket to refill if it is empty."""
+        if self.rate <= 0:
+            return
+        # Serialize waiters so tokens are handed out in arrival order
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
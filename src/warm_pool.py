@@ -0,0 +1,169 @@
+"""Warm pool of pre-started standby runner containers."""
+
+import asyncio
+import uuid
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import structlog
+
+from .reconciler import ACTIVE_STATUSES, DEAD_STATUSES
+
+logger = structlog.get_logger()
+
+# Label value marking containers created for the warm pool
+WARM_POOL_LABEL = "warm"
+
+
+class WarmPool:
+    """Keeps ``size`` booted containers waiting for a registration.
+
+    Standby containers start dockerd and then block until a binding file
+    (registration token or JIT config) is written into them, so binding a
+    standby container skips image start and dockerd boot entirely.
+
+    Docker labels are immutable, so which warm containers have been bound is
+    tracked in memory. After a restart, bound containers are re-learned from
+    GitHub: a warm container whose runner name is registered is bound.
+    """
+
+    def __init__(self, docker_client, github_client, size: int, max_runners: int):
+        self.docker_client = docker_client
+        self.github_client = github_client
+        self.size = size
+        self.max_runners = max_runners
+        # Container id -> time it was bound to a registration
+        self._bound: Dict[str, datetime] = {}
+        # Container id -> GitHub runner id of a JIT binding (labels can't carry it)
+        self._runner_ids: Dict[str, int] = {}
+        self._lock = asyncio.Lock()
+        self._refill_task: Optional["asyncio.Task[None]"] = None
+        self.total_bound = 0
+
+    @staticmethod
+    def is_warm(runner: Dict[str, Any]) -> bool:
+        """True if the container was created for the warm pool."""
+        return runner.get("pool") == WARM_POOL_LABEL
+
+    def is_standby(self, runner: Dict[str, Any]) -> bool:
+        """True for a warm container still waiting to be bound."""
+        return self.is_warm(runner) and runner["id"] not in self._bound
+
+    def split(
+        self, runners: Iterable[Dict[str, Any]]
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """Split a container listing into (regular or bound, standby)."""
+        regular, standby = [], []
+        for runner in runners:
+            (standby if self.is_standby(runner) else regular).append(runner)
+        return regular, standby
+
+    def bound_at(self, container_id: str) -> Optional[datetime]:
+        """When a warm container was bound, or None."""
+        return self._bound.get(container_id)
+
+    def adopt_registered(
+        self, runners: Iterable[Dict[str, Any]], registered_names: Iterable[str]
+    ) -> None:
+        """Mark warm containers whose runner is registered with GitHub as bound."""
+        names = set(registered_names)
+        for runner in runners:
+            if self.is_standby(runner) and runner["runner_name"] in names:
+                self._bound[runner["id"]] = datetime.now(timezone.utc)
+
+    async def acquire(self) -> Optional[Dict[str, Any]]:
+        """Claim the oldest running standby container, or None if the pool is empty."""
+        async with self._lock:
+            runners = await self.docker_client.get_runners()
+            standby = [
+                r for r in runners if self.is_standby(r) and r["status"] == "running"
+            ]
+            if not standby:
+                return None
+            standby.sort(key=lambda r: r.get("created_at") or "")
+            runner = standby[0]
+            # Claim before releasing the lock so concurrent creates pick others
+            self._bound[runner["id"]] = datetime.now(timezone.utc)
+            self.total_bound += 1
+            return runner
+
+    def runner_id(self, container_id: str) -> Optional[int]:
+        """GitHub runner id a warm container was JIT-bound to, if any."""
+        return self._runner_ids.get(container_id)
+
+    async def bind(
+        self,
+        runner: Dict[str, Any],
+        environment: Dict[str, str],
+        runner_id: Optional[int] = None,
+    ) -> None:
+        """Deliver a registration to a claimed standby container."""
+        await self.docker_client.bind_runner(runner["id"], environment)
+        if runner_id is not None:
+            self._runner_ids[runner["id"]] = runner_id
+        logger.info(
+            "Bound warm runner",
+            runner_name=runner["runner_name"],
+            container_id=runner["id"],
+        )
+        self.request_refill()
+
+    def forget(self, container_id: str) -> None:
+        """Drop tracking for a removed container."""
+        self._bound.pop(container_id, None)
+        self._runner_ids.pop(container_id, None)
+
+    def request_refill(self) -> None:
+        """Top the pool up in the background (one refill at a time)."""
+        if self.size <= 0:
+            return
+        if self._refill_task is not None and not self._refill_task.done():
+            return
+        self._refill_task = asyncio.ensure_future(self._refill())
+
+    async def _refill(self) -> None:
+        """Remove dead standby containers and create new ones up to ``size``."""
+        try:
+            runners = await self.docker_client.get_runners()
+            live_ids = {r["id"] for r in runners}
+            for container_id in [c for c in self._bound if c not in live_ids]:
+                self.forget(container_id)
+
+            _, standby = self.split(runners)
+            await self.docker_client.remove_runners(
+                (r["id"] for r in standby if r["status"] in DEAD_STATUSES), force=True
+            )
+
+            ready = [r for r in standby if r["status"] in ACTIVE_STATUSES]
+            occupied = len([r for r in runners if r["status"] in ACTIVE_STATUSES])
+            # Standby containers use host capacity like any other runner
+            missing = min(self.size - len(ready), self.max_runners - occupied)
+            if missing <= 0:
+                return
+
+            logger.info("Refilling warm pool", creating=missing, ready=len(ready))
+            repo_url = await self.github_client.get_runner_url()
+            for _ in range(missing):
+                await self.docker_client.create_runner(
+                    runner_name=f"orchestrated-{uuid.uuid4().hex[:8]}",
+                    repo_url=repo_url,
+                    warm=True,
+                )
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error("Failed to refill warm pool", error=str(e))
+
+    async def close(self) -> None:
+        """Stop a running refill."""
+        if self._refill_task is not None:
+            self._refill_task.cancel()
+            await asyncio.gather(self._refill_task, return_exceptions=True)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool counters for status reporting."""
+        return {
+            "size": self.size,
+            "bound": len(self._bound),
+            "total_bound": self.total_bound,
+        }
@@ -0,0 +1,211 @@
+"""Pool of recycled runner work volumes."""
+
+import asyncio
+import uuid
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Set
+
+from docker.errors import APIError
+import structlog
+
+from .config import settings
+from .utils.oneshot import remove_stale, run_oneshot
+
+logger = structlog.get_logger()
+
+# Volume label marking pooled work volumes (and, with value "scrubber", the
+# helper container that resets them)
+WORK_POOL_LABEL = "work-pool"
+# Runner directory the work volume is mounted at
+WORK_DIR = "/actions-runner/_work"
+SCRUB_SCRIPT = "/usr/local/bin/scrub-work-volume.sh"
+# Volumes reset by one scrubber container
+SCRUB_BATCH = 8
+
+
+class WorkVolumePool:
+    """Recycles ``/actions-runner/_work`` volumes between runners.
+
+    A removed runner's volume is returned dirty instead of deleted; a
+    background scrubber container deletes everything in it except the
+    ``work_volume_pool_preserve`` paths (by default the checkouts' ``.git``
+    directories and downloaded actions) and hands it back out clean. A new
+    runner therefore skips the volume create/remove round trip and its
+    ``actions/checkout`` becomes an incremental fetch.
+
+    At most ``work_volume_pool_size`` idle volumes are kept; beyond that
+    released volumes are deleted. Idle volumes are found again after a
+    restart by their label and treated as dirty.
+    """
+
+    def __init__(self, client, run: Callable[..., Awaitable[Any]]):
+        self.client = client
+        # Runs a blocking docker-py call off the event loop (DockerClient._run)
+        self._run = run
+        self.prefix = settings.runner_name_prefix
+        self._lock = asyncio.Lock()
+        self._clean: List[str] = []
+        self._dirty: List[str] = []
+        # Volumes taken by the scrubber right now
+        self._scrubbing: Set[str] = set()
+        self._loaded = False
+        self._wake = asyncio.Event()
+        self.hits = 0
+        self.misses = 0
+        self.scrubbed = 0
+        self.discarded = 0
+
+    @property
+    def size(self) -> int:
+        return settings.work_volume_pool_size
+
+    def owns(self, volume_name: Optional[str]) -> bool:
+        """True for a volume handed out by this pool."""
+        return bool(volume_name) and volume_name.startswith(f"{self.prefix}-work-pool-")
+
+    async def acquire(self, runner_name: str) -> str:
+        """Return a clean pooled volume, creating one if none is ready."""
+        async with self._lock:
+            await self._ensure_loaded()
+            if self._clean:
+                self.hits += 1
+                name = self._clean.pop()
+                logger.debug("Reusing pooled work volume", volume=name, runner=runner_name)
+                return name
+            self.misses += 1
+
+        name = f"{self.prefix}-work-pool-{uuid.uuid4().hex[:12]}"
+        await self._run(
+            self.client.api.create_volume,
+            name=name,
+            labels={"managed-by": "runner-orchestrator", WORK_POOL_LABEL: "true"},
+        )
+        logger.debug("Created pooled work volume", volume=name, runner=runner_name)
+        return name
+
+    async def release(self, name: str) -> None:
+        """Take back a volume whose container is gone, or delete it if the pool is full."""
+        async with self._lock:
+            idle = len(self._clean) + len(self._dirty) + len(self._scrubbing)
+            if idle < self.size:
+                self._dirty.append(name)
+                self._wake.set()
+                return
+        await self._discard([name])
+
+    async def run_scrubber(self) -> None:
+        """Scrub dirty volumes whenever some are released."""
+        async with self._lock:
+            await self._ensure_loaded()
+        while True:
+            await self._wake.wait()
+            self._wake.clear()
+            while self._dirty:
+                async with self._lock:
+                    batch = self._dirty[:SCRUB_BATCH]
+                    del self._dirty[:SCRUB_BATCH]
+                    self._scrubbing.update(batch)
+                try:
+                    ok = await self._scrub(batch)
+                except Exception as e:
+                    # One bad batch must not stop the scrubber for good
+                    logger.error(
+                        "Unexpected error scrubbing work volumes", volumes=batch, error=str(e)
+                    )
+                    ok = False
+                finally:
+                    self._scrubbing.difference_update(batch)
+                if ok:
+                    async with self._lock:
+                        self._clean.extend(batch)
+                    self.scrubbed += len(batch)
+                else:
+                    # Don't hand out a volume in an unknown state
+                    await self._discard(batch)
+
+    async def _scrub(self, names: List[str]) -> bool:
+        """Reset ``names`` in one scrubber container; True on success."""
+        try:
+            await remove_stale(self.client, self._run, f"{WORK_POOL_LABEL}=scrubber")
+            mounts = [f"/scrub/{i}" for i in range(len(names))]
+            status, logs = await run_oneshot(
+                self.client,
+                self._run,
+                settings.work_volume_scrub_timeout,
+                image=settings.runner_image,
+                name=f"{self.prefix}-work-scrubber-{uuid.uuid4().hex[:8]}",
+                entrypoint=[SCRUB_SCRIPT],
+                command=mounts,
+                environment={"PRESERVE": settings.work_volume_pool_preserve},
+                volumes={
+                    name: {"bind": mount, "mode": "rw"}
+                    for name, mount in zip(names, mounts)
+                },
+                network_disabled=True,
+                labels={WORK_POOL_LABEL: "scrubber"},
+            )
+        except (APIError, RuntimeError, asyncio.TimeoutError) as e:
+            logger.warning("Work volume scrub failed", volumes=names, error=str(e))
+            return False
+        if status != 0:
+            logger.warning(
+                "Work volume scrub failed", volumes=names, status=status, output=logs
+            )
+            return False
+        logger.info("Scrubbed pooled work volumes", volumes=len(names))
+        return True
+
+    async def _ensure_loaded(self) -> None:
+        """Adopt idle pooled volumes left by an earlier run (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            volumes = await self._run(
+                self.client.api.volumes, filters={"label": f"{WORK_POOL_LABEL}=true"}
+            )
+            containers = await self._run(
+                self.client.api.containers,
+                all=True,
+                filters={"label": "managed-by=runner-orchestrator"},
+            )
+        except (APIError, asyncio.TimeoutError) as e:
+            logger.warning("Could not load pooled work volumes", error=str(e))
+            return
+
+        mounted = {
+            mount.get("Name")
+            for summary in containers
+            for mount in summary.get("Mounts") or []
+        }
+        idle = [
+            v["Name"]
+            for v in (volumes or {}).get("Volumes") or []
+            if v["Name"] not in mounted
+        ]
+        keep, extra = idle[: self.size], idle[self.size :]
+        self._dirty.extend(keep)
+        if keep:
+            self._wake.set()
+        await self._discard(extra)
+        logger.info("Loaded pooled work volumes", idle=len(keep), discarded=len(extra))
+
+    async def _discard(self, names: List[str]) -> None:
+        for name in names:
+            try:
+                await self._run(self.client.api.remove_volume, name)
+                self.discarded += 1
+            except Exception as e:
+                # Best effort: leftovers are re-scrubbed or removed on the next start
+                logger.warning("Failed to remove pooled work volume", volume=name, error=str(e))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool usage for status reporting."""
+        return {
+            "size": self.size,
+            "clean": len(self._clean),
+            "dirty": len(self._dirty) + len(self._scrubbing),
+            "hits": self.hits,
+            "misses": self.misses,
+            "scrubbed": self.scrubbed,
+            "discarded": self.discarded,
+        }